@@ -0,0 +1,64 @@
+"""Benchmark cold loads of several schema versions.
+
+Serves the schemas in schema_cache from a local HTTP server that waits before
+answering each schema request, like a remote server would, and compares
+loading every version one after another with OcsfServerClient against loading
+them concurrently with AsyncOcsfServerClient. Nothing is cached between runs.
+
+Usage:
+
+    $ poetry run python benchmarks/async_client.py
+
+"""
+
+import asyncio
+import threading
+import time
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from ocsf_tools.schema import AsyncOcsfServerClient, OcsfServerClient
+from util import VERSIONS, cached_file, header, measure, report
+
+# Seconds the server waits before answering each schema request.
+LATENCY = {"1.0.0": 0.2, "1.1.0": 0.3, "1.2.0": 0.4}
+
+BODIES = {f"/{v}/export/schema": cached_file(v).read_bytes() for v in VERSIONS}
+BODIES["/api/versions"] = (
+    '{"default": {"url": "/", "version": "%s"}, "versions": [%s]}'
+    % (VERSIONS[-1], ", ".join(f'{{"url": "/{v}/", "version": "{v}"}}' for v in VERSIONS))
+).encode()
+
+
+class Handler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        time.sleep(LATENCY.get(self.path.split("/")[1], 0))
+        body = BODIES[self.path]
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: object) -> None:
+        pass
+
+
+server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+threading.Thread(target=server.serve_forever, daemon=True).start()
+url = f"http://127.0.0.1:{server.server_address[1]}/"
+
+
+def serial() -> None:
+    client = OcsfServerClient(url)
+    for version in VERSIONS:
+        client.get_schema(version)
+
+
+def concurrent() -> None:
+    asyncio.run(AsyncOcsfServerClient(url).get_schemas(VERSIONS))
+
+
+print(f"Slowest download: {max(LATENCY.values()) * 1000:.0f} ms of latency, {len(VERSIONS)} versions")
+header("serial", "async")
+report("cold load", measure(serial), measure(concurrent))
+server.shutdown()
@@ -0,0 +1,82 @@
+"""Benchmark comparing schemas.
+
+Compares each pair of consecutive cached versions with the original reflective
+implementation of compare(), which inspected the type hints of every model it
+visited, and with the current implementation, without and with precomputed
+fingerprints.
+
+Usage:
+
+    $ poetry run python benchmarks/compare.py
+
+"""
+
+from typing import Any, get_args, get_origin, get_type_hints
+
+from ocsf_tools.compare import Addition, Change, Difference, NoChange, Removal, compare
+from ocsf_tools.compare.compare import is_optional_dict
+from ocsf_tools.compare.factory import create_diff
+from ocsf_tools.schema import OcsfModel, fingerprints, from_file, store_fingerprints
+from util import VERSIONS, cached_file, header, measure, report
+
+
+def reflective_compare_dict(old_val: Any, new_val: Any) -> Any:
+    """The original compare_dict implementation."""
+    if old_val is None and new_val is None:
+        return NoChange[Any]()
+
+    old_val = {} if old_val is None else old_val
+    new_val = {} if new_val is None else new_val
+    ret: dict[Any, Difference[Any]] = {}
+
+    for key in set(old_val.keys()) | set(new_val.keys()):
+        if key not in new_val:
+            ret[key] = Removal(before=old_val[key])
+        elif key not in old_val:
+            ret[key] = Addition(after=new_val[key])
+        elif old_val[key] == new_val[key]:
+            ret[key] = NoChange()
+        else:
+            ret[key] = reflective_compare(old_val[key], new_val[key])
+
+    return ret
+
+
+def reflective_compare(old_val: Any, new_val: Any) -> Any:
+    """The original compare implementation."""
+    if isinstance(old_val, OcsfModel) and type(old_val) is type(new_val):
+        ret = create_diff(old_val)
+
+        for attr, value in get_type_hints(old_val).items():
+            old_attr = getattr(old_val, attr)
+            new_attr = getattr(new_val, attr)
+            origin = get_origin(value)
+            args = get_args(value)
+
+            if is_optional_dict(old_attr, origin, args) and is_optional_dict(new_attr, origin, args):
+                setattr(ret, attr, reflective_compare_dict(old_attr, new_attr))
+            else:
+                setattr(ret, attr, reflective_compare(old_attr, new_attr))
+
+        return ret
+
+    elif old_val == new_val:
+        return NoChange[Any]()
+
+    else:
+        return Change(before=old_val, after=new_val)
+
+
+if __name__ == "__main__":
+    header("reflection", "plans")
+    for old_version, new_version in zip(VERSIONS, VERSIONS[1:]):
+        old = from_file(str(cached_file(old_version)))
+        new = from_file(str(cached_file(new_version)))
+        assert reflective_compare(old, new) == compare(old, new)
+
+        baseline = measure(lambda: reflective_compare(old, new))
+        report(f"{old_version} -> {new_version}", baseline, measure(lambda: compare(old, new)))
+
+        store_fingerprints(fingerprints(old))
+        store_fingerprints(fingerprints(new))
+        report("  with fingerprints", baseline, measure(lambda: compare(old, new, trust_fingerprints=True)))
@@ -0,0 +1,33 @@
+"""Benchmark compressed schema files: size, cold loads, and warm loads from snapshots.
+
+Usage:
+
+    $ poetry run python benchmarks/compression.py
+
+"""
+
+import os
+import tempfile
+
+from ocsf_tools.schema import from_file, from_file_snapshot, to_file
+from ocsf_tools.schema.compression import available_compressions, extension
+from util import VERSIONS, cached_file, measure
+
+
+if __name__ == "__main__":
+    print(f"{'':<16} {'size':>10} {'write':>10} {'cold load':>10} {'warm load':>10}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for version in VERSIONS:
+            schema = from_file(str(cached_file(version)))
+            for compression in [None] + available_compressions():
+                path = os.path.join(tmp, f"schema-{version}.json{extension(compression)}")
+                write = measure(lambda: to_file(schema, path))
+                cold = measure(lambda: from_file(path))
+                from_file_snapshot(path)
+                warm = measure(lambda: from_file_snapshot(path))
+
+                label = f"{version} {compression or 'none'}"
+                size = os.path.getsize(path) / 1024
+                print(
+                    f"{label:<16} {size:>7.0f} KB {write * 1000:>7.1f} ms {cold * 1000:>7.1f} ms {warm * 1000:>7.1f} ms"
+                )
@@ -0,0 +1,94 @@
+"""Benchmark fetching schemas with urlopen and with the connection pool.
+
+Serves the schemas in schema_cache from a local HTTP/1.1 server that waits
+before accepting each new connection, like the round trips of a TCP and TLS
+handshake to a remote server, and gzip compresses responses when asked to.
+Compares fetching the versions and every schema with a new urlopen connection
+per request, as the client used to, against fetching them through
+OcsfServerClient's pool of keep-alive connections.
+
+Usage:
+
+    $ poetry run python benchmarks/connection_pool.py
+
+"""
+
+import gzip
+import threading
+import time
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urljoin
+from urllib.request import urlopen
+
+from ocsf_tools.schema import OcsfServerClient, from_stream
+from util import VERSIONS, cached_file, header, measure, report
+
+# Seconds to wait before serving a new connection.
+HANDSHAKE = 0.05
+
+BODIES = {f"/{v}/export/schema": cached_file(v).read_bytes() for v in VERSIONS}
+BODIES["/api/versions"] = (
+    '{"default": {"url": "/", "version": "%s"}, "versions": [%s]}'
+    % (VERSIONS[-1], ", ".join(f'{{"url": "/{v}/", "version": "{v}"}}' for v in VERSIONS))
+).encode()
+GZIPPED = {path: gzip.compress(body) for path, body in BODIES.items()}
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def setup(self):
+        time.sleep(HANDSHAKE)
+        super().setup()
+
+    def do_GET(self):
+        body = BODIES[self.path]
+        self.send_response(200)
+        if "gzip" in self.headers.get("Accept-Encoding", ""):
+            body = GZIPPED[self.path]
+            self.send_header("Content-Encoding", "gzip")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: object) -> None:
+        pass
+
+
+server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+threading.Thread(target=server.serve_forever, daemon=True).start()
+url = f"http://127.0.0.1:{server.server_address[1]}/"
+
+
+def with_urlopen() -> int:
+    """Fetch the versions and every schema, with a new connection per request."""
+    received = 0
+    for path in ["api/versions"] + [f"{v}/export/schema" for v in VERSIONS]:
+        with urlopen(urljoin(url, path)) as response:
+            if path == "api/versions":
+                received += len(response.read())
+            else:
+                from_stream(response)
+                received += int(response.headers["Content-Length"])
+    return received
+
+
+def with_pool() -> OcsfServerClient:
+    """Fetch the versions and every schema through one client's pool."""
+    client = OcsfServerClient(url)
+    for version in VERSIONS:
+        client.get_schema(version)
+    return client
+
+
+print(f"Versions and {len(VERSIONS)} schemas, {HANDSHAKE * 1000:.0f} ms per new connection")
+received = with_urlopen()
+stats = with_pool().pool.stats
+print(f"Bytes received: {received} with urlopen, {stats.bytes_received} with the pool")
+print(f"Connections: {len(VERSIONS) + 1} with urlopen, {stats.connections} with the pool")
+print(f"Mean latency to response headers with the pool: {stats.latency / stats.requests * 1000:.1f} ms")
+print()
+header("urlopen", "pool")
+report("fetch and parse", measure(with_urlopen), measure(with_pool))
+server.shutdown()
@@ -0,0 +1,28 @@
+"""Benchmark schema decoding: dacite versus the precompiled decoder.
+
+Usage:
+
+    $ poetry run python benchmarks/decode.py
+
+"""
+
+import json
+
+from dacite import from_dict
+
+from ocsf_tools.schema import OcsfSchema, from_json, keys_to_names
+from util import VERSIONS, cached_file, header, measure, report
+
+
+def dacite_from_json(data: str) -> OcsfSchema:
+    """The original from_json implementation."""
+    return from_dict(OcsfSchema, keys_to_names(json.loads(data)))
+
+
+if __name__ == "__main__":
+    header("dacite", "decoder")
+    for version in VERSIONS:
+        data = cached_file(version).read_text()
+        assert dacite_from_json(data) == from_json(data)
+
+        report(version, measure(lambda: dacite_from_json(data)), measure(lambda: from_json(data)))
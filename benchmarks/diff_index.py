@@ -0,0 +1,55 @@
+"""Benchmark answering questions about a comparison with and without a DiffIndex.
+
+The baseline scans a sparse comparison once per question, the way the
+compatibility rules did. The candidate builds an index and looks the answers
+up.
+
+Usage:
+
+    $ poetry run python benchmarks/diff_index.py
+
+"""
+
+from dataclasses import fields
+from typing import Any, cast
+
+from ocsf_tools.compare import Change, ChangedAttr, ChangedEvent, ChangedObject, ChangedSchema, DiffIndex, compare
+from ocsf_tools.schema import from_file
+from util import VERSIONS, cached_file, header, measure, report
+
+# Ad-hoc tooling asks about every field; the compatibility rules ask about two.
+FIELDS = [f.name for f in fields(ChangedAttr) if f.name != "enum"]
+RULE_FIELDS = ["type", "requirement"]
+
+
+def scan(diff: ChangedSchema, field: str) -> list[tuple[str, str]]:
+    found: list[tuple[str, str]] = []
+    for records in (diff.classes, diff.objects):
+        for name, record in cast(dict[str, Any], records).items():
+            if isinstance(record, (ChangedEvent, ChangedObject)):
+                for attr_name, attr in record.attributes.items():
+                    if isinstance(attr, ChangedAttr) and isinstance(getattr(attr, field), Change):
+                        found.append((name, attr_name))
+    return found
+
+
+def scans(diff: ChangedSchema, fields: list[str]) -> list[list[tuple[str, str]]]:
+    return [scan(diff, field) for field in fields]
+
+
+def lookups(diff: ChangedSchema, fields: list[str]) -> list[list[tuple[str, str]]]:
+    index = DiffIndex(diff)
+    return [[(e.name, cast(str, e.attr)) for e in index.changed_fields(field)] for field in fields]
+
+
+if __name__ == "__main__":
+    header("scans", "index")
+    for old_version, new_version in zip(VERSIONS, VERSIONS[1:]):
+        old = from_file(str(cached_file(old_version)))
+        new = from_file(str(cached_file(new_version)))
+        diff = cast(ChangedSchema, compare(old, new, sparse=True))
+        assert scans(diff, FIELDS) == lookups(diff, FIELDS)
+
+        label = f"{old_version} -> {new_version}"
+        report(f"{label} all", measure(lambda: scans(diff, FIELDS)), measure(lambda: lookups(diff, FIELDS)))
+        report(f"{label} rules", measure(lambda: scans(diff, RULE_FIELDS)), measure(lambda: lookups(diff, RULE_FIELDS)))
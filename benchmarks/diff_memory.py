@@ -0,0 +1,42 @@
+"""Measure the memory used by full schema comparisons.
+
+Reports the number of memory blocks and bytes retained by the result of
+compare(), and the peak memory allocated while building it.
+
+Usage:
+
+    $ poetry run python benchmarks/diff_memory.py
+
+"""
+
+import gc
+import sys
+import time
+import tracemalloc
+
+from ocsf_tools.compare import compare
+from ocsf_tools.schema import from_file
+from util import VERSIONS, cached_file
+
+
+if __name__ == "__main__":
+    print(f"{'':<16} {'blocks':>10} {'retained':>12} {'peak':>12} {'time':>10}")
+    for old_version, new_version in zip(VERSIONS, VERSIONS[1:]):
+        old = from_file(str(cached_file(old_version)))
+        new = from_file(str(cached_file(new_version)))
+        compare(old, new)
+
+        gc.collect()
+        blocks = sys.getallocatedblocks()
+        tracemalloc.start()
+        start = time.perf_counter()
+        diff = compare(old, new)
+        elapsed = time.perf_counter() - start
+        retained, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        gc.collect()
+        blocks = sys.getallocatedblocks() - blocks
+
+        label = f"{old_version} -> {new_version}"
+        print(f"{label:<16} {blocks:>10} {retained / 1024:>9.0f} KB {peak / 1024:>9.0f} KB {elapsed * 1000:>7.1f} ms")
+        del diff
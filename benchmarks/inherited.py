@@ -0,0 +1,52 @@
+"""Benchmark inheritance-aware schema comparisons.
+
+Compares each pair of consecutive cached versions with compare() and with
+compare_inherited(), for schemas as parsed, interned, and with fingerprints.
+
+Usage:
+
+    $ poetry run python benchmarks/inherited.py
+
+"""
+
+from typing import Any
+
+from ocsf_tools.compare import ChangedAttr, ChangedSchema, compare, compare_inherited
+from ocsf_tools.schema import fingerprints, from_file, store_fingerprints
+from util import VERSIONS, cached_file, header, measure, report
+
+
+def attr_diffs(diff: ChangedSchema) -> tuple[int, int]:
+    """The number of changed attributes in a comparison, and of distinct ChangedAttr instances."""
+    found: list[Any] = [
+        attr
+        for record in list(diff.classes.values()) + list(diff.objects.values())
+        for attr in getattr(record, "attributes", {}).values()
+        if isinstance(attr, ChangedAttr)
+    ]
+    return len(found), len({id(attr) for attr in found})
+
+
+if __name__ == "__main__":
+    header("compare", "inherited")
+    for old_version, new_version in zip(VERSIONS, VERSIONS[1:]):
+        label = f"{old_version} -> {new_version}"
+        for kind in ("parsed", "interned", "fingerprints"):
+            old = from_file(str(cached_file(old_version)), intern=kind == "interned")
+            new = from_file(str(cached_file(new_version)), intern=kind == "interned")
+            trust = kind == "fingerprints"
+            if trust:
+                store_fingerprints(fingerprints(old))
+                store_fingerprints(fingerprints(new))
+
+            diff = compare_inherited(old, new, trust_fingerprints=trust)
+            assert diff == compare(old, new)
+            baseline = measure(lambda: compare(old, new, trust_fingerprints=trust), repeat=15)
+            report(
+                f"{label} {kind}",
+                baseline,
+                measure(lambda: compare_inherited(old, new, trust_fingerprints=trust), repeat=15),
+            )
+
+        changed, distinct = attr_diffs(diff)
+        print(f"  {changed} changed attributes, {distinct} compared")
@@ -0,0 +1,41 @@
+"""Measure the memory saved by interning schemas.
+
+Usage:
+
+    $ poetry run python benchmarks/intern.py
+
+"""
+
+import time
+
+from ocsf_tools.schema import InternPool, OcsfSchema, from_file, intern_schema
+from ocsf_tools.schema.intern import footprint
+from util import VERSIONS, cached_file
+
+
+if __name__ == "__main__":
+    pool = InternPool()
+    schemas: list[OcsfSchema] = []
+    total_before = 0
+
+    print(f"{'':<24} {'before':>10} {'after':>10} {'saved':>7} {'time':>10}")
+    for version in VERSIONS:
+        schema = from_file(str(cached_file(version)))
+        start = time.perf_counter()
+        stats = intern_schema(schema, pool)
+        elapsed = time.perf_counter() - start
+
+        schemas.append(schema)
+        total_before += stats.bytes_before
+        print(
+            f"{version:<24} {stats.bytes_before / 1e6:>8.2f}MB {stats.bytes_after / 1e6:>8.2f}MB"
+            + f" {stats.saved / stats.bytes_before:>6.0%} {elapsed * 1000:>7.1f} ms"
+        )
+
+    # Instances shared between versions are counted in each version above, but
+    # only once here.
+    total_after = footprint(schemas)
+    print(
+        f"{'all, shared pool':<24} {total_before / 1e6:>8.2f}MB {total_after / 1e6:>8.2f}MB"
+        + f" {1 - total_after / total_before:>6.0%}"
+    )
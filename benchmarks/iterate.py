@@ -0,0 +1,60 @@
+"""Benchmark streaming differences against building a sparse comparison.
+
+Measures the time and peak memory to visit every difference, and the time to
+visit the differences of a single event with a prefix filter.
+
+Usage:
+
+    $ poetry run python benchmarks/iterate.py
+
+"""
+
+import tracemalloc
+
+from typing import Any, Callable
+
+from ocsf_tools.compare import ChangedModel, compare, iter_differences
+from ocsf_tools.schema import from_file
+from util import VERSIONS, cached_file, header, measure, report
+
+
+def count_leaves(diff: Any) -> int:
+    if isinstance(diff, dict):
+        return sum(count_leaves(v) for v in diff.values())  # type: ignore
+    if isinstance(diff, ChangedModel):
+        return sum(count_leaves(getattr(diff, name)) for name in diff.__dataclass_fields__)  # type: ignore
+    return 1 if diff.__class__.__name__ != "NoChange" else 0
+
+
+def peak(fn: Callable[[], Any]) -> int:
+    tracemalloc.start()
+    fn()
+    _, top = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return top
+
+
+if __name__ == "__main__":
+    header("compare", "iterate")
+    for old_version, new_version in zip(VERSIONS, VERSIONS[1:]):
+        old = from_file(str(cached_file(old_version)))
+        new = from_file(str(cached_file(new_version)))
+
+        def tree() -> int:
+            return count_leaves(compare(old, new, sparse=True))
+
+        def stream() -> int:
+            return sum(1 for _ in iter_differences(old, new))
+
+        def one_tree() -> int:
+            return count_leaves(compare(old, new, sparse=True, lazy=True).classes.get("network_activity"))  # type: ignore
+
+        def one_stream() -> int:
+            return sum(1 for _ in iter_differences(old, new, prefixes=[("classes", "network_activity")]))
+
+        assert tree() == stream()
+        assert one_tree() == one_stream()
+        label = f"{old_version} -> {new_version}"
+        report(f"{label} all", measure(tree), measure(stream))
+        report(f"{label} one", measure(one_tree), measure(one_stream))
+        print(f"{'  peak memory':<24} {peak(tree) / 1024:>10.0f} KB {peak(stream) / 1024:>10.0f} KB")
@@ -0,0 +1,30 @@
+"""Benchmark the JSON backends when loading schemas.
+
+Schemas are always saved with the standard library, so saving isn't measured.
+
+Usage:
+
+    $ poetry run python benchmarks/json_backend.py
+
+"""
+
+from ocsf_tools.schema import available_backends, from_json, set_backend
+from util import VERSIONS, cached_file, header, measure, report
+
+
+if __name__ == "__main__":
+    if "orjson" not in available_backends():
+        print("orjson is not installed")
+        exit(1)
+
+    header("json", "orjson")
+    for version in VERSIONS:
+        data = cached_file(version).read_bytes()
+
+        set_backend("json")
+        load_json = measure(lambda: from_json(data))
+
+        set_backend("orjson")
+        load_orjson = measure(lambda: from_json(data))
+
+        report(f"{version} load", load_json, load_orjson)
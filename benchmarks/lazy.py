@@ -0,0 +1,38 @@
+"""Benchmark looking up a single event in an eager and a lazy schema.
+
+Usage:
+
+    $ poetry run python benchmarks/lazy.py
+
+"""
+
+import tracemalloc
+
+from typing import Callable
+
+from ocsf_tools.schema import OcsfEvent, from_file
+from util import VERSIONS, cached_file, header, measure, report
+
+
+def peak(fn: Callable[[], OcsfEvent]) -> int:
+    """The peak memory allocated while running fn, in bytes."""
+    tracemalloc.start()
+    fn()
+    _, high = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return high
+
+
+if __name__ == "__main__":
+    header("eager", "lazy")
+    for version in VERSIONS:
+        path = str(cached_file(version))
+
+        def eager() -> OcsfEvent:
+            return from_file(path).classes["authentication"]
+
+        def lazy() -> OcsfEvent:
+            return from_file(path, lazy=True).classes["authentication"]
+
+        report(version, measure(eager), measure(lazy))
+        print(f"{'  peak memory':<24} {peak(eager) / 1e6:>10.1f} MB {peak(lazy) / 1e6:>10.1f} MB")
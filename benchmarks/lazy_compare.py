@@ -0,0 +1,35 @@
+"""Benchmark lazy comparisons: checking whether one event changed, and comparing everything.
+
+Usage:
+
+    $ poetry run python benchmarks/lazy_compare.py
+
+"""
+
+from typing import cast
+
+from ocsf_tools.compare import ChangedSchema, compare
+from ocsf_tools.schema import from_file
+from util import VERSIONS, cached_file, header, measure, report
+
+
+def one_class(diff: ChangedSchema) -> bool:
+    return "network_activity" in diff.classes
+
+
+def everything(diff: ChangedSchema) -> int:
+    return len(dict(diff.classes)) + len(dict(diff.objects))
+
+
+if __name__ == "__main__":
+    header("sparse", "lazy")
+    for old_version, new_version in zip(VERSIONS, VERSIONS[1:]):
+        old = from_file(str(cached_file(old_version)))
+        new = from_file(str(cached_file(new_version)))
+
+        def diff(lazy: bool) -> ChangedSchema:
+            return cast(ChangedSchema, compare(old, new, sparse=True, lazy=lazy))
+
+        label = f"{old_version} -> {new_version}"
+        report(f"{label} one", measure(lambda: one_class(diff(False))), measure(lambda: one_class(diff(True))))
+        report(f"{label} all", measure(lambda: everything(diff(False))), measure(lambda: everything(diff(True))))
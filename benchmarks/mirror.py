@@ -0,0 +1,73 @@
+"""Benchmark mirroring every schema version into an empty cache directory.
+
+Serves the schemas in schema_cache from a local HTTP/1.1 server that waits
+before answering each schema request, like a remote server would. Compares
+mirroring with one download at a time against parallel downloads, then times
+running the mirror again over the full cache, when every version is skipped.
+
+Usage:
+
+    $ poetry run python benchmarks/mirror.py
+
+"""
+
+import tempfile
+import threading
+import time
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from ocsf_tools.schema import OcsfServerClient
+from ocsf_tools.schema.mirror import MirrorReport, mirror
+from util import VERSIONS, cached_file, header, report
+
+# Seconds the server waits before answering each schema request.
+LATENCY = 0.3
+
+BODIES = {f"/{v}/export/schema": cached_file(v).read_bytes() for v in VERSIONS}
+BODIES["/api/versions"] = (
+    '{"default": {"url": "/", "version": "%s"}, "versions": [%s]}'
+    % (VERSIONS[-1], ", ".join(f'{{"url": "/{v}/", "version": "{v}"}}' for v in VERSIONS))
+).encode()
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        if self.path != "/api/versions":
+            time.sleep(LATENCY)
+        body = BODIES[self.path]
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: object) -> None:
+        pass
+
+
+server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+threading.Thread(target=server.serve_forever, daemon=True).start()
+url = f"http://127.0.0.1:{server.server_address[1]}/"
+
+
+def cold(workers: int) -> MirrorReport:
+    with tempfile.TemporaryDirectory() as cache:
+        return mirror(OcsfServerClient(url, cache, pool_size=workers), workers=workers)
+
+
+serial = cold(1)
+parallel = cold(4)
+print(f"{len(VERSIONS)} versions, {LATENCY * 1000:.0f} ms of latency each")
+print(f"Throughput: {serial.throughput / 1e6:.1f} MB/s serially, {parallel.throughput / 1e6:.1f} MB/s in parallel")
+print()
+header("1 worker", "4 workers")
+report("cold mirror", serial.seconds, parallel.seconds)
+
+with tempfile.TemporaryDirectory() as cache:
+    mirror(OcsfServerClient(url, cache))
+    warm = mirror(OcsfServerClient(url, cache))
+    print(f"Mirror again, {len(warm.skipped)} skipped: {warm.seconds * 1000:.1f} ms")
+
+server.shutdown()
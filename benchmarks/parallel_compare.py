@@ -0,0 +1,50 @@
+"""Benchmark comparing schemas in parallel.
+
+Extended schemas can be many times larger than the core schema, so this
+benchmark compares copies of each pair of consecutive cached versions with
+their events and objects repeated under new names, serially and with a pool of
+worker processes.
+
+Usage:
+
+    $ poetry run python benchmarks/parallel_compare.py [workers]
+
+"""
+
+import os
+import sys
+
+from ocsf_tools.compare import compare
+from ocsf_tools.compare.parallel import compare_parallel
+from ocsf_tools.schema import OcsfSchema, from_file
+from util import VERSIONS, cached_file, header, measure, report
+
+SCALE = 10
+
+
+def extended(schema: OcsfSchema) -> OcsfSchema:
+    """A copy of a schema with its events and objects repeated under SCALE names each."""
+    return OcsfSchema(
+        version=schema.version,
+        classes={f"{name}_{i}": event for i in range(SCALE) for name, event in schema.classes.items()},
+        objects={f"{name}_{i}": obj for i in range(SCALE) for name, obj in schema.objects.items()},
+        types=schema.types,
+        base_event=schema.base_event,
+    )
+
+
+if __name__ == "__main__":
+    workers = int(sys.argv[1]) if len(sys.argv) > 1 else os.cpu_count() or 1
+    print(f"{workers} workers, {os.cpu_count()} CPUs, schemas repeated {SCALE}x")
+    header("serial", "parallel")
+    for old_version, new_version in zip(VERSIONS, VERSIONS[1:]):
+        old = extended(from_file(str(cached_file(old_version))))
+        new = extended(from_file(str(cached_file(new_version))))
+        assert compare_parallel(old, new, workers=workers, cutoff=0) == compare(old, new)
+
+        for sparse in (False, True):
+            report(
+                f"{old_version} -> {new_version}{' sparse' if sparse else ''}",
+                measure(lambda: compare(old, new, sparse), repeat=3),
+                measure(lambda: compare_parallel(old, new, workers=workers, cutoff=0, sparse=sparse), repeat=3),
+            )
@@ -0,0 +1,125 @@
+"""Benchmark rename detection in NoRemovedRecordsRule.
+
+Compares the original rule, which scanned every addition for each removal (and
+printed every class while doing so), with the indexed rule, on schema changes
+where a number of events, objects, and attributes are renamed. Then compares
+matching similar captions with difflib.get_close_matches over every addition
+with the rule's index of captions.
+
+Usage:
+
+    $ poetry run python benchmarks/removed_records.py
+
+"""
+
+import contextlib
+import io
+
+from difflib import get_close_matches
+from typing import Any, Optional
+
+from ocsf_tools.compare import Addition, ChangedEvent, ChangedSchema, Removal
+from ocsf_tools.compatibility import NoRemovedRecordsRule
+from ocsf_tools.schema import OcsfAttr, OcsfEvent, OcsfObject
+from util import header, measure, report
+
+
+def original(context: ChangedSchema) -> int:
+    """The original rename detection, counting renames."""
+    found_count = 0
+    for records in (context.classes, context.objects):
+        for _, record in records.items():
+            if isinstance(record, Removal):
+                for _, added in records.items():
+                    print(added)
+                    if isinstance(added, Addition):
+                        after: Any = added.after
+                        before: Any = record.before
+                        if after.caption == before.caption:
+                            found_count += 1
+                            break
+
+    for _, event in context.classes.items():
+        if isinstance(event, ChangedEvent):
+            for _, attr in event.attributes.items():
+                if isinstance(attr, Removal):
+                    for _, added in event.attributes.items():
+                        if isinstance(added, Addition) and added.after.caption == attr.before.caption:
+                            found_count += 1
+                            break
+
+    return found_count
+
+
+def refactor(n: int) -> ChangedSchema:
+    """A change renaming n events, n objects, and n attributes of one event."""
+    s = ChangedSchema()
+    for i in range(n):
+        s.classes[f"event_{i}"] = Removal(OcsfEvent(name=f"event_{i}", caption=f"Event {i}"))
+        s.objects[f"object_{i}"] = Removal(OcsfObject(name=f"object_{i}", caption=f"Object {i}"))
+    for i in range(n):
+        s.classes[f"new_event_{i}"] = Addition(OcsfEvent(name=f"new_event_{i}", caption=f"Event {i}"))
+        s.objects[f"new_object_{i}"] = Addition(OcsfObject(name=f"new_object_{i}", caption=f"Object {i}"))
+
+    attrs: dict[str, Any] = {}
+    for i in range(n):
+        attrs[f"attr_{i}"] = Removal(OcsfAttr(caption=f"Attr {i}", requirement="optional", type="int_t"))
+    for i in range(n):
+        attrs[f"new_attr_{i}"] = Addition(OcsfAttr(caption=f"Attr {i}", requirement="optional", type="int_t"))
+    s.classes["changed"] = ChangedEvent(attributes=attrs)
+    return s
+
+
+def indexed(context: ChangedSchema, similarity: Optional[float] = None) -> int:
+    return sum(1 for f in NoRemovedRecordsRule(similarity).validate(context) if "Renamed" in type(f).__name__)
+
+
+def reworded(n: int) -> ChangedSchema:
+    """A change rewording the captions of n attributes of one event, of varied lengths."""
+    attrs: dict[str, Any] = {}
+    for i in range(n):
+        caption = f"Attr {i} " + "x" * (i % 40)
+        attrs[f"attr_{i}"] = Removal(OcsfAttr(caption=caption, requirement="optional", type="int_t"))
+    for i in range(n):
+        caption = f"Attribute {i} " + "x" * (i % 40)
+        attrs[f"new_attr_{i}"] = Addition(OcsfAttr(caption=caption, requirement="optional", type="int_t"))
+    s = ChangedSchema()
+    s.classes["changed"] = ChangedEvent(attributes=attrs)
+    return s
+
+
+def close_matches(context: ChangedSchema, similarity: float) -> int:
+    """Similar caption matching with get_close_matches over every added caption, counting renames."""
+    found_count = 0
+    for _, event in context.classes.items():
+        if isinstance(event, ChangedEvent):
+            captions = [a.after.caption for a in event.attributes.values() if isinstance(a, Addition)]
+            for _, attr in event.attributes.items():
+                if isinstance(attr, Removal):
+                    if attr.before.caption in captions or get_close_matches(
+                        attr.before.caption, captions, n=1, cutoff=similarity
+                    ):
+                        found_count += 1
+    return found_count
+
+
+if __name__ == "__main__":
+    header("scan", "index")
+    for n in (100, 300, 1000):
+        diff = refactor(n)
+        with contextlib.redirect_stdout(io.StringIO()):
+            assert original(diff) == indexed(diff) == 3 * n
+            baseline = measure(lambda: original(diff), repeat=1)
+
+        report(f"{n} renames each", baseline, measure(lambda: indexed(diff)))
+
+    print()
+    header("get_close_matches", "indexed")
+    for n in (100, 300, 1000):
+        diff = reworded(n)
+        assert close_matches(diff, 0.8) == indexed(diff, 0.8)
+        report(
+            f"{n} similar captions",
+            measure(lambda: close_matches(diff, 0.8), repeat=1),
+            measure(lambda: indexed(diff, 0.8), repeat=1),
+        )
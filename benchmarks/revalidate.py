@@ -0,0 +1,78 @@
+"""Benchmark loading the server's default version and a dev version.
+
+Serves a schema from a local HTTP/1.1 server that sends an ETag and answers
+conditional requests with 304 Not Modified. Compares downloading and parsing
+the schema on every run, as the client used to for dev and default versions,
+against revalidating the cached copy and loading its snapshot.
+
+Usage:
+
+    $ poetry run python benchmarks/revalidate.py
+
+"""
+
+import hashlib
+import tempfile
+import threading
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from ocsf_tools.schema import OcsfServerClient
+from util import VERSIONS, cached_file, header, measure, report
+
+DEV = "1.3.0-dev"
+BODY = cached_file(VERSIONS[-1]).read_bytes()
+BODIES = {
+    "/export/schema": BODY,
+    f"/{DEV}/export/schema": BODY.replace(f'"version": "{VERSIONS[-1]}"'.encode(), f'"version": "{DEV}"'.encode(), 1),
+    "/api/versions": (
+        '{"default": {"url": "/", "version": "%s"}, "versions": [{"url": "/%s/", "version": "%s"}]}'
+        % (VERSIONS[-1], DEV, DEV)
+    ).encode(),
+}
+ETAGS = {path: '"%s"' % hashlib.sha256(body).hexdigest()[:16] for path, body in BODIES.items()}
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        if self.headers.get("If-None-Match") == ETAGS[self.path]:
+            self.send_response(304)
+            self.send_header("ETag", ETAGS[self.path])
+            self.end_headers()
+            return
+
+        body = BODIES[self.path]
+        self.send_response(200)
+        self.send_header("ETag", ETAGS[self.path])
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: object) -> None:
+        pass
+
+
+server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+threading.Thread(target=server.serve_forever, daemon=True).start()
+url = f"http://127.0.0.1:{server.server_address[1]}/"
+
+with tempfile.TemporaryDirectory() as cache:
+    for version in (None, DEV):
+        OcsfServerClient(url, cache).get_schema(version)
+
+        def download() -> None:
+            OcsfServerClient(url).get_schema(version)
+
+        def revalidate() -> None:
+            OcsfServerClient(url, cache, ttl=0).get_schema(version)
+
+        client = OcsfServerClient(url, cache, ttl=0)
+        client.get_schema(version)
+        print(f"{version or 'default'}: {client.pool.stats.bytes_received} body bytes received when revalidating")
+        header("download", "revalidate")
+        report(version or "default", measure(download), measure(revalidate))
+        print()
+
+server.shutdown()
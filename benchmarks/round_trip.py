@@ -0,0 +1,62 @@
+"""Benchmark saving a schema: renaming keys in a second pass versus while encoding.
+
+Usage:
+
+    $ poetry run python benchmarks/round_trip.py
+
+"""
+
+import os
+import tempfile
+
+from dataclasses import asdict
+from typing import Any
+
+from ocsf_tools.schema import OcsfSchema, from_file, get_backend, to_dict, to_file
+from util import VERSIONS, cached_file, header, measure, report
+
+
+def two_pass_to_dict(schema: OcsfSchema) -> dict[str, Any]:
+    """Copy the schema with asdict and rename keys in a second walk, like the original to_dict."""
+
+    def rename(d: dict[str, Any]) -> dict[str, Any]:
+        ops: list[tuple[str, str]] = []
+        for k, v in d.items():
+            if k == "deprecated":
+                ops.append((k, "@deprecated"))
+            if isinstance(v, dict):
+                d[k] = rename(v)  # type: ignore
+        for old, new in ops:
+            d[new] = d.pop(old)
+        return d
+
+    return rename(asdict(schema))
+
+
+def two_pass_to_file(schema: OcsfSchema, path: str) -> None:
+    with open(path, "wb") as f:
+        f.write(get_backend().dumps(two_pass_to_dict(schema)))
+
+
+if __name__ == "__main__":
+    header("two pass", "fused")
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "schema.json")
+        for version in VERSIONS:
+            schema = from_file(str(cached_file(version)))
+            assert two_pass_to_dict(schema) == to_dict(schema)
+
+            to_file(schema, path)
+            assert from_file(path) == schema
+
+            report(f"{version} to_dict", measure(lambda: two_pass_to_dict(schema)), measure(lambda: to_dict(schema)))
+
+            def two_pass_round_trip():
+                two_pass_to_file(schema, path)
+                from_file(path)
+
+            def fused_round_trip():
+                to_file(schema, path)
+                from_file(path)
+
+            report(f"{version} round trip", measure(two_pass_round_trip), measure(fused_round_trip))
@@ -0,0 +1,54 @@
+"""Benchmark saving a schema: encoding a copy made by asdict versus streaming the models.
+
+Reports wall clock time and the peak memory allocated while writing the file.
+
+Usage:
+
+    $ poetry run python benchmarks/serialize.py
+
+"""
+
+import os
+import tempfile
+import tracemalloc
+
+from typing import Any, Callable
+
+from ocsf_tools.schema import OcsfSchema, from_file, get_backend, to_dict, to_file
+from util import VERSIONS, cached_file, header, measure, report
+
+
+def copy_to_file(schema: OcsfSchema, path: str) -> None:
+    """The original to_file implementation."""
+    with open(path, "wb") as f:
+        f.write(get_backend().dumps(to_dict(schema)))
+
+
+def peak(fn: Callable[[], Any]) -> int:
+    """The peak memory allocated while running fn, in bytes."""
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+
+if __name__ == "__main__":
+    header("asdict", "stream")
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "schema.json")
+        for version in VERSIONS:
+            schema = from_file(str(cached_file(version)))
+
+            copy_to_file(schema, path)
+            with open(path, "rb") as f:
+                expected = f.read()
+            to_file(schema, path)
+            with open(path, "rb") as f:
+                assert f.read() == expected
+
+            report(version, measure(lambda: copy_to_file(schema, path)), measure(lambda: to_file(schema, path)))
+
+            before = peak(lambda: copy_to_file(schema, path)) / 1024 / 1024
+            after = peak(lambda: to_file(schema, path)) / 1024 / 1024
+            print(f"{version + ' peak memory':<24} {before:>10.1f} MB {after:>10.1f} MB")
@@ -0,0 +1,26 @@
+"""Benchmark warm schema loads: parsing JSON versus reading a snapshot.
+
+Usage:
+
+    $ poetry run python benchmarks/snapshot.py
+
+"""
+
+import shutil
+import tempfile
+
+from pathlib import Path
+
+from ocsf_tools.schema import from_file, from_file_snapshot
+from util import VERSIONS, cached_file, header, measure, report
+
+
+if __name__ == "__main__":
+    header("json", "snapshot")
+    with tempfile.TemporaryDirectory() as tmp:
+        for version in VERSIONS:
+            path = Path(tmp) / cached_file(version).name
+            shutil.copy(cached_file(version), path)
+            from_file_snapshot(path)
+
+            report(version, measure(lambda: from_file(str(path))), measure(lambda: from_file_snapshot(path)))
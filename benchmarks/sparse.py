@@ -0,0 +1,39 @@
+"""Benchmark full versus sparse comparisons: construction time and retained memory.
+
+Usage:
+
+    $ poetry run python benchmarks/sparse.py
+
+"""
+
+import tracemalloc
+
+from typing import Any, Callable
+
+from ocsf_tools.compare import compare
+from ocsf_tools.schema import from_file
+from util import VERSIONS, cached_file, header, measure, report
+
+
+def retained(fn: Callable[[], Any]) -> int:
+    """The memory allocated by fn that is still held by its result, in bytes."""
+    tracemalloc.start()
+    result = fn()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return current
+
+
+if __name__ == "__main__":
+    header("full", "sparse")
+    for old_version, new_version in zip(VERSIONS, VERSIONS[1:]):
+        old = from_file(str(cached_file(old_version)))
+        new = from_file(str(cached_file(new_version)))
+
+        label = f"{old_version} -> {new_version}"
+        report(label, measure(lambda: compare(old, new)), measure(lambda: compare(old, new, sparse=True)))
+
+        full = retained(lambda: compare(old, new)) / 1024
+        sparse = retained(lambda: compare(old, new, sparse=True)) / 1024
+        print(f"{'  memory':<24} {full:>10.0f} KB {sparse:>10.0f} KB")
@@ -0,0 +1,44 @@
+"""Benchmark peak memory when loading a schema file: whole document versus streaming.
+
+Usage:
+
+    $ poetry run python benchmarks/stream.py
+
+"""
+
+import tracemalloc
+
+from typing import Callable
+
+from ocsf_tools.schema import OcsfSchema, from_json, from_stream
+from util import VERSIONS, cached_file, header, measure, report
+
+
+def peak(fn: Callable[[], OcsfSchema]) -> tuple[int, int]:
+    """The memory retained by and the peak memory allocated while running fn, in bytes."""
+    tracemalloc.start()
+    result = fn()
+    retained, high = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return retained, high
+
+
+if __name__ == "__main__":
+    header("whole", "stream")
+    for version in VERSIONS:
+        path = cached_file(version)
+
+        def whole() -> OcsfSchema:
+            with open(path, "rb") as f:
+                return from_json(f.read().decode("utf-8"))
+
+        def stream() -> OcsfSchema:
+            with open(path, "rb") as f:
+                return from_stream(f)
+
+        report(version, measure(whole), measure(stream))
+        schema_size, whole_peak = peak(whole)
+        _, stream_peak = peak(stream)
+        print(f"{'  peak memory':<24} {whole_peak / 1e6:>10.1f} MB {stream_peak / 1e6:>10.1f} MB")
+        print(f"{'  parsed schema':<24} {schema_size / 1e6:>10.1f} MB")
@@ -0,0 +1,36 @@
+"""Helpers shared by the benchmark scripts."""
+
+import statistics
+import time
+
+from pathlib import Path
+from typing import Any, Callable
+
+CACHE = Path(__file__).parent.parent / "schema_cache"
+VERSIONS = ["1.0.0", "1.1.0", "1.2.0"]
+
+
+def cached_file(version: str) -> Path:
+    """The path to a cached schema file."""
+    return CACHE / f"schema-{version}.json"
+
+
+def measure(fn: Callable[[], Any], repeat: int = 5) -> float:
+    """Run fn repeat times and return the median wall clock time in seconds."""
+    times: list[float] = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+
+    return statistics.median(times)
+
+
+def report(label: str, baseline: float, candidate: float) -> None:
+    """Print one line comparing a baseline and a candidate timing."""
+    print(f"{label:<24} {baseline * 1000:>10.1f} ms {candidate * 1000:>10.1f} ms {baseline / candidate:>8.1f}x")
+
+
+def header(baseline: str, candidate: str) -> None:
+    """Print the table header for report()."""
+    print(f"{'':<24} {baseline:>13} {candidate:>13} {'speedup':>9}")
@@ -0,0 +1,66 @@
+"""Benchmark looking up versions in a new client, as at the start of every run.
+
+Serves /api/versions from a local HTTP server that waits before answering, like
+a remote server would. Compares a new client without a cache directory, which
+fetches the versions, against a new client that reads them from the cache.
+
+Usage:
+
+    $ poetry run python benchmarks/versions_cache.py
+
+"""
+
+import logging
+import tempfile
+import threading
+import time
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from ocsf_tools.schema import OcsfServerClient
+from util import VERSIONS, header, measure, report
+
+# Seconds the server waits before answering.
+LATENCY = 0.1
+
+BODY = (
+    '{"default": {"url": "/", "version": "%s"}, "versions": [%s]}'
+    % (VERSIONS[-1], ", ".join(f'{{"url": "/{v}/", "version": "{v}"}}' for v in VERSIONS))
+).encode()
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        time.sleep(LATENCY)
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(BODY)))
+        self.end_headers()
+        self.wfile.write(BODY)
+
+    def log_message(self, format: str, *args: object) -> None:
+        pass
+
+
+server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+threading.Thread(target=server.serve_forever, daemon=True).start()
+url = f"http://127.0.0.1:{server.server_address[1]}/"
+
+with tempfile.TemporaryDirectory() as cache:
+    OcsfServerClient(url, cache).get_versions()
+
+    print(f"Server latency: {LATENCY * 1000:.0f} ms")
+    header("fetched", "cached")
+    report(
+        "resolve 1.x",
+        measure(lambda: OcsfServerClient(url).resolve_version("1.x")),
+        measure(lambda: OcsfServerClient(url, cache).resolve_version("1.x")),
+    )
+
+    # Offline, the stale cached versions are used after the connection is refused.
+    logging.disable(logging.WARNING)
+    offline = measure(lambda: OcsfServerClient("http://127.0.0.1:1/", cache, ttl=0).resolve_version("1.x"))
+    print(f"Offline, with stale cached versions: {offline * 1000:.1f} ms")
+
+server.shutdown()
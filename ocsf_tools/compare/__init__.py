@@ -1,4 +1,7 @@
-from .compare import compare, compare_dict
+from .compare import ComparisonPlan, LazyDifferences, compare, compare_dict, comparison_plan, values_unchanged
+from .index import DiffIndex, IndexEntry
+from .inherited import compare_inherited
+from .walk import iter_differences
 
 from .model import (
     Addition,
@@ -16,11 +19,17 @@ from .model import (
     Removal,
     NoChange,
     SimpleDifference,
+    SparseDifferences,
 )
 
 __all__ = [
     "compare",
     "compare_dict",
+    "compare_inherited",
+    "iter_differences",
+    "comparison_plan",
+    "values_unchanged",
+    "ComparisonPlan",
     "Addition",
     "Change",
     "ChangedModel",
@@ -33,7 +42,11 @@ __all__ = [
     "ChangedType",
     "ChangedVersion",
     "Difference",
+    "DiffIndex",
+    "IndexEntry",
+    "LazyDifferences",
     "Removal",
     "NoChange",
     "SimpleDifference",
+    "SparseDifferences",
 ]
@@ -10,9 +10,26 @@ the model's attributes.
 compare_dict() is similar, but it works on dictionaries (or Optional[dict]). The
 result is a dictionary will always have all of the keys from both dictionaries,
 with the values being the differences of the corresponding keys.
+
+With trust_fingerprints=True, models with stored fingerprints (see
+ocsf_tools.schema.fingerprint), as schemas loaded from snapshots have, are
+recognized as unchanged by their fingerprints without being traversed, and
+changed models are traversed only once. Stored fingerprints aren't updated
+when a model is modified, so only trust them for schemas that haven't been
+modified since they were loaded, or since store_fingerprints() was called on
+them. By default, models are compared by identity and then equality.
+
+The fields of each OcsfModel subclass are inspected once, the first time an
+instance of it is compared, and the resulting ComparisonPlan is reused for every
+other instance. See comparison_plan().
 """
 
+from dataclasses import dataclass, fields, replace
+from itertools import chain
 from typing import (
+    Iterator,
+    Mapping,
+    Optional,
     TypeVar,
     TypeGuard,
     Union,
@@ -24,22 +41,50 @@ from typing import (
 )
 from types import UnionType, NoneType
 
-from ocsf_tools.schema import OcsfModel
+from ocsf_tools.schema import OcsfModel, stored_fingerprint
 from .model import (
     Difference,
     Addition,
     Removal,
     Change,
+    ChangedModel,
     NoChange,
+    SparseDifferences,
 )
-from .factory import create_diff
+from .factory import diff_class
 
 
 T = TypeVar("T")
 K = TypeVar("K")
 
 
-def compare_dict(old_val: dict[K, T] | None, new_val: dict[K, T] | None) -> dict[K, Difference[T]] | NoChange[T]:
+def values_unchanged(old_val: Any, new_val: Any, trust_fingerprints: bool = False) -> bool:
+    """Are two values equal, using their stored fingerprints if trusted and they are models that have them?
+
+    This is the check that compare, compare_dict, and LazyDifferences use to
+    decide whether a value changed before comparing it field by field. Identical
+    objects are unchanged without any comparison.
+
+    Args:
+        old_val: The old value.
+        new_val: The new value.
+        trust_fingerprints: Decide by the stored fingerprints of models that
+            both have them. See compare.
+    """
+    if old_val is new_val:
+        return True
+    if trust_fingerprints and isinstance(old_val, OcsfModel) and isinstance(new_val, OcsfModel):
+        old_fp = stored_fingerprint(old_val)
+        if old_fp is not None:
+            new_fp = stored_fingerprint(new_val)
+            if new_fp is not None:
+                return old_val.__class__ is new_val.__class__ and old_fp == new_fp
+    return old_val == new_val
+
+
+def compare_dict(
+    old_val: dict[K, T] | None, new_val: dict[K, T] | None, sparse: bool = False, trust_fingerprints: bool = False
+) -> dict[K, Difference[T]] | NoChange[T]:
     """Compare two dictionaries and return the differences.
 
     If both arguments are None, the result will be a NoChange object.
@@ -54,9 +99,15 @@ def compare_dict(old_val: dict[K, T] | None, new_val: dict[K, T] | None) -> dict
     will be a NoChange[T]. Otherwise, primitive values will result in a
     Change[T] and OcsfModel values will result in a ChangedModel[T].
 
+    If sparse is True, keys with unchanged values are left out, and the result
+    is a SparseDifferences that can tell whether a missing key was unchanged.
+
     Args:
         old_val: The old dictionary to be compared. Must be a dictionary of the same type as new_val or None.
         new_val: The new dictionary to be compared. Must be a dictionary of the same type as old_val or None.
+        sparse: Leave unchanged keys out of the result, here and in any models compared.
+        trust_fingerprints: Treat models with equal stored fingerprints as
+            unchanged without comparing them. See compare.
 
     Returns:
         A dictionary with all keys from both dictionaries and the differences of
@@ -72,18 +123,20 @@ def compare_dict(old_val: dict[K, T] | None, new_val: dict[K, T] | None) -> dict
     if new_val is None:
         new_val = {}
 
-    ret: dict[K, Difference[T]] = {}
-    keys: set[K] = set(old_val.keys()) | set(new_val.keys())
+    ret: dict[K, Difference[T]] = SparseDifferences(old_val, new_val) if sparse else {}
+    # Old keys first, then new ones, so that results are in a predictable order.
+    keys = dict.fromkeys(chain(old_val, new_val))
 
     for key in keys:
         if key not in new_val:
             ret[key] = Removal(before=old_val[key])
         elif key not in old_val:
             ret[key] = Addition(after=new_val[key])
-        elif old_val[key] == new_val[key]:
-            ret[key] = NoChange()
+        elif values_unchanged(old_val[key], new_val[key], trust_fingerprints):
+            if not sparse:
+                ret[key] = NoChange()
         else:
-            ret[key] = compare(old_val[key], new_val[key])
+            ret[key] = compare(old_val[key], new_val[key], sparse, trust_fingerprints=trust_fingerprints)
 
     return ret
 
@@ -93,13 +146,16 @@ def is_optional_dict(
 ) -> TypeGuard[dict[Any, Any] | None]:
     """Check if a value is a dictionary or an Optional[dict].
 
+    Any Mapping is accepted as a dictionary, so that the LazyModels of a lazy
+    schema are compared like the dicts of an eagerly parsed one.
+
     Args:
         value: The value to test.
         origin: The origin of the type hint (see: typing.get_origin).
         args: The arguments of the type hint (see: typing.get_args).
     """
 
-    if isinstance(value, dict):
+    if isinstance(value, Mapping):
         return True
 
     if (origin != Union and origin != UnionType) or len(args) != 2:
@@ -113,7 +169,246 @@ def is_optional_dict(
     return True
 
 
-def compare(old_val: T, new_val: T) -> Difference[T]:
+def _mentions_model(hint: Any) -> bool:
+    """Does a type hint refer to an OcsfModel, directly or as a member of a union?"""
+    if isinstance(hint, type) and issubclass(hint, OcsfModel):
+        return True
+
+    origin = get_origin(hint)
+    return (origin == Union or origin == UnionType) and any(_mentions_model(arg) for arg in get_args(hint))
+
+
+class LazyDifferences(Mapping[K, Difference[T]]):
+    """The differences between two dictionaries, computed as they are accessed.
+
+    Like SparseDifferences, only keys that were added, removed, or changed are
+    present. Whether a key changed is decided with cheap checks (identity, then
+    stored fingerprints if trusted and both values have them, then equality),
+    so testing membership, iterating, and asking for the length never compare
+    values field by field. The difference at a key is only computed the first
+    time it is read, then kept.
+
+    Iterating, or asking for the length, checks every key once.
+    """
+
+    def __init__(
+        self, before: Mapping[K, T], after: Mapping[K, T], sparse: bool = False, trust_fingerprints: bool = False
+    ):
+        """Create a new mapping.
+
+        Args:
+            before: The old dictionary.
+            after: The new dictionary.
+            sparse: Make the comparisons of values sparse. See compare.
+            trust_fingerprints: Treat models with equal stored fingerprints as
+                unchanged. See compare.
+        """
+        self.before = before
+        self.after = after
+        self._sparse = sparse
+        self._trust_fingerprints = trust_fingerprints
+        self._diffs: dict[K, Difference[T]] = {}
+        # Whether each key checked so far was added, removed, or changed.
+        self._checked: dict[K, bool] = {}
+        self._keys: Optional[list[K]] = None
+
+    def _is_changed(self, key: K) -> bool:
+        """Was the key added, removed, or changed? The difference isn't computed.
+
+        Raises:
+            KeyError: If the key isn't present in either dictionary.
+        """
+        changed = self._checked.get(key)
+        if changed is not None:
+            return changed
+
+        if key in self.before and key in self.after:
+            changed = not values_unchanged(self.before[key], self.after[key], self._trust_fingerprints)
+        elif key in self.before or key in self.after:
+            changed = True
+        else:
+            raise KeyError(key)
+
+        self._checked[key] = changed
+        return changed
+
+    def __getitem__(self, key: K) -> Difference[T]:
+        diff = self._diffs.get(key)
+        if diff is not None:
+            return diff
+        if not self._is_changed(key):
+            raise KeyError(key)
+
+        if key not in self.after:
+            diff = Removal(before=self.before[key])
+        elif key not in self.before:
+            diff = Addition(after=self.after[key])
+        else:
+            diff = compare(self.before[key], self.after[key], self._sparse, trust_fingerprints=self._trust_fingerprints)
+
+        self._diffs[key] = diff
+        return diff
+
+    def __contains__(self, key: object) -> bool:
+        try:
+            return self._is_changed(cast(K, key))
+        except KeyError:
+            return False
+
+    def _changed(self) -> list[K]:
+        if self._keys is None:
+            keys = dict.fromkeys(chain(self.before, self.after))
+            self._keys = [key for key in keys if key in self]
+        return self._keys
+
+    def __iter__(self) -> Iterator[K]:
+        return iter(self._changed())
+
+    def __len__(self) -> int:
+        return len(self._changed())
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({len(self._diffs)} computed)"
+
+    def is_unchanged(self, key: K) -> bool:
+        """Was the key present in both dictionaries with an unchanged value?"""
+        return key in self.before and key in self.after and not self._is_changed(key)
+
+    def unchanged(self) -> Iterator[K]:
+        """The keys present in both dictionaries with unchanged values."""
+        return (key for key in self.before if self.is_unchanged(key))
+
+    def difference(self, key: K) -> Difference[T]:
+        """The difference at a key, including NoChange for unchanged keys.
+
+        Raises:
+            KeyError: If the key wasn't present in either dictionary.
+        """
+        return self[key] if self._is_changed(key) else NoChange()
+
+    def computed(self) -> int:
+        """The number of differences that have been computed."""
+        return len(self._diffs)
+
+
+@dataclass(frozen=True)
+class ComparisonPlan:
+    """How to compare the fields of two instances of an OcsfModel subclass.
+
+    Each field is compared according to its type hint: dictionaries and
+    optional dictionaries with compare_dict, nested models with compare, and
+    other values with ==.
+    """
+
+    diff_class: type[ChangedModel[Any]]
+    dicts: tuple[str, ...]
+    optional_dicts: tuple[str, ...]
+    models: tuple[str, ...]
+    primitives: tuple[str, ...]
+
+    def compare(
+        self,
+        old_val: OcsfModel,
+        new_val: OcsfModel,
+        sparse: bool = False,
+        lazy: bool = False,
+        overrides: Optional[Mapping[str, Any]] = None,
+        trust_fingerprints: bool = False,
+    ) -> ChangedModel[Any]:
+        """Compare two instances of the model and return the corresponding ChangedModel.
+
+        Differences already known for some fields, like the attributes of an
+        event, can be passed as overrides, in which case those fields aren't
+        compared. See compare for the other arguments.
+        """
+        if overrides:
+            plan = replace(
+                self,
+                dicts=tuple(a for a in self.dicts if a not in overrides),
+                optional_dicts=tuple(a for a in self.optional_dicts if a not in overrides),
+                models=tuple(a for a in self.models if a not in overrides),
+                primitives=tuple(a for a in self.primitives if a not in overrides),
+            )
+            ret = plan.compare(old_val, new_val, sparse, lazy, trust_fingerprints=trust_fingerprints)
+            for attr, diff in overrides.items():
+                setattr(ret, attr, diff)
+            return ret
+
+        diffs: dict[str, Any] = {}
+
+        for attr in self.dicts:
+            if lazy:
+                diffs[attr] = LazyDifferences(
+                    getattr(old_val, attr), getattr(new_val, attr), sparse, trust_fingerprints
+                )
+            else:
+                diffs[attr] = compare_dict(getattr(old_val, attr), getattr(new_val, attr), sparse, trust_fingerprints)
+
+        for attr in self.optional_dicts:
+            diffs[attr] = compare_dict(getattr(old_val, attr), getattr(new_val, attr), sparse, trust_fingerprints)
+
+        for attr in self.models:
+            diffs[attr] = compare(
+                getattr(old_val, attr), getattr(new_val, attr), sparse, trust_fingerprints=trust_fingerprints
+            )
+
+        for attr in self.primitives:
+            old_attr = getattr(old_val, attr)
+            new_attr = getattr(new_val, attr)
+            diffs[attr] = NoChange() if old_attr == new_attr else Change(before=old_attr, after=new_attr)
+
+        return self.diff_class(**diffs)
+
+
+_PLANS: dict[type, ComparisonPlan] = {}
+
+
+def comparison_plan(model_type: type[OcsfModel]) -> ComparisonPlan:
+    """Get the plan for comparing instances of an OCSF model class, building it if needed.
+
+    Args:
+        model_type: A subclass of OcsfModel, like OcsfAttr or OcsfEvent.
+
+    Returns:
+        The ComparisonPlan for model_type.
+
+    Raises:
+        ValueError: If the given type is not a recognized OCSF model type, or if
+            its ChangedModel class lacks one of its fields.
+    """
+    plan = _PLANS.get(model_type)
+    if plan is not None:
+        return plan
+
+    cls = diff_class(model_type)
+    diff_fields = {f.name for f in fields(cast(Any, cls))}
+    dicts: list[str] = []
+    optional_dicts: list[str] = []
+    models: list[str] = []
+    primitives: list[str] = []
+
+    for attr, value in get_type_hints(model_type).items():
+        if attr not in diff_fields:
+            raise ValueError(f"{cls.__name__} has no field for {model_type.__name__}.{attr}")
+
+        origin = get_origin(value)
+        if origin is dict:
+            dicts.append(attr)
+        elif is_optional_dict(None, origin, get_args(value)):
+            optional_dicts.append(attr)
+        elif _mentions_model(value):
+            models.append(attr)
+        else:
+            primitives.append(attr)
+
+    plan = ComparisonPlan(cls, tuple(dicts), tuple(optional_dicts), tuple(models), tuple(primitives))
+    _PLANS[model_type] = plan
+    return plan
+
+
+def compare(
+    old_val: T, new_val: T, sparse: bool = False, lazy: bool = False, trust_fingerprints: bool = False
+) -> Difference[T]:
     """Compare two values of the same type and return a Difference.
 
     If the values are primitives (int, bool, list[int], etc.), the result will
@@ -134,29 +429,38 @@ def compare(old_val: T, new_val: T) -> Difference[T]:
     The combined keys of both dictionaries will be present in the result, and
     the values will be a Difference. See compare_dict for more details.
 
+    In a sparse comparison, dictionaries only contain the keys that were added,
+    removed, or changed, so the size of the result is proportional to the
+    number of changes rather than the size of the schema. The dictionaries are
+    SparseDifferences. Code that only looks for Additions, Removals, Changes,
+    and ChangedModels, like the compatibility rules, works on either.
+
+    In a lazy comparison of two models, the model's dictionaries, like the
+    classes and objects of a schema, are LazyDifferences: each value is only
+    compared when it is accessed, so checking whether a few events changed
+    doesn't compare the rest of the schema. Values are compared eagerly (and
+    sparsely if requested) once they are accessed.
+
     Args:
         old_val: The old value to be compared.
         new_val: The new value to be compared.
+        sparse: Leave unchanged keys out of dictionaries in the result.
+        lazy: Compare the values of the top-level model's dictionaries on
+            access.
+        trust_fingerprints: Treat models with equal stored fingerprints as
+            unchanged without comparing them. Only use this if neither value
+            has been modified since its fingerprints were stored.
 
     Returns:
         A suitable Difference object representing the comparison of the two values.
     """
-    if isinstance(old_val, OcsfModel) and type(old_val) == type(new_val):
-        ret = create_diff(old_val)
-
-        for attr, value in get_type_hints(old_val).items():
-            old_attr = getattr(old_val, attr)
-            new_attr = getattr(new_val, attr)
-
-            origin = get_origin(value)
-            args = get_args(value)
-
-            if is_optional_dict(old_attr, origin, args) and is_optional_dict(new_attr, origin, args):
-                setattr(ret, attr, compare_dict(old_attr, new_attr))
-            else:
-                setattr(ret, attr, compare(old_attr, new_attr))
-
-        return cast(Difference[T], ret)
+    # __class__ rather than type(), which differs for frozen models (see freeze).
+    if isinstance(old_val, OcsfModel) and old_val.__class__ is new_val.__class__:
+        plan = comparison_plan(old_val.__class__)
+        return cast(
+            Difference[T],
+            plan.compare(old_val, cast(OcsfModel, new_val), sparse, lazy, trust_fingerprints=trust_fingerprints),
+        )
 
     elif old_val == new_val:
         return NoChange()
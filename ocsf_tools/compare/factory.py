@@ -12,9 +12,10 @@ Example:
 
 """
 
-from typing import cast
+from typing import Any, cast
 
 from ocsf_tools.schema import (
+    OcsfModel,
     OcsfSchema,
     OcsfEvent,
     OcsfObject,
@@ -38,6 +39,38 @@ from .model import (
 )
 
 
+# The ChangedModel class that corresponds to each OCSF model class.
+_DIFF_CLASSES: dict[type[OcsfModel], type[ChangedModel[Any]]] = {
+    OcsfSchema: ChangedSchema,
+    OcsfEvent: ChangedEvent,
+    OcsfObject: ChangedObject,
+    OcsfAttr: ChangedAttr,
+    OcsfDeprecationInfo: ChangedDeprecationInfo,
+    OcsfVersion: ChangedVersion,
+    OcsfEnumMember: ChangedEnumMember,
+    OcsfType: ChangedType,
+}
+
+
+def diff_class(model_type: type[OcsfModel]) -> type[ChangedModel[Any]]:
+    """Find the ChangedModel class that corresponds to an OCSF model class.
+
+    Args:
+        model_type: A subclass of OcsfModel, like OcsfAttr or OcsfEvent.
+
+    Returns:
+        The corresponding subclass of ChangedModel, like ChangedAttr or ChangedEvent.
+
+    Raises:
+        ValueError: If the given type is not a recognized OCSF model type.
+    """
+    for cls in model_type.__mro__:
+        if cls in _DIFF_CLASSES:
+            return _DIFF_CLASSES[cls]
+
+    raise ValueError("Unrecognized OCSF model type")
+
+
 def create_diff(model: OcsfT) -> ChangedModel[OcsfT]:
     """Factory to create a specific ChangedModel to match a given OCSF Model.
 
@@ -55,28 +88,7 @@ def create_diff(model: OcsfT) -> ChangedModel[OcsfT]:
     Raises:
         ValueError: If the given model is not a recognized OCSF model type.
     """
-
-    match model:
-        case OcsfSchema():
-            ret = ChangedSchema()
-        case OcsfEvent():
-            ret = ChangedEvent()
-        case OcsfObject():
-            ret = ChangedObject()
-        case OcsfAttr():
-            ret = ChangedAttr()
-        case OcsfDeprecationInfo():
-            ret = ChangedDeprecationInfo()
-        case OcsfVersion():
-            ret = ChangedVersion()
-        case OcsfEnumMember():
-            ret = ChangedEnumMember()
-        case OcsfType():
-            ret = ChangedType()
-        case _:
-            raise ValueError("Unrecognized OCSF model type")
-
     # I have tried a lot of things – union types, @overloads, TypeGuards, etc. –
     # to avoid this cast while still satisfying the type checker in strict mode,
     # but all have failed.
-    return cast(ChangedModel[OcsfT], ret)
+    return cast(ChangedModel[OcsfT], diff_class(type(model))())
@@ -0,0 +1,181 @@
+"""An index of the changes in a schema comparison.
+
+Questions about a ChangedSchema, like "which attributes changed type?", are
+answered by looping over every event and object, then every attribute, with
+isinstance checks at each level. DiffIndex does that scan once and files each
+change by its kind and the type of element it belongs to, so that each question
+becomes a lookup:
+
+```python
+index = DiffIndex(compare(old, new, sparse=True))
+for entry in index.changed_fields("type"):
+    print(entry.element_type, entry.name, entry.attr, entry.diff.before, entry.diff.after)
+```
+
+An index is a snapshot: it doesn't notice changes made to a ChangedSchema after
+it is built. CompatibilityValidator builds one index each time it validates,
+and shares it between its rules.
+"""
+
+from dataclasses import dataclass, fields
+from typing import Any, Generic, Iterable, Optional, TypeVar, cast
+
+from ocsf_tools.schema import OcsfAttr, OcsfElementType, OcsfEnumMember, OcsfEvent, OcsfObject
+from .model import (
+    Addition,
+    Change,
+    ChangedAttr,
+    ChangedEvent,
+    ChangedObject,
+    ChangedSchema,
+    Difference,
+    NoChange,
+    Removal,
+)
+
+D = TypeVar("D", bound=Difference[Any], covariant=True)
+
+# The element types that an index files changes under.
+_RECORD_TYPES = (OcsfElementType.EVENT, OcsfElementType.OBJECT)
+
+_ATTR_FIELDS = tuple(f.name for f in fields(ChangedAttr))
+
+# Most values in a comparison are NoChange. Checking for it by identity first
+# avoids the much slower isinstance checks against the Difference ABCs.
+_NO_CHANGE: NoChange[Any] = NoChange()
+
+
+@dataclass(slots=True)
+class IndexEntry(Generic[D]):
+    """A change found in a schema comparison, and where it was found.
+
+    Attributes:
+        element_type: OcsfElementType.EVENT or OcsfElementType.OBJECT.
+        name: The name of the event or object.
+        diff: The difference.
+        attr: The name of the attribute, for changes to attributes and enum members.
+        member: The key of the enum member, for changes to enum members.
+    """
+
+    element_type: OcsfElementType
+    name: str
+    diff: D
+    attr: Optional[str] = None
+    member: Optional[str] = None
+
+
+class DiffIndex:
+    """The changes in a ChangedSchema, grouped by kind and element type.
+
+    Each method returns the changes of one kind, in the order they appear in
+    the ChangedSchema. Methods that take an element_type return the changes to
+    events or objects only, or both (events first) if it is None.
+    """
+
+    def __init__(self, diff: ChangedSchema):
+        """Index a ChangedSchema, scanning it once.
+
+        Args:
+            diff: The comparison of two schemas.
+        """
+        self._entries: dict[tuple[str, OcsfElementType], list[IndexEntry[Any]]] = {}
+        self._fields: dict[tuple[str, OcsfElementType], list[IndexEntry[Change[Any]]]] = {}
+
+        self._add_records(OcsfElementType.EVENT, diff.classes.items())
+        self._add_records(OcsfElementType.OBJECT, diff.objects.items())
+
+    def _add(self, kind: str, entry: IndexEntry[Any]) -> None:
+        self._entries.setdefault((kind, entry.element_type), []).append(entry)
+
+    def _add_records(self, element_type: OcsfElementType, records: Iterable[tuple[str, Difference[Any]]]) -> None:
+        for name, record in records:
+            if record is _NO_CHANGE:
+                continue
+            if isinstance(record, Removal):
+                self._add("removed_record", IndexEntry(element_type, name, record))
+            elif isinstance(record, Addition):
+                self._add("added_record", IndexEntry(element_type, name, record))
+            elif isinstance(record, (ChangedEvent, ChangedObject)):
+                self._add("changed_record", IndexEntry(element_type, name, record))
+                for attr_name, attr in record.attributes.items():
+                    self._add_attr(element_type, name, attr_name, attr)
+
+    def _add_attr(self, element_type: OcsfElementType, name: str, attr_name: str, attr: Difference[Any]) -> None:
+        if attr is _NO_CHANGE:
+            return
+        if isinstance(attr, Removal):
+            self._add("removed_attr", IndexEntry(element_type, name, attr, attr_name))
+        elif isinstance(attr, Addition):
+            self._add("added_attr", IndexEntry(element_type, name, attr, attr_name))
+        elif isinstance(attr, ChangedAttr):
+            self._add("changed_attr", IndexEntry(element_type, name, attr, attr_name))
+
+            for field in _ATTR_FIELDS:
+                value: Any = getattr(attr, field)
+                if type(value) is Change:
+                    entry = IndexEntry[Change[Any]](element_type, name, cast(Change[Any], value), attr_name)
+                    self._fields.setdefault((field, element_type), []).append(entry)
+
+            if isinstance(attr.enum, dict):
+                for key, member in attr.enum.items():
+                    if member is _NO_CHANGE:
+                        continue
+                    if isinstance(member, Removal):
+                        self._add("removed_member", IndexEntry(element_type, name, member, attr_name, key))
+                    elif isinstance(member, Addition):
+                        self._add("added_member", IndexEntry(element_type, name, member, attr_name, key))
+
+    def _lookup(
+        self, index: dict[tuple[str, OcsfElementType], list[Any]], kind: str, element_type: Optional[OcsfElementType]
+    ) -> list[Any]:
+        if element_type is not None:
+            return list(index.get((kind, element_type), ()))
+        return [entry for t in _RECORD_TYPES for entry in index.get((kind, t), ())]
+
+    def removed_records(
+        self, element_type: Optional[OcsfElementType] = None
+    ) -> list[IndexEntry[Removal[OcsfEvent | OcsfObject]]]:
+        """The removed events and objects."""
+        return self._lookup(self._entries, "removed_record", element_type)
+
+    def added_records(
+        self, element_type: Optional[OcsfElementType] = None
+    ) -> list[IndexEntry[Addition[OcsfEvent | OcsfObject]]]:
+        """The added events and objects."""
+        return self._lookup(self._entries, "added_record", element_type)
+
+    def changed_records(
+        self, element_type: Optional[OcsfElementType] = None
+    ) -> list[IndexEntry[ChangedEvent | ChangedObject]]:
+        """The changed events and objects."""
+        return self._lookup(self._entries, "changed_record", element_type)
+
+    def removed_attributes(self, element_type: Optional[OcsfElementType] = None) -> list[IndexEntry[Removal[OcsfAttr]]]:
+        """The removed attributes of changed events and objects."""
+        return self._lookup(self._entries, "removed_attr", element_type)
+
+    def added_attributes(self, element_type: Optional[OcsfElementType] = None) -> list[IndexEntry[Addition[OcsfAttr]]]:
+        """The added attributes of changed events and objects."""
+        return self._lookup(self._entries, "added_attr", element_type)
+
+    def changed_attributes(self, element_type: Optional[OcsfElementType] = None) -> list[IndexEntry[ChangedAttr]]:
+        """The changed attributes of changed events and objects."""
+        return self._lookup(self._entries, "changed_attr", element_type)
+
+    def changed_fields(
+        self, field: str, element_type: Optional[OcsfElementType] = None
+    ) -> list[IndexEntry[Change[Any]]]:
+        """The changes to one field of changed attributes, like "type" or "requirement"."""
+        return self._lookup(self._fields, field, element_type)
+
+    def removed_enum_members(
+        self, element_type: Optional[OcsfElementType] = None
+    ) -> list[IndexEntry[Removal[OcsfEnumMember]]]:
+        """The removed enum members of changed attributes."""
+        return self._lookup(self._entries, "removed_member", element_type)
+
+    def added_enum_members(
+        self, element_type: Optional[OcsfElementType] = None
+    ) -> list[IndexEntry[Addition[OcsfEnumMember]]]:
+        """The added enum members of changed attributes."""
+        return self._lookup(self._entries, "added_member", element_type)
@@ -0,0 +1,214 @@
+"""Compare OCSF schemas, diffing inherited attributes once.
+
+The export copies the attributes of base_event into every event, and the
+attributes of each parent (see `extends`) into its children. A change to one
+base attribute therefore appears in hundreds of events, and compare() finds and
+diffs it again in each of them.
+
+compare_inherited() compares base_event first, and each parent event or object
+before its children. When an attribute of a child is the same as the parent's
+attribute in the old schema and in the new schema, its difference is the
+parent's difference, which is reused rather than computed again. An attribute
+inherited unchanged isn't compared at all. The result is
+equal to compare(old, new), fully expanded: every event and object has its own
+dictionary of attribute differences. Reused differences are shared between
+events and objects, so treat the result as read-only.
+
+Inherited attributes are only recognized when they are the parent's instance
+(as in an interned schema, see intern_schema) or, with trust_fingerprints=True,
+have the same stored fingerprint (as in a schema loaded from a snapshot, see
+store_fingerprints), because comparing them with the parent's would cost as
+much as comparing them with each other. For schemas that are neither interned
+nor trusted to have current fingerprints, compare() is a little faster.
+"""
+
+from itertools import chain
+from typing import Any, Mapping, Optional, cast
+
+from ocsf_tools.schema import OcsfEvent, OcsfObject, OcsfSchema, stored_fingerprint
+from .compare import compare, comparison_plan, values_unchanged
+from .model import Addition, ChangedModel, ChangedSchema, Difference, NoChange, Removal, SparseDifferences
+
+_Record = OcsfEvent | OcsfObject
+
+
+def _same(child: Any, parent: Any, trust_fingerprints: bool) -> bool:
+    """Is an attribute known to be equal to its parent's without comparing them?
+
+    Only identity (as in an interned schema) and, if trusted, stored
+    fingerprints are used; a full comparison would cost as much as comparing
+    the attribute itself.
+    """
+    if child is parent:
+        return True
+    if not trust_fingerprints:
+        return False
+    digest = stored_fingerprint(child)
+    return digest is not None and digest == stored_fingerprint(parent)
+
+
+class _Records:
+    """Compares the events or objects of two schemas, parents before children."""
+
+    def __init__(
+        self,
+        old: Mapping[str, _Record],
+        new: Mapping[str, _Record],
+        sparse: bool,
+        root: Optional[tuple[_Record, _Record, Difference[Any]]] = None,
+        trust_fingerprints: bool = False,
+    ):
+        """Prepare to compare two dictionaries of events or objects.
+
+        Args:
+            old: The old events or objects.
+            new: The new events or objects.
+            sparse: Leave unchanged keys out of dictionaries in the result.
+            root: The old and new records that every record inherits from when
+                its parent isn't in the dictionaries (base_event), and their
+                difference.
+            trust_fingerprints: Use stored fingerprints. See compare_inherited.
+        """
+        self.old = old
+        self.new = new
+        self.sparse = sparse
+        self.root = root
+        self.trust_fingerprints = trust_fingerprints
+        self.diffs: dict[str, Difference[Any]] = {}
+
+    def _parent(self, key: str) -> Optional[tuple[_Record, _Record, Difference[Any]]]:
+        """The old and new parents of a record and their difference, if it has the same parent in both."""
+        old_extends = self.old[key].extends
+        if old_extends is None or old_extends != self.new[key].extends or old_extends == key:
+            return self.root
+
+        if old_extends in self.old and old_extends in self.new:
+            return self.old[old_extends], self.new[old_extends], self.difference(old_extends)
+
+        return self.root
+
+    def difference(self, key: str) -> Difference[Any]:
+        """The difference between the records at a key present in both dictionaries."""
+        known = self.diffs.get(key)
+        if known is not None:
+            return known
+
+        old_val = self.old[key]
+        new_val = self.new[key]
+        diff: Difference[Any]
+        if values_unchanged(old_val, new_val, self.trust_fingerprints):
+            diff = NoChange()
+        else:
+            # Mark the record while its parents are compared, in case of a cycle.
+            self.diffs[key] = NoChange()
+            parent = self._parent(key)
+            attributes = self._attributes(old_val.attributes, new_val.attributes, parent)
+            plan = comparison_plan(old_val.__class__)
+            diff = plan.compare(
+                old_val,
+                new_val,
+                self.sparse,
+                overrides={"attributes": attributes},
+                trust_fingerprints=self.trust_fingerprints,
+            )
+
+        self.diffs[key] = diff
+        return diff
+
+    def _attributes(
+        self,
+        old_attrs: Mapping[str, Any],
+        new_attrs: Mapping[str, Any],
+        parent: Optional[tuple[_Record, _Record, Difference[Any]]],
+    ) -> dict[str, Difference[Any]]:
+        """Compare the attributes of two records, reusing their parent's differences."""
+        ret: dict[str, Difference[Any]] = SparseDifferences(old_attrs, new_attrs) if self.sparse else {}
+        old_parent: Mapping[str, Any] = {}
+        new_parent: Mapping[str, Any] = {}
+        parent_diffs: Mapping[str, Difference[Any]] = {}
+        if parent is not None:
+            old_parent = parent[0].attributes
+            new_parent = parent[1].attributes
+            if isinstance(parent[2], ChangedModel):
+                parent_diffs = cast(Any, parent[2]).attributes
+
+        for key in dict.fromkeys(chain(old_attrs, new_attrs)):
+            if key not in new_attrs:
+                ret[key] = Removal(before=old_attrs[key])
+                continue
+            if key not in old_attrs:
+                ret[key] = Addition(after=new_attrs[key])
+                continue
+
+            old_val = old_attrs[key]
+            new_val = new_attrs[key]
+            if (
+                key in old_parent
+                and key in new_parent
+                and _same(old_val, old_parent[key], self.trust_fingerprints)
+                and _same(new_val, new_parent[key], self.trust_fingerprints)
+            ):
+                # Inherited in both schemas: the parent's difference, which
+                # is missing if the parent's attribute is unchanged.
+                diff = parent_diffs.get(key)
+            elif values_unchanged(old_val, new_val, self.trust_fingerprints):
+                diff = None
+            else:
+                diff = compare(old_val, new_val, self.sparse, trust_fingerprints=self.trust_fingerprints)
+
+            if diff is not None and not isinstance(diff, NoChange):
+                ret[key] = diff
+            elif not self.sparse:
+                ret[key] = NoChange()
+
+        return ret
+
+    def compare(self) -> dict[str, Difference[Any]]:
+        """Compare every record, in the order compare_dict uses."""
+        ret: dict[str, Difference[Any]] = SparseDifferences(self.old, self.new) if self.sparse else {}
+        for key in dict.fromkeys(chain(self.old, self.new)):
+            if key not in self.new:
+                ret[key] = Removal(before=self.old[key])
+            elif key not in self.old:
+                ret[key] = Addition(after=self.new[key])
+            else:
+                diff = self.difference(key)
+                if not (self.sparse and isinstance(diff, NoChange)):
+                    ret[key] = diff
+        return ret
+
+
+def compare_inherited(
+    old: OcsfSchema, new: OcsfSchema, sparse: bool = False, trust_fingerprints: bool = False
+) -> ChangedSchema:
+    """Compare two schemas, diffing attributes inherited from base_event or a parent once.
+
+    The result is equal to compare(old, new, sparse).
+
+    Args:
+        old: The old schema.
+        new: The new schema.
+        sparse: Leave unchanged keys out of dictionaries in the result. See
+            compare.
+        trust_fingerprints: Recognize inherited and unchanged models by their
+            stored fingerprints. Only use this if neither schema has been
+            modified since its fingerprints were stored. See compare.
+
+    Returns:
+        The ChangedSchema.
+    """
+    base_event = compare(old.base_event, new.base_event, sparse, trust_fingerprints=trust_fingerprints)
+    root = None
+    if old.base_event is not None and new.base_event is not None:
+        root = (old.base_event, new.base_event, cast(Difference[Any], base_event))
+
+    classes = _Records(old.classes, new.classes, sparse, root, trust_fingerprints).compare()
+    objects = _Records(old.objects, new.objects, sparse, None, trust_fingerprints).compare()
+
+    overrides = {"classes": classes, "objects": objects, "base_event": base_event}
+    return cast(
+        ChangedSchema,
+        comparison_plan(OcsfSchema).compare(
+            old, new, sparse, overrides=overrides, trust_fingerprints=trust_fingerprints
+        ),
+    )
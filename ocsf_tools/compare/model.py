@@ -21,7 +21,8 @@ Addition[T]─┼─Removal[T]   ChangedObject──┼──ChangedSchema
 At the top of the hierarchy is the abstract class Difference[T].
 
 NoChange is a special case of Difference that represents the absence of any
-difference. None is not used because T may be or contain NoneType.
+difference. None is not used because T may be or contain NoneType. NoChange is
+immutable and there is only one instance of it, shared by every comparison.
 
 The SimpleDifference[T] classes represent differences between any values.
 Addition[T] and Removal[T] represent changes to a set or dictionary, while
@@ -42,10 +43,15 @@ NoChange, or a ChangedModel.
 When modeling Optional dictionaries, be sure to use a type that is a Union of
 the appropriate dict and NoChange. See ChangedAttr.enum for an example.
 
+In sparse comparisons (see compare), dictionaries leave out keys whose values
+are unchanged. They are SparseDifferences, which remember the dictionaries that
+were compared so that unchanged keys can still be told apart from keys that
+were never present.
+
 """
 
 from dataclasses import dataclass, field
-from typing import Any, TypeVar, Generic, Optional
+from typing import Any, Iterator, Mapping, TypeVar, Generic, Optional
 from abc import ABC
 
 from ocsf_tools.schema import (
@@ -62,121 +68,194 @@ from ocsf_tools.schema import (
 
 
 T = TypeVar("T", covariant=True)
+K = TypeVar("K")
+V = TypeVar("V")
+
+
+# The difference classes use __slots__ rather than a per-instance __dict__,
+# because a comparison of two schemas creates a great many of them.
 
 
-class Difference(ABC, Generic[T]): ...
+class Difference(ABC, Generic[T]):
+    __slots__ = ()
 
 
-class SimpleDifference(Difference[T]): ...
+class SimpleDifference(Difference[T]):
+    __slots__ = ()
 
 
-@dataclass
+@dataclass(slots=True)
 class Addition(SimpleDifference[T]):
     after: T
 
 
-@dataclass
+@dataclass(slots=True)
 class Removal(SimpleDifference[T]):
     before: T
 
 
-@dataclass
+@dataclass(slots=True)
 class Change(SimpleDifference[T]):
     before: Optional[T]
     after: Optional[T]
 
 
-@dataclass
-class NoChange(Difference[T]): ...
+class NoChange(Difference[T]):
+    """The absence of a difference.
+
+    NoChange has no state, so there is only one instance of it: NoChange()
+    always returns the same object. It is immutable.
+    """
+
+    __slots__ = ()
+    _instance: "Optional[NoChange[Any]]" = None
+
+    def __new__(cls) -> "NoChange[T]":
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+        return cls._instance
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, NoChange)
+
+    def __hash__(self) -> int:
+        return hash(NoChange)
+
+    def __repr__(self) -> str:
+        return "NoChange()"
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return (NoChange, ())
+
+    def __copy__(self) -> "NoChange[T]":
+        return self
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> "NoChange[T]":
+        return self
+
+
+class ChangedModel(Difference[OcsfT]):
+    __slots__ = ()
+
+
+class SparseDifferences(dict[K, Difference[V]]):
+    """The differences between two dictionaries, without their unchanged keys.
+
+    Only keys that were added, removed, or changed are present. The compared
+    dictionaries are kept (by reference) to answer questions about the keys
+    that were left out.
+    """
+
+    def __init__(self, before: Mapping[K, V], after: Mapping[K, V]):
+        super().__init__()
+        self.before = before
+        self.after = after
+
+    def is_unchanged(self, key: K) -> bool:
+        """Was the key present in both dictionaries with an unchanged value?"""
+        return key not in self and key in self.before and key in self.after
+
+    def unchanged(self) -> Iterator[K]:
+        """The keys present in both dictionaries with unchanged values."""
+        return (key for key in self.before if key not in self and key in self.after)
 
+    def difference(self, key: K) -> "Difference[V]":
+        """The difference at a key, including NoChange for unchanged keys.
 
-class ChangedModel(Difference[OcsfT]): ...
+        Raises:
+            KeyError: If the key wasn't present in either dictionary.
+        """
+        if key in self:
+            return self[key]
+        if self.is_unchanged(key):
+            return NoChange()
+        raise KeyError(key)
 
 
 # class ChangedModel(ChangedModel[OcsfModel]): ...
 
 
-@dataclass
+@dataclass(slots=True)
 class ChangedVersion(ChangedModel[OcsfVersion]):
-    version: Difference[str] = field(default_factory=NoChange)
+    version: Difference[str] = NoChange()
 
 
-@dataclass
+@dataclass(slots=True)
 class ChangedEnumMember(ChangedModel[OcsfEnumMember]):
-    caption: Difference[str] = field(default_factory=NoChange)
-    description: Difference[Optional[str]] = field(default_factory=NoChange)
-    notes: Difference[Optional[str]] = field(default_factory=NoChange)
+    caption: Difference[str] = NoChange()
+    description: Difference[Optional[str]] = NoChange()
+    notes: Difference[Optional[str]] = NoChange()
 
 
-@dataclass
+@dataclass(slots=True)
 class ChangedDeprecationInfo(ChangedModel[OcsfDeprecationInfo]):
-    message: Difference[str] = field(default_factory=NoChange)
-    since: Difference[str] = field(default_factory=NoChange)
+    message: Difference[str] = NoChange()
+    since: Difference[str] = NoChange()
 
 
-@dataclass
+@dataclass(slots=True)
 class ChangedType(ChangedModel[OcsfType]):
-    caption: Difference[str] = field(default_factory=NoChange)
-    description: Difference[Optional[str]] = field(default_factory=NoChange)
-    is_array: Difference[bool] = field(default_factory=NoChange)
-    deprecated: Difference[Optional[ChangedDeprecationInfo]] = field(default_factory=NoChange)
-    max_len: Difference[Optional[int]] = field(default_factory=NoChange)
-    observable: Difference[Optional[int]] = field(default_factory=NoChange)
-    range: Difference[Optional[list[int]]] = field(default_factory=NoChange)
-    regex: Difference[Optional[str]] = field(default_factory=NoChange)
-    type: Difference[Optional[str]] = field(default_factory=NoChange)
-    type_name: Difference[Optional[str]] = field(default_factory=NoChange)
-    values: Difference[Optional[list[Any]]] = field(default_factory=NoChange)
-
-
-@dataclass
+    caption: Difference[str] = NoChange()
+    description: Difference[Optional[str]] = NoChange()
+    is_array: Difference[bool] = NoChange()
+    deprecated: Difference[Optional[ChangedDeprecationInfo]] = NoChange()
+    max_len: Difference[Optional[int]] = NoChange()
+    observable: Difference[Optional[int]] = NoChange()
+    range: Difference[Optional[list[int]]] = NoChange()
+    regex: Difference[Optional[str]] = NoChange()
+    type: Difference[Optional[str]] = NoChange()
+    type_name: Difference[Optional[str]] = NoChange()
+    values: Difference[Optional[list[Any]]] = NoChange()
+
+
+@dataclass(slots=True)
 class ChangedAttr(ChangedModel[OcsfAttr]):
-    caption: Difference[str] = field(default_factory=NoChange)
-    description: Difference[Optional[str]] = field(default_factory=NoChange)
-    requirement: Difference[str] = field(default_factory=NoChange)
-    type: Difference[str] = field(default_factory=NoChange)
-    is_array: Difference[bool] = field(default_factory=NoChange)
-    enum: dict[str, Difference[OcsfEnumMember]] | NoChange[None] = field(default_factory=NoChange)
-    group: Difference[Optional[str]] = field(default_factory=NoChange)
-    observable: Difference[Optional[int]] = field(default_factory=NoChange)
-    sibling: Difference[Optional[str]] = field(default_factory=NoChange)
-    profile: Difference[Optional[str | list[str]]] = field(default_factory=NoChange)
-    deprecated: Difference[Optional[OcsfDeprecationInfo]] = field(default_factory=NoChange)
-
-
-@dataclass
+    caption: Difference[str] = NoChange()
+    description: Difference[Optional[str]] = NoChange()
+    requirement: Difference[str] = NoChange()
+    type: Difference[str] = NoChange()
+    is_array: Difference[bool] = NoChange()
+    enum: dict[str, Difference[OcsfEnumMember]] | NoChange[None] = NoChange()
+    group: Difference[Optional[str]] = NoChange()
+    observable: Difference[Optional[int]] = NoChange()
+    sibling: Difference[Optional[str]] = NoChange()
+    profile: Difference[Optional[str | list[str]]] = NoChange()
+    deprecated: Difference[Optional[OcsfDeprecationInfo]] = NoChange()
+
+
+@dataclass(slots=True)
 class ChangedObject(ChangedModel[OcsfObject]):
-    caption: Difference[str] = field(default_factory=NoChange)
-    name: Difference[str] = field(default_factory=NoChange)
+    caption: Difference[str] = NoChange()
+    name: Difference[str] = NoChange()
     attributes: dict[str, Difference[OcsfAttr]] = field(default_factory=dict)
-    description: Difference[Optional[str]] = field(default_factory=NoChange)
-    extends: Difference[Optional[str]] = field(default_factory=NoChange)
-    observable: Difference[Optional[int]] = field(default_factory=NoChange)
-    profiles: Difference[Optional[list[str]]] = field(default_factory=NoChange)
-    constraints: Difference[Optional[dict[str, list[str]]]] = field(default_factory=NoChange)
-    deprecated: Difference[Optional[OcsfDeprecationInfo]] = field(default_factory=NoChange)
+    description: Difference[Optional[str]] = NoChange()
+    extends: Difference[Optional[str]] = NoChange()
+    observable: Difference[Optional[int]] = NoChange()
+    profiles: Difference[Optional[list[str]]] = NoChange()
+    constraints: Difference[Optional[dict[str, list[str]]]] = NoChange()
+    deprecated: Difference[Optional[OcsfDeprecationInfo]] = NoChange()
 
 
-@dataclass
+@dataclass(slots=True)
 class ChangedEvent(ChangedModel[OcsfEvent]):
-    caption: Difference[str] = field(default_factory=NoChange)
-    name: Difference[str] = field(default_factory=NoChange)
+    caption: Difference[str] = NoChange()
+    name: Difference[str] = NoChange()
     attributes: dict[str, Difference[OcsfAttr]] = field(default_factory=dict)
-    description: Difference[Optional[str]] = field(default_factory=NoChange)
-    uid: Difference[Optional[int]] = field(default_factory=NoChange)
-    category: Difference[Optional[str]] = field(default_factory=NoChange)
-    extends: Difference[Optional[str]] = field(default_factory=NoChange)
-    profiles: Difference[Optional[list[str]]] = field(default_factory=NoChange)
-    associations: Difference[Optional[dict[str, list[str]]]] = field(default_factory=NoChange)
-    constraints: Difference[Optional[dict[str, list[str]]]] = field(default_factory=NoChange)
-    include: Difference[Optional[str]] = field(default_factory=NoChange)
-    deprecated: Difference[Optional[OcsfDeprecationInfo]] = field(default_factory=NoChange)
-
-
-@dataclass
+    description: Difference[Optional[str]] = NoChange()
+    uid: Difference[Optional[int]] = NoChange()
+    category: Difference[Optional[str]] = NoChange()
+    extends: Difference[Optional[str]] = NoChange()
+    profiles: Difference[Optional[list[str]]] = NoChange()
+    associations: Difference[Optional[dict[str, list[str]]]] = NoChange()
+    constraints: Difference[Optional[dict[str, list[str]]]] = NoChange()
+    include: Difference[Optional[str]] = NoChange()
+    deprecated: Difference[Optional[OcsfDeprecationInfo]] = NoChange()
+
+
+@dataclass(slots=True)
 class ChangedSchema(ChangedModel[OcsfSchema]):
     classes: dict[str, Difference[OcsfEvent]] = field(default_factory=dict)
     objects: dict[str, Difference[OcsfObject]] = field(default_factory=dict)
-    version: Difference[OcsfVersion] = field(default_factory=NoChange)
+    version: Difference[OcsfVersion] = NoChange()
     types: dict[str, ChangedType] = field(default_factory=dict)
-    base_event: Difference[Optional[OcsfEvent]] = field(default_factory=NoChange)
+    base_event: Difference[Optional[OcsfEvent]] = NoChange()
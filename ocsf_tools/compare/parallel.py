@@ -0,0 +1,208 @@
+"""Compare OCSF schemas in parallel.
+
+Most of the work of comparing two schemas is comparing the events and objects
+that are present in both of them, and each of those comparisons is
+independent of the others. compare_parallel() splits the keys of a schema's
+classes and objects into chunks, compares the chunks in a pool of worker
+processes, and merges the results in the same order a serial comparison uses
+(old keys first, then new ones), so the result is equal to compare(old, new).
+
+Worker processes receive both schemas once, when they start. On platforms that
+fork, the schemas are inherited rather than copied. Starting the pool and
+sending the differences back costs time of its own, so small comparisons are
+done serially: see the cutoff argument.
+
+This module is experimental, and compare_parallel() isn't exported from
+ocsf_tools.compare. The only measurements so far were on a single CPU, where
+the workers can't run at once: with the cached schemas repeated ten times
+(about 1500 events and objects in both), it takes two to three times as long
+as compare(). Its speedup on several cores hasn't been measured yet; run
+benchmarks/parallel_compare.py on a multi-core machine before relying on it.
+
+Example:
+
+```python
+diff = compare_parallel(old_schema, new_schema, workers=8)
+```
+"""
+
+import multiprocessing
+import os
+
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import replace
+from itertools import chain
+from typing import Any, Iterator, Mapping, Optional, cast
+
+from ocsf_tools.schema import OcsfSchema
+from .compare import compare, comparison_plan, values_unchanged
+from .model import Addition, ChangedModel, ChangedSchema, Difference, NoChange, Removal, SparseDifferences
+
+# Below this many events and objects present in both schemas, compare serially.
+# Comparing costs about 0.1 ms per event or object, starting a pool about 35 ms,
+# and sending a difference back about 0.03 ms, so with 4 to 8 workers the pool
+# only pays off beyond roughly 650 to 850 of them. The core schema has about
+# 150 (153 from 1.1.0 to 1.2.0) and compares in about 10 ms, so only extended
+# schemas several times its size are compared in parallel.
+DEFAULT_CUTOFF = 800
+
+# Each worker gets about this many chunks, so that a chunk of slow comparisons
+# doesn't leave the other workers idle.
+_CHUNKS_PER_WORKER = 4
+
+_PARTITIONED = ("classes", "objects")
+
+# The schemas being compared, in a worker process.
+_old: Optional[OcsfSchema] = None
+_new: Optional[OcsfSchema] = None
+_sparse = False
+
+
+def _init_worker(old: OcsfSchema, new: OcsfSchema, sparse: bool) -> None:
+    global _old, _new, _sparse
+    _old = old
+    _new = new
+    _sparse = sparse
+
+
+def _sparse_differences(
+    diff: Any, old_val: Any, new_val: Any
+) -> Iterator[tuple[SparseDifferences[Any, Any], Mapping[Any, Any], Mapping[Any, Any]]]:
+    """The SparseDifferences in the sparse comparison of two models, with the dictionaries each compared.
+
+    Workers send differences back without those dictionaries, which are
+    copies of the schemas' own, and the parent process puts its own back.
+    """
+    plan = comparison_plan(old_val.__class__)
+    for attr in chain(plan.dicts, plan.optional_dicts):
+        value = getattr(diff, attr)
+        if isinstance(value, SparseDifferences):
+            sparse = cast(SparseDifferences[Any, Any], value)
+            # Like compare_dict, a missing optional dictionary is an empty one.
+            before: Mapping[Any, Any] = getattr(old_val, attr) or {}
+            after: Mapping[Any, Any] = getattr(new_val, attr) or {}
+            yield sparse, before, after
+            for key, sub in sparse.items():
+                if isinstance(sub, ChangedModel):
+                    yield from _sparse_differences(sub, before[key], after[key])
+
+    for attr in plan.models:
+        value = getattr(diff, attr)
+        if isinstance(value, ChangedModel):
+            yield from _sparse_differences(value, getattr(old_val, attr), getattr(new_val, attr))
+
+
+def _compare_chunk(attr: str, keys: list[str]) -> list[tuple[str, Difference[Any]]]:
+    """Compare the values at some keys of a schema dictionary, in a worker process.
+
+    Returns:
+        The keys whose values changed, with their differences. In a sparse
+        comparison, their SparseDifferences are sent without the compared
+        dictionaries: see _sparse_differences.
+    """
+    old_vals: Mapping[str, Any] = getattr(_old, attr)
+    new_vals: Mapping[str, Any] = getattr(_new, attr)
+    ret: list[tuple[str, Difference[Any]]] = []
+    for key in keys:
+        if not values_unchanged(old_vals[key], new_vals[key]):
+            diff = compare(old_vals[key], new_vals[key], _sparse)
+            if _sparse:
+                for sparse, _, _ in _sparse_differences(diff, old_vals[key], new_vals[key]):
+                    sparse.before = sparse.after = {}
+            ret.append((key, diff))
+    return ret
+
+
+def _mp_context() -> Any:
+    """Fork where possible, so that workers inherit the schemas instead of unpickling them."""
+    if "fork" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("fork")
+    return None
+
+
+def compare_parallel(
+    old: OcsfSchema,
+    new: OcsfSchema,
+    workers: Optional[int] = None,
+    cutoff: int = DEFAULT_CUTOFF,
+    sparse: bool = False,
+) -> ChangedSchema:
+    """Compare two schemas, comparing their events and objects in worker processes.
+
+    The result is equal to compare(old, new, sparse), and its dictionaries have
+    the same key order.
+
+    Args:
+        old: The old schema.
+        new: The new schema.
+        workers: The number of worker processes. Defaults to the number of CPUs.
+        cutoff: Compare serially if fewer than this many events and objects
+            are present in both schemas.
+        sparse: Leave unchanged keys out of dictionaries in the result. See
+            compare.
+
+    Returns:
+        The ChangedSchema.
+
+    Raises:
+        ValueError: If workers is less than 1.
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers < 1:
+        raise ValueError(f"workers must be at least 1, not {workers}")
+
+    shared = {attr: [key for key in getattr(old, attr) if key in getattr(new, attr)] for attr in _PARTITIONED}
+    total = sum(len(keys) for keys in shared.values())
+    if workers == 1 or total == 0 or total < cutoff:
+        return cast(ChangedSchema, compare(old, new, sparse))
+
+    # Everything but the partitioned dictionaries is compared here.
+    ret = cast(
+        ChangedSchema,
+        comparison_plan(OcsfSchema).compare(
+            replace(old, classes={}, objects={}), replace(new, classes={}, objects={}), sparse
+        ),
+    )
+
+    size = max(1, -(-total // (workers * _CHUNKS_PER_WORKER)))
+    tasks = [(attr, keys[i : i + size]) for attr, keys in shared.items() for i in range(0, len(keys), size)]
+    changed: dict[str, dict[str, Difference[Any]]] = {attr: {} for attr in _PARTITIONED}
+
+    with ProcessPoolExecutor(
+        max_workers=min(workers, len(tasks)),
+        mp_context=_mp_context(),
+        initializer=_init_worker,
+        initargs=(old, new, sparse),
+    ) as pool:
+        futures = [(attr, pool.submit(_compare_chunk, attr, keys)) for attr, keys in tasks]
+        for attr, future in futures:
+            changed[attr].update(future.result())
+
+    if sparse:
+        for attr, found in changed.items():
+            for key, diff in found.items():
+                for sparse_diff, before, after in _sparse_differences(
+                    diff, getattr(old, attr)[key], getattr(new, attr)[key]
+                ):
+                    sparse_diff.before = before
+                    sparse_diff.after = after
+
+    for attr in _PARTITIONED:
+        old_vals: Mapping[str, Any] = getattr(old, attr)
+        new_vals: Mapping[str, Any] = getattr(new, attr)
+        diffs: dict[str, Difference[Any]] = SparseDifferences(old_vals, new_vals) if sparse else {}
+
+        for key in dict.fromkeys(chain(old_vals, new_vals)):
+            if key not in new_vals:
+                diffs[key] = Removal(before=old_vals[key])
+            elif key not in old_vals:
+                diffs[key] = Addition(after=new_vals[key])
+            elif key in changed[attr]:
+                diffs[key] = changed[attr][key]
+            elif not sparse:
+                diffs[key] = NoChange()
+
+        setattr(ret, attr, diffs)
+
+    return ret
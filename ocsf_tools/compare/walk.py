@@ -0,0 +1,155 @@
+"""Stream the differences between two OCSF schemata.
+
+iter_differences() walks two values the way compare() does, but instead of
+building a tree of ChangedModels it yields each difference as soon as it is
+found, as a flat record of its path and the difference at that path:
+
+```
+(("classes", "process_activity", "attributes", "actor", "requirement"), Change(before="optional", after="required"))
+```
+
+Paths are made of field names and dictionary keys. Only differences are
+yielded: the leaves of a sparse comparison, which are Additions, Removals,
+and Changes. Nothing is kept once it is yielded, so the memory used doesn't
+grow with the size of the schemas or the number of changes.
+
+Prefix filters restrict the walk to some branches. Branches that can't lead to
+a path matching a filter are skipped before their values are compared, and
+values above a filter, like the whole schema, are descended into without
+being compared as a whole. Unchanged values are recognized with the same
+checks as compare() uses (see values_unchanged), including stored
+fingerprints if they are trusted.
+
+Example:
+
+```python
+for path, diff in iter_differences(old, new, prefixes=[("classes", "file_activity")]):
+    print(".".join(path), diff)
+```
+"""
+
+from itertools import chain
+from typing import Any, Iterable, Iterator, Mapping, Optional, Sequence
+
+from ocsf_tools.schema import OcsfModel
+from .compare import comparison_plan, values_unchanged
+from .model import Addition, Change, Difference, Removal
+
+Path = tuple[str, ...]
+_Filters = Optional[list[Path]]
+
+
+def _wanted(path: Path, filters: _Filters) -> bool:
+    """Can a path, or a path beneath it, match one of the filters?"""
+    if filters is None:
+        return True
+    return any(path[: len(f)] == f[: len(path)] for f in filters)
+
+
+def _covered(path: Path, filters: _Filters) -> bool:
+    """Does every path beneath a path match one of the filters?
+
+    Only then is it worth comparing the values at the path as a whole before
+    descending into them: otherwise, most of what they hold is pruned anyway.
+    """
+    if filters is None:
+        return True
+    return any(path[: len(f)] == f for f in filters)
+
+
+def _walk(
+    path: Path, old_val: Any, new_val: Any, filters: _Filters, trust_fingerprints: bool, check: bool
+) -> Iterator[tuple[Path, Difference[Any]]]:
+    """Yield the differences between two values found at a path.
+
+    If check is False, the values are already known to differ, or aren't
+    worth comparing as a whole (see _covered).
+    """
+    if isinstance(old_val, OcsfModel) and old_val.__class__ is new_val.__class__:
+        if check and values_unchanged(old_val, new_val, trust_fingerprints):
+            return
+
+        plan = comparison_plan(old_val.__class__)
+        for attr in chain(plan.dicts, plan.optional_dicts):
+            sub = path + (attr,)
+            if _wanted(sub, filters):
+                yield from _walk_dict(sub, getattr(old_val, attr), getattr(new_val, attr), filters, trust_fingerprints)
+
+        for attr in plan.models:
+            sub = path + (attr,)
+            if _wanted(sub, filters):
+                yield from _walk(
+                    sub,
+                    getattr(old_val, attr),
+                    getattr(new_val, attr),
+                    filters,
+                    trust_fingerprints,
+                    _covered(sub, filters),
+                )
+
+        for attr in plan.primitives:
+            sub = path + (attr,)
+            if _wanted(sub, filters):
+                old_attr = getattr(old_val, attr)
+                new_attr = getattr(new_val, attr)
+                if old_attr != new_attr:
+                    yield sub, Change(before=old_attr, after=new_attr)
+
+    elif old_val != new_val:
+        yield path, Change(before=old_val, after=new_val)
+
+
+def _walk_dict(
+    path: Path,
+    old_val: Optional[Mapping[Any, Any]],
+    new_val: Optional[Mapping[Any, Any]],
+    filters: _Filters,
+    trust_fingerprints: bool,
+) -> Iterator[tuple[Path, Difference[Any]]]:
+    """Yield the differences between two dictionaries (or None) found at a path."""
+    if old_val is None:
+        old_val = {}
+
+    if new_val is None:
+        new_val = {}
+
+    for key in dict.fromkeys(chain(old_val, new_val)):
+        sub = path + (key,)
+        if not _wanted(sub, filters):
+            continue
+
+        if key not in new_val:
+            yield sub, Removal(before=old_val[key])
+        elif key not in old_val:
+            yield sub, Addition(after=new_val[key])
+        elif not _covered(sub, filters) or not values_unchanged(old_val[key], new_val[key], trust_fingerprints):
+            yield from _walk(sub, old_val[key], new_val[key], filters, trust_fingerprints, False)
+
+
+def iter_differences(
+    old_val: Any, new_val: Any, prefixes: Optional[Iterable[Sequence[str]]] = None, trust_fingerprints: bool = False
+) -> Iterator[tuple[Path, Difference[Any]]]:
+    """Yield the differences between two values as (path, Difference) records.
+
+    The records are the leaves of compare(old_val, new_val, sparse=True): an
+    Addition or Removal for each added or removed dictionary key, and a Change
+    for each changed field or value. Models are descended into rather than
+    yielded. Dictionary keys are visited in the same order as in compare.
+
+    Args:
+        old_val: The old value, usually an OcsfSchema.
+        new_val: The new value.
+        prefixes: Only yield differences whose path starts with one of these
+            paths, like ("classes", "file_activity"). Branches that can't
+            match are not compared. By default, every difference is yielded.
+        trust_fingerprints: Treat models with equal stored fingerprints as
+            unchanged without comparing them, like compare. Only use this if
+            neither value has been modified since its fingerprints were
+            stored.
+
+    Yields:
+        The path of each difference, as a tuple of field names and
+        dictionary keys, and the difference.
+    """
+    filters = None if prefixes is None else [tuple(prefix) for prefix in prefixes]
+    return _walk((), old_val, new_val, filters, trust_fingerprints, _covered((), filters))
@@ -5,13 +5,18 @@ Most of what you'll find here is glue code to combine configuration from CLI
 arguments and an optional TOML file. Skip to the bottom to see a validator
 initialized and run.
 
-This module uses `get_schema` to load the schemas to be compared from either a
-local file or, if a version number is used, the OCSF server (or a cached copy).
+This module uses `get_schema_async` to load the schemas to be compared from
+either a local file or, if a version number is used, the OCSF server (or a
+cached copy). Both schemas are loaded concurrently.
 
 Valid TOML configuration options are:
-- before: The path or version of the "before" schema.
+- before: The path or version of the "before" schema. Versions may also be
+  "latest" or a major or minor version like "1.x" or "1.2".
 - after: The path or version of the "after" schema.
 - cache: The path to the schema cache directory.
+- rename_similarity: How similar (0 to 1) the caption of an added element must
+  be to that of a removed one for the removal to be reported as a rename.
+  Identical captions always match.
 - severity: A dictionary of finding names to severities. Severity may be one of
   "info", "warning", "error", or "fatal".
 
@@ -27,6 +32,9 @@ options:
                         Path to the schema file before the change
   --cache CACHE         Path to the schema cache directory
   --config CONFIG       Path to the config.toml file
+  --rename-similarity RENAME_SIMILARITY
+                        Report removals as renames if a similar caption (0 to
+                        1) was added
   --info [INFO ...]     A finding to assign an info severity to
   --warning [WARNING ...]
                         A finding to assign an warning severity to
@@ -55,13 +63,14 @@ Validate schemata but don't worry about removed enum members:
 
 """
 
+import asyncio
 import tomllib
 from argparse import ArgumentParser
 from typing import cast
 from urllib.error import URLError
 from termcolor import colored
 
-from ocsf_tools.schema import get_schema, OcsfServerClient
+from ocsf_tools.schema import get_schema_async, AsyncOcsfServerClient, OcsfSchema
 from ocsf_tools.validation import (
     Severity,
     ColoringValidationFormatter,
@@ -88,12 +97,20 @@ config = {
 # Default finding names x severities
 severities: dict[str, Severity] = {}
 
+# Caption similarity for rename detection; only identical captions by default
+rename_similarity: float | None = None
+
 # Configure parser
 parser = ArgumentParser(description="Validate compatibility between two OCSF schemas")
 parser.add_argument("--before", "-b", help="Path to the schema file before the change")
 parser.add_argument("--after", "-a", help="Path to the schema file before the change")
 parser.add_argument("--cache", help="Path to the schema cache directory")
 parser.add_argument("--config", help="Path to the config.toml file")
+parser.add_argument(
+    "--rename-similarity",
+    type=float,
+    help="Report removals as renames if a similar caption (0 to 1) was added",
+)
 parser.add_argument("--info", nargs="*", action="append", help="A finding to assign an info severity to")
 parser.add_argument("--warning", nargs="*", action="append", help="A finding to assign a warning severity to")
 parser.add_argument("--error", nargs="*", action="append", help="A finding to assign an error severity to")
@@ -115,6 +132,8 @@ if args.config:
             config["after"] = conf["after"]
         if "cache" in conf:
             config["cache"] = conf["cache"]
+        if "rename_similarity" in conf:
+            rename_similarity = float(conf["rename_similarity"])
         if "severity" in conf:
             sevs = conf["severity"]
             if isinstance(sevs, dict):
@@ -130,6 +149,9 @@ if args.after:
 if args.cache:
     config["cache"] = args.cache
 
+if args.rename_similarity is not None:
+    rename_similarity = args.rename_similarity
+
 if args.info:
     for finding in args.info:
         for f in finding:
@@ -163,17 +185,25 @@ if "after" not in config:
     print("Missing after schema file or version")
     exit(1)
 
+
+async def load_schemas(before: str, after: str) -> tuple[OcsfSchema, OcsfSchema]:
+    """Load the before and after schemas concurrently."""
+    client = AsyncOcsfServerClient(cache_dir=config.get("cache", None))
+    return await asyncio.gather(get_schema_async(before, client), get_schema_async(after, client))
+
+
 # Load the schemas
-client = OcsfServerClient(cache_dir=config.get("cache", None))
 try:
-    before = get_schema(config["before"], client)
-    after = get_schema(config["after"], client)
+    before, after = asyncio.run(load_schemas(config["before"], config["after"]))
 except URLError:
     print("Unable to communicate with the OCSF server")
     exit(1)
 
-# Configure a validator and run it
-validator = CompatibilityValidator(cast(ChangedSchema, compare(before, after)), severities)
+# Configure a validator and run it. The schemas were just loaded and aren't
+# modified, so fingerprints stored in their snapshots are current.
+validator = CompatibilityValidator(
+    cast(ChangedSchema, compare(before, after, sparse=True, trust_fingerprints=True)), severities, rename_similarity
+)
 results = validator.validate()
 
 print()
@@ -1,7 +1,8 @@
 """A validation rule to identify changed attribute types."""
 
 from dataclasses import dataclass
-from ocsf_tools.compare import ChangedSchema, Change, ChangedEvent, ChangedObject, ChangedAttr
+from typing import Optional, cast
+from ocsf_tools.compare import ChangedSchema, DiffIndex
 from ocsf_tools.schema import OcsfElementType
 from ocsf_tools.validation import Rule, Finding, RuleMetadata
 
@@ -31,34 +32,19 @@ class NoIncreasedRequirementsRule(Rule[ChangedSchema]):
     def metadata(self):
         return RuleMetadata("No increased requirements", description=_RULE_DESCRIPTION)
 
-    def validate(self, context: ChangedSchema) -> list[Finding]:
+    def validate(self, context: ChangedSchema, index: Optional[DiffIndex] = None) -> list[Finding]:
         findings: list[Finding] = []
-        for name, event in context.classes.items():
-            if isinstance(event, ChangedEvent):
-                for attr_name, attr in event.attributes.items():
-                    if isinstance(attr, ChangedAttr):
-                        if isinstance(attr.requirement, Change) and attr.requirement.after == "required":
-                            findings.append(
-                                IncreasedRequirementFinding(
-                                    OcsfElementType.EVENT,
-                                    (name, attr_name),
-                                    attr.requirement.before,
-                                    attr.requirement.after,
-                                )
-                            )
-
-        for name, obj in context.objects.items():
-            if isinstance(obj, ChangedObject):
-                for attr_name, attr in obj.attributes.items():
-                    if isinstance(attr, ChangedAttr):
-                        if isinstance(attr.requirement, Change) and attr.requirement.after == "required":
-                            findings.append(
-                                IncreasedRequirementFinding(
-                                    OcsfElementType.OBJECT,
-                                    (name, attr_name),
-                                    attr.requirement.before,
-                                    attr.requirement.after,
-                                )
-                            )
+        if index is None:
+            index = DiffIndex(context)
+        for entry in index.changed_fields("requirement"):
+            if entry.diff.after == "required":
+                findings.append(
+                    IncreasedRequirementFinding(
+                        entry.element_type,
+                        (entry.name, cast(str, entry.attr)),
+                        entry.diff.before,
+                        entry.diff.after,
+                    )
+                )
 
         return findings
@@ -5,14 +5,25 @@ record. This is to allow for flexibility in configuring the severity of the
 findings.
 
 Renaming is detected when an element is removed *and* an element with the same
-caption or class_uid is added to the same set.
+caption or class_uid is added to the same set. Optionally, an added element with
+a similar caption also counts (see NoRemovedRecordsRule).
+
+The additions to each set are indexed by caption and class_uid once, so that
+each removal is matched with a lookup rather than a scan of the set. When more
+than one addition matches, the first one in the set is used. Captions are also
+indexed by length, so that a removal is only measured for similarity against
+the captions long or short enough to reach the threshold, and the most similar
+is found by measuring the likeliest candidates first.
 """
 
+from bisect import bisect_left, bisect_right
 from dataclasses import dataclass
-from typing import Optional, Literal
+from difflib import SequenceMatcher
+from math import ceil, floor
+from typing import Any, Iterable, Optional, Literal, cast
 
-from ocsf_tools.schema import OcsfElementType
-from ocsf_tools.compare import ChangedSchema, Removal, Addition, ChangedEvent, ChangedObject, ChangedAttr
+from ocsf_tools.schema import OcsfElementType, OcsfEvent, fingerprint
+from ocsf_tools.compare import ChangedSchema, Removal, Addition, ChangedAttr, DiffIndex
 from ocsf_tools.validation import Rule, Finding, RuleMetadata
 
 
@@ -102,149 +113,194 @@ removal, and so is still a breaking change.
 """
 
 
+class _Additions:
+    """The additions to a set of schema elements, indexed to find renames."""
+
+    def __init__(self, additions: Iterable[tuple[str, Any]], similarity: Optional[float] = None):
+        """Index additions by caption and class_uid.
+
+        Args:
+            additions: The keys of the added elements and the elements, in order.
+            similarity: The similarity (0 to 1) at which captions are considered
+                to match, or None to only match identical captions.
+        """
+        self._similarity = similarity
+        self._captions: dict[str, tuple[int, str]] = {}
+        self._uids: dict[str, tuple[int, str]] = {}
+
+        for position, (key, added) in enumerate(additions):
+            self._captions.setdefault(added.caption, (position, key))
+            uid = _class_uid(added)
+            if uid is not None:
+                self._uids.setdefault(uid, (position, key))
+
+        # The distinct captions by length. Two strings of lengths a and b are at
+        # most 2 * min(a, b) / (a + b) similar, so only a range of lengths can
+        # reach the threshold.
+        self._by_length = sorted(self._captions, key=len)
+        self._lengths = [len(caption) for caption in self._by_length]
+
+    def _closest(self, caption: str, cutoff: float) -> Optional[str]:
+        """The most similar caption at least cutoff similar, like difflib.get_close_matches(n=1)."""
+        size = len(caption)
+        if cutoff > 0:
+            # The bounds are widened a little against rounding; the ratios decide.
+            lo = bisect_left(self._lengths, ceil(size * cutoff / (2 - cutoff) - 1e-9))
+            hi = bisect_right(self._lengths, floor(size * (2 - cutoff) / cutoff + 1e-9))
+        else:
+            lo, hi = 0, len(self._lengths)
+
+        matcher = SequenceMatcher()
+        matcher.set_seq2(caption)
+        bounds: list[tuple[float, str]] = []
+        for candidate in self._by_length[lo:hi]:
+            matcher.set_seq1(candidate)
+            bound = matcher.quick_ratio()
+            if bound >= cutoff:
+                bounds.append((bound, candidate))
+
+        # quick_ratio is an upper bound of ratio, which is much slower, so the
+        # candidates are measured from the highest bound down until no other
+        # can beat (or tie with) the best so far.
+        bounds.sort(reverse=True)
+        best: Optional[tuple[float, str]] = None
+        for bound, candidate in bounds:
+            if best is not None and bound < best[0]:
+                break
+            matcher.set_seq1(candidate)
+            score = (matcher.ratio(), candidate)
+            # Ties go to the greater caption, as in get_close_matches.
+            if score[0] >= cutoff and (best is None or score > best):
+                best = score
+        return None if best is None else best[1]
+
+    def renamed_to(self, removed: Any) -> Optional[str]:
+        """The key of the first addition that looks like a rename of a removed element."""
+        caption: str = removed.caption
+        matches: list[tuple[int, str]] = []
+        if caption in self._captions:
+            matches.append(self._captions[caption])
+        uid = _class_uid(removed)
+        if uid is not None and uid in self._uids:
+            matches.append(self._uids[uid])
+
+        if not matches and self._similarity is not None:
+            close = self._closest(caption, self._similarity)
+            if close is not None:
+                matches.append(self._captions[close])
+
+        return min(matches)[1] if matches else None
+
+
+def _class_uid(element: Any) -> Optional[str]:
+    """The fingerprint of the class_uid attribute of an event, if it has one.
+
+    Attributes with equal content have equal fingerprints.
+    """
+    if isinstance(element, OcsfEvent) and "class_uid" in element.attributes:
+        return fingerprint(element.attributes["class_uid"])
+    return None
+
+
 class NoRemovedRecordsRule(Rule[ChangedSchema]):
     """A rule to identify removed or renamed objects, events, attributes, and enums."""
 
+    def __init__(self, similarity: Optional[float] = None):
+        """Initialize the rule.
+
+        Args:
+            similarity: Also report a removed element as renamed if an element
+                with a caption at least this similar (from 0 to 1, as measured
+                by difflib) was added. By default, only identical captions and
+                class_uids identify renames.
+
+        Raises:
+            ValueError: If similarity is not between 0 and 1.
+        """
+        if similarity is not None and not 0 <= similarity <= 1:
+            raise ValueError(f"similarity must be between 0 and 1, not {similarity}")
+        self._similarity = similarity
+
     def metadata(self):
         return RuleMetadata("No removed or renamed schema elements", description=_RULE_DESCRIPTION)
 
-    def validate(self, context: ChangedSchema) -> list[Finding]:
+    def validate(self, context: ChangedSchema, index: Optional[DiffIndex] = None) -> list[Finding]:
         """Search changed objects and events in the schema to identify any removed or renamed elements."""
 
-        # This rule has a lot of loops. It could be rewritten as one large outer
-        # loop, but it's intentionally separated into three outer loops for
-        # readability (and perhaps should be separated into more). Those loops
-        # implement the following operations:
+        # The rule works in three steps:
         #   1. Search for renamed or removed events
         #   2. Search for renamed or removed objects
         #   3. Search for renamed or removed attributes and enum members
         #
+        # In each step, the additions are indexed first, and then each removal
+        # is looked up in the index.
 
         findings: list[Finding] = []
-
-        ###
-        # Loop 1: Search for renamed or removed events
-        #
-        # Psuedo code:
-        # for each removed event:
-        #     for each added event:
-        #         if added event has same caption or class_uid as removed event:
-        #             add renamed event finding
-        #     if no renamed event finding was added:
-        #         add removed event finding
-        for name, event in context.classes.items():
-            if isinstance(event, Removal):
-                found = False
-                for _, added in context.classes.items():
-                    print(added)
-                    if isinstance(added, Addition):
-                        # An addition with the same caption or class_uid as the removed event is probably a rename
-                        if (added.after.caption == event.before.caption) or (
-                            "class_uid" in added.after.attributes
-                            and "class_uid" in event.before.attributes
-                            and added.after.attributes["class_uid"] == event.before.attributes["class_uid"]
-                        ):
-                            findings.append(
-                                RenamedEventFinding(event.before.name, added.after.name, event.before.caption)
-                            )
-                            found = True
-                            break
-
-                if not found:
-                    findings.append(RemovedEventFinding(name, event.before.caption))
-
-        ###
-        # Loop 2: Search for renamed or removed objects
-        #
-        # Psuedo code:
-        # for each removed object:
-        #     for each added object:
-        #         if added object has same caption as removed object:
-        #             add renamed object finding
-        #     if no renamed object finding was added:
-        #         add removed object finding
-        for name, obj in context.objects.items():
-            if isinstance(obj, Removal):
-                found = False
-                for _, added in context.objects.items():
-                    if isinstance(added, Addition):
-                        # An addition with the same caption as the removed object is probably a rename
-                        if added.after.caption == obj.before.caption:
-                            findings.append(RenamedObjectFinding(obj.before.name, added.after.name, obj.before.caption))
-                            found = True
-                            break
-
-                if not found:
-                    findings.append(RemovedObjectFinding(name, obj.before.caption))
-
-        ###
-        # Loop 3: Search for renamed or removed attributes and enum members
-        #
-        # Psuedo code:
-        # for each changed event or object:
-        #    for each attribute:
-        #        if attribute was removed:
-        #           for each added attribute:
-        #               if added attribute has same caption as removed attribute:
-        #                   add renamed attribute finding
-        #           if no renamed attribute finding was added:
-        #               add removed attribute finding
-        #
-        #        if attribute was changed and has an enum:
-        #            for each enum member:
-        #                if enum member was removed:
-        #                    for each added enum member:
-        #                        if added enum member has same caption as removed enum member:
-        #                            add renamed enum member finding
-        #                    if no renamed enum member finding was added:
-        #                        add removed enum member finding
-        #
-
-        # First, build a combined list of changed events and objects
-        changed_records = [
-            (name, OcsfElementType.EVENT, event)
-            for name, event in context.classes.items()
-            if isinstance(event, ChangedEvent)
-        ] + [
-            (name, OcsfElementType.OBJECT, obj)
-            for name, obj in context.objects.items()
-            if isinstance(obj, ChangedObject)
-        ]
-
-        # Now loop over that list
-        for name, kind, record in changed_records:
-            for attr_name, attr in record.attributes.items():
+        if index is None:
+            index = DiffIndex(context)
+
+        # Step 1: Search for renamed or removed events
+        added = _Additions(
+            ((entry.name, entry.diff.after) for entry in index.added_records(OcsfElementType.EVENT)),
+            self._similarity,
+        )
+        for entry in index.removed_records(OcsfElementType.EVENT):
+            event = entry.diff.before
+            renamed = added.renamed_to(event)
+            if renamed is not None:
+                after = cast(Addition[OcsfEvent], context.classes[renamed]).after
+                findings.append(RenamedEventFinding(event.name, after.name, event.caption))
+            else:
+                findings.append(RemovedEventFinding(entry.name, event.caption))
+
+        # Step 2: Search for renamed or removed objects
+        added = _Additions(
+            ((entry.name, entry.diff.after) for entry in index.added_records(OcsfElementType.OBJECT)),
+            self._similarity,
+        )
+        for entry in index.removed_records(OcsfElementType.OBJECT):
+            obj = entry.diff.before
+            renamed = added.renamed_to(obj)
+            if renamed is not None:
+                after = cast(Addition[Any], context.objects[renamed]).after
+                findings.append(RenamedObjectFinding(obj.name, after.name, obj.caption))
+            else:
+                findings.append(RemovedObjectFinding(entry.name, obj.caption))
+
+        # Step 3: Search for renamed or removed attributes and enum members of
+        # each changed event and object
+        for entry in index.changed_records():
+            name = entry.name
+            kind = cast(Literal[OcsfElementType.EVENT] | Literal[OcsfElementType.OBJECT], entry.element_type)
+            attrs = entry.diff.attributes
+
+            added_attrs = _Additions(
+                ((k, a.after) for k, a in attrs.items() if isinstance(a, Addition)), self._similarity
+            )
+            for attr_name, attr in attrs.items():
                 if isinstance(attr, Removal):
-                    # Before calling the attribute removed, look to see if it's been renamed
-                    found = False
-                    for added_name, added in record.attributes.items():
-                        if isinstance(added, Addition) and added.after.caption == attr.before.caption:
-                            findings.append(RenamedAttrFinding(attr_name, added_name, attr.before.caption, kind, name))
-                            found = True
-                            break
-
-                    # Nope, it was removed
-                    if not found:
+                    renamed = added_attrs.renamed_to(attr.before)
+                    if renamed is not None:
+                        findings.append(RenamedAttrFinding(attr_name, renamed, attr.before.caption, kind, name))
+                    else:
                         findings.append(RemovedAttrFinding(attr_name, attr.before.caption, kind, name))
 
                 elif isinstance(attr, ChangedAttr) and isinstance(attr.enum, dict):
                     # The attribute was changed; were any enum members removed or renamed?
-                    for member_key, member in attr.enum.items():
+                    members = attr.enum
+                    added_members = _Additions(
+                        ((k, m.after) for k, m in members.items() if isinstance(m, Addition)), self._similarity
+                    )
+                    for member_key, member in members.items():
                         if isinstance(member, Removal):
-                            # Before calling the enum member removed, look to see if it's been renamed
-                            found = False
-                            for added_key, added in attr.enum.items():
-                                if isinstance(added, Addition) and added.after.caption == member.before.caption:
-                                    findings.append(
-                                        RenamedEnumMemberFinding(
-                                            member_key, added_key, member.before.caption, kind, (name, attr_name)
-                                        )
+                            renamed = added_members.renamed_to(member.before)
+                            if renamed is not None:
+                                findings.append(
+                                    RenamedEnumMemberFinding(
+                                        member_key, renamed, member.before.caption, kind, (name, attr_name)
                                     )
-                                    found = True
-                                    break
-
-                            # Nope, it was removed
-                            if not found:
+                                )
+                            else:
                                 findings.append(
                                     RemovedEnumMemberFinding(member_key, member.before.caption, kind, (name, attr_name))
                                 )
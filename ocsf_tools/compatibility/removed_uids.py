@@ -1,7 +1,9 @@
 """A validation rule to identify changed class UIDs."""
 
 from dataclasses import dataclass
-from ocsf_tools.compare import ChangedSchema, NoChange, ChangedEvent, ChangedAttr, Removal, Addition
+from typing import Optional
+from ocsf_tools.compare import ChangedSchema, DiffIndex
+from ocsf_tools.schema import OcsfElementType
 from ocsf_tools.validation import Rule, Finding, RuleMetadata
 
 
@@ -25,22 +27,18 @@ class NoChangedClassUidsRule(Rule[ChangedSchema]):
     def metadata(self):
         return RuleMetadata("No changed class UIDs", description=_RULE_DESCRIPTION)
 
-    def validate(self, context: ChangedSchema) -> list[Finding]:
-        findings: list[Finding] = []
-        for name, event in context.classes.items():
-            if isinstance(event, ChangedEvent):
-                if "class_uid" in event.attributes and isinstance(event.attributes["class_uid"], ChangedAttr):
-                    uid = event.attributes["class_uid"]
-                    if not isinstance(uid.enum, NoChange):
-                        before: str | None = None
-                        after: str | None = None
-                        for k, v in uid.enum.items():
-                            if isinstance(v, Removal):
-                                before = k
-                            elif isinstance(v, Addition):
-                                after = k
-
-                        if before is not None and after is not None:
-                            findings.append(ChangedClassUidFinding(name, before, after))
-
-        return findings
+    def validate(self, context: ChangedSchema, index: Optional[DiffIndex] = None) -> list[Finding]:
+        if index is None:
+            index = DiffIndex(context)
+
+        # The last removed and added class_uid enum members of each event.
+        before: dict[str, str] = {}
+        after: dict[str, str] = {}
+        for entry in index.removed_enum_members(OcsfElementType.EVENT):
+            if entry.attr == "class_uid" and entry.member is not None:
+                before[entry.name] = entry.member
+        for entry in index.added_enum_members(OcsfElementType.EVENT):
+            if entry.attr == "class_uid" and entry.member is not None:
+                after[entry.name] = entry.member
+
+        return [ChangedClassUidFinding(name, uid, after[name]) for name, uid in before.items() if name in after]
@@ -1,7 +1,10 @@
 """A backwards compatibility validator."""
 
-from ocsf_tools.compare import ChangedSchema
-from ocsf_tools.validation import Rule, Validator
+from typing import Optional
+
+from ocsf_tools.compare import ChangedSchema, DiffIndex
+from ocsf_tools.validation import Finding, Rule, Severity, Validator
+from ocsf_tools.validation.validator import ValidationFindings
 
 from .changed_type import NoChangedTypesRule
 from .increased_requirement import NoIncreasedRequirementsRule
@@ -10,10 +13,46 @@ from .removed_uids import NoChangedClassUidsRule
 
 
 class CompatibilityValidator(Validator[ChangedSchema]):
+    def __init__(
+        self,
+        context: ChangedSchema,
+        severities: Optional[dict[str, Severity]] = None,
+        rename_similarity: Optional[float] = None,
+    ):
+        """Initialize the validator.
+
+        Args:
+            context: The comparison of the schemas to validate.
+            severities: A mapping of finding class names to severity levels.
+            rename_similarity: The caption similarity at which a removed element
+                is reported as renamed. See NoRemovedRecordsRule.
+        """
+        super().__init__(context, severities)
+        self._rename_similarity = rename_similarity
+        self._index: Optional[DiffIndex] = None
+
     def rules(self) -> list[Rule[ChangedSchema]]:
         return [
-            NoRemovedRecordsRule(),
+            NoRemovedRecordsRule(self._rename_similarity),
             NoChangedClassUidsRule(),
             NoIncreasedRequirementsRule(),
             NoChangedTypesRule(),
         ]
+
+    def _run(self, rule: Rule[ChangedSchema]) -> list[Finding]:
+        if self._index is not None and isinstance(rule, _INDEXED_RULES):
+            return rule.validate(self.context, self._index)
+        return super()._run(rule)
+
+    def validate(self) -> ValidationFindings[ChangedSchema]:
+        # The rules share one index of the context, built for this run so that
+        # it reflects the context as it is now.
+        self._index = DiffIndex(self.context)
+        try:
+            return super().validate()
+        finally:
+            self._index = None
+
+
+# The rules that accept a DiffIndex of the context.
+_INDEXED_RULES = (NoRemovedRecordsRule, NoChangedClassUidsRule, NoIncreasedRequirementsRule, NoChangedTypesRule)
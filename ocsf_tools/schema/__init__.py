@@ -10,12 +10,41 @@ from .model import (
     OcsfT,
     OcsfType,
     OcsfVersion,
+    freeze,
+    is_frozen,
 )
-from .json import from_json, to_json, to_dict, from_file, to_file, keys_to_names, names_to_keys
-from .http import OcsfServerClient, from_http
+from .fingerprint import fingerprint, fingerprints, has_fingerprint, store_fingerprints, stored_fingerprint
+from .intern import InternPool, InternStats, intern_schema
+from .lazy import LazyModels
+from .json import (
+    JsonBackend,
+    available_backends,
+    from_json,
+    to_json,
+    to_dict,
+    from_file,
+    from_reader,
+    from_stream,
+    get_backend,
+    set_backend,
+    to_file,
+    to_stream,
+    keys_to_names,
+    names_to_keys,
+)
+from .snapshot import from_file_snapshot, has_snapshot, save_snapshot
+from .pool import ConnectionPool, PoolStats
+from .http import OcsfServerClient, from_http, resolve_version
 from .get_schema import get_schema
+from .async_http import AsyncOcsfServerClient, get_schema_async
 
 __all__ = [
+    "AsyncOcsfServerClient",
+    "ConnectionPool",
+    "InternPool",
+    "InternStats",
+    "JsonBackend",
+    "LazyModels",
     "OcsfAttr",
     "OcsfDeprecationInfo",
     "OcsfElementType",
@@ -28,13 +57,33 @@ __all__ = [
     "OcsfT",
     "OcsfType",
     "OcsfVersion",
+    "PoolStats",
+    "available_backends",
+    "fingerprint",
+    "fingerprints",
+    "freeze",
     "from_file",
+    "from_file_snapshot",
     "from_http",
     "from_json",
+    "from_reader",
+    "from_stream",
+    "get_backend",
     "get_schema",
+    "get_schema_async",
+    "has_fingerprint",
+    "has_snapshot",
+    "intern_schema",
+    "is_frozen",
     "keys_to_names",
     "names_to_keys",
+    "resolve_version",
+    "save_snapshot",
+    "set_backend",
+    "store_fingerprints",
+    "stored_fingerprint",
     "to_dict",
     "to_file",
     "to_json",
+    "to_stream",
 ]
@@ -0,0 +1,223 @@
+"""An asyncio client for fetching OCSF schemas from the server.
+
+AsyncOcsfServerClient has the same caching behavior as OcsfServerClient, which
+it uses to do the work. Downloads, cache reads, and parsing run in worker
+threads (see asyncio.to_thread), so they don't block the event loop, and a
+semaphore limits how many of them run at once.
+
+Fetching several versions at once takes about as long as the slowest download,
+rather than the sum of all of them:
+
+```python
+client = AsyncOcsfServerClient(cache_dir="./schema_cache")
+old, new = await client.get_schemas(["1.1.0", "1.2.0"])
+```
+"""
+
+import asyncio
+
+from pathlib import Path
+from typing import Iterable, Optional
+
+from .cache import DEFAULT_TTL
+from .http import OcsfServerClient, OcsfServerVersions, check_version_spec, is_semver, resolve_version
+from .model import OcsfSchema
+from .pool import DEFAULT_IDLE_TIMEOUT
+
+# The default number of downloads, cache reads, and parses run at once.
+DEFAULT_CONCURRENCY = 4
+
+
+class AsyncOcsfServerClient:
+    """A caching OCSF server client for asyncio.
+
+    The list of versions is fetched at most once per client, however many
+    schemas are requested concurrently.
+    """
+
+    def __init__(
+        self,
+        base_url: str = "https://schema.ocsf.io",
+        cache_dir: Optional[str | Path] = None,
+        snapshots: bool = True,
+        compression: Optional[str] = None,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        idle_timeout: float = DEFAULT_IDLE_TIMEOUT,
+        ttl: float = DEFAULT_TTL,
+        stale_if_error: bool = True,
+    ):
+        """Create a new client.
+
+        Args:
+            base_url: The base URL of the OCSF server.
+            cache_dir: The directory to store cached schemas in.
+            snapshots: Whether to keep snapshots of parsed schemas in cache_dir.
+            compression: The compression of newly cached schemas, like "gzip".
+                See the compression module.
+            concurrency: The maximum number of schemas fetched, read, or
+                parsed at once. As many connections to the server are kept
+                open for reuse.
+            idle_timeout: The number of seconds an idle connection is kept open.
+            ttl: The number of seconds the cached list of versions, and cached
+                dev and default versions, are used before they are revalidated
+                with the server.
+            stale_if_error: Whether to use stale cached versions and schemas
+                when the server can't be reached to revalidate them.
+
+        Raises:
+            ValueError: If the compression is not recognized, concurrency is
+                less than 1, or idle_timeout or ttl is negative.
+        """
+        if concurrency < 1:
+            raise ValueError(f"concurrency must be at least 1, not {concurrency}")
+
+        self._client = OcsfServerClient(
+            base_url, cache_dir, snapshots, compression, concurrency, idle_timeout, ttl, stale_if_error
+        )
+        self._concurrency = concurrency
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._versions: Optional[asyncio.Task[OcsfServerVersions]] = None
+
+    @property
+    def client(self) -> OcsfServerClient:
+        """The synchronous client that does the work."""
+        return self._client
+
+    def _limit(self) -> asyncio.Semaphore:
+        """The semaphore limiting concurrency, created on first use in the running event loop."""
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self._concurrency)
+        return self._semaphore
+
+    async def _fetch_versions(self) -> OcsfServerVersions:
+        """Get the available versions from the cache or the server, sharing them with the synchronous client."""
+        async with self._limit():
+            return await asyncio.to_thread(self._client.load_versions)
+
+    async def _get_versions(self) -> OcsfServerVersions:
+        """The available versions, fetched by the first caller and awaited by the others."""
+        if self._versions is None:
+            self._versions = asyncio.ensure_future(self._fetch_versions())
+        try:
+            return await asyncio.shield(self._versions)
+        except Exception:
+            # Let the next caller try again.
+            self._versions = None
+            raise
+
+    async def get_versions(self) -> list[str]:
+        """Return the available schema versions on the server."""
+        return [v.version for v in (await self._get_versions()).versions]
+
+    async def get_default_version(self) -> str:
+        """Return the server's default schema version."""
+        return (await self._get_versions()).default.version
+
+    async def resolve_version(self, spec: str) -> str:
+        """Resolve a version specification to a version available on the server.
+
+        See OcsfServerClient.resolve_version.
+        """
+        check_version_spec(spec)
+        return resolve_version(spec, await self.get_versions())
+
+    async def get_schema(self, version: Optional[str] = None) -> OcsfSchema:
+        """Get a schema from the cache or from the server.
+
+        See OcsfServerClient.get_schema.
+
+        Args:
+            version: The version of the schema to fetch, or a specification
+                like "latest" or "1.x". If None, the server's default version
+                is used.
+
+        Returns:
+            The requested OcsfSchema.
+
+        Raises:
+            ValueError: If the version requested is not found on the server or
+                if the requested version is invalid.
+        """
+        if version is not None and not is_semver(version):
+            version = await self.resolve_version(version)
+
+        async with self._limit():
+            schema = await asyncio.to_thread(self._client.read_cache, version)
+            if schema is not None:
+                return schema
+            # A cached copy that only needs revalidating doesn't need the version checked.
+            entry = None if version is None else await asyncio.to_thread(self._client.cache_entry, version)
+
+        if version is not None and entry is None and version not in await self.get_versions():
+            raise ValueError(f"Version {version} not found on server")
+
+        async with self._limit():
+            return await asyncio.to_thread(self._client.fetch_schema, version)
+
+    async def get_schema_file(self, path: str | Path) -> OcsfSchema:
+        """Parse a schema from a local JSON file.
+
+        See OcsfServerClient.get_schema_file.
+
+        Args:
+            path: The path of the JSON file.
+
+        Returns:
+            The parsed OcsfSchema.
+
+        Raises:
+            FileNotFoundError: If the file doesn't exist.
+        """
+        async with self._limit():
+            return await asyncio.to_thread(self._client.get_schema_file, path)
+
+    async def get_schemas(self, versions: Iterable[Optional[str]]) -> list[OcsfSchema]:
+        """Get several schemas concurrently.
+
+        Args:
+            versions: The versions of the schemas to fetch. None stands for the
+                server's default version.
+
+        Returns:
+            The requested schemas, in the same order as versions.
+
+        Raises:
+            ValueError: If a version requested is not found on the server or
+                is invalid.
+        """
+        return list(await asyncio.gather(*(self.get_schema(version) for version in versions)))
+
+
+async def get_schema_async(
+    versionOrFile: Optional[str] = None, client: Optional[AsyncOcsfServerClient] = None
+) -> OcsfSchema:
+    """Fetch a schema from a filename or version without blocking the event loop.
+
+    This is the asyncio counterpart of get_schema.
+
+    Example:
+        ```python
+        before, after = await asyncio.gather(get_schema_async("1.1.0"), get_schema_async("schema.json"))
+        ```
+
+    Args:
+        versionOrFile: The name of an OCSF schema file or a valid semantic version number.
+        client: The client used to fetch schemas by version. One is created if not given.
+
+    Returns:
+        The requested OcsfSchema.
+
+    Raises:
+        ValueError: If the version requested is not found on the server or
+            if the requested version is invalid.
+    """
+    if client is None:
+        client = AsyncOcsfServerClient()
+
+    if versionOrFile is not None:
+        try:
+            return await client.get_schema_file(versionOrFile)
+        except FileNotFoundError:
+            pass
+
+    return await client.get_schema(versionOrFile)
@@ -0,0 +1,141 @@
+"""Metadata for revalidating cached server responses.
+
+Released schemas never change, so OcsfServerClient caches them forever. Dev
+builds and the server's default version do change, so their cache entries are
+accompanied by a small JSON sidecar recording when the response was fetched
+and the validators the server sent with it (ETag and Last-Modified). Once the
+entry is older than the client's TTL, the client revalidates it with a
+conditional GET, and the server answers 304 Not Modified, with no body, if the
+cached copy is still current.
+
+Example sidecar, `schema-1.4.0-dev.meta`:
+
+```json
+{"version": "1.4.0-dev", "etag": "\\"5d8c-1a2b\\"", "last_modified": null, "fetched": 1718000000.0}
+```
+"""
+
+import logging
+import os
+import tempfile
+import time
+
+from dataclasses import asdict, dataclass
+from email.message import Message
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+from .json import get_backend
+
+LOG = logging.getLogger(__name__)
+
+# The default number of seconds a revalidated cache entry is used before it is
+# revalidated again.
+DEFAULT_TTL = 300.0
+
+
+def _file_mode() -> int:
+    """The mode open() would give a new file, which mkstemp doesn't."""
+    umask = os.umask(0)
+    os.umask(umask)
+    return 0o666 & ~umask
+
+
+# Read once, since the umask can only be read by setting it.
+FILE_MODE = _file_mode()
+
+
+@dataclass
+class CacheEntry:
+    """What is known about a cached response.
+
+    Attributes:
+        version: The version of the cached schema.
+        etag: The ETag header of the response, if any.
+        last_modified: The Last-Modified header of the response, if any.
+        fetched: When the response was fetched or last revalidated, in
+            seconds since the epoch.
+    """
+
+    version: str
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    fetched: float = 0.0
+
+    def fresh(self, ttl: float, now: Optional[float] = None) -> bool:
+        """Was the entry fetched or revalidated less than ttl seconds ago?"""
+        if now is None:
+            now = time.time()
+        return 0 <= now - self.fetched < ttl
+
+    def conditional_headers(self) -> dict[str, str]:
+        """The headers of a conditional GET revalidating the entry."""
+        headers: dict[str, str] = {}
+        if self.etag is not None:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified is not None:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+    def revalidated(self, headers: Message) -> "CacheEntry":
+        """The entry after a response with these headers, fetched now.
+
+        Validators missing from the response, as they may be from a 304, are
+        kept.
+        """
+        return CacheEntry(
+            self.version,
+            headers.get("ETag", self.etag),
+            headers.get("Last-Modified", self.last_modified),
+            time.time(),
+        )
+
+
+def write_atomic(path: Path, data: bytes | Callable[[Path], None]) -> None:
+    """Write a file atomically, so concurrent readers never see a partial file.
+
+    The content is written to a temporary file in the same directory, which then
+    replaces the file. The temporary file is removed if writing fails. The file
+    is given the permissions open() would have given it, rather than mkstemp's
+    owner-only ones.
+
+    Args:
+        path: The path of the file.
+        data: The content of the file, or a function that writes it to the
+            temporary path it is given.
+    """
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=path.name, suffix=".tmp")
+    try:
+        os.chmod(tmp, FILE_MODE)
+        if isinstance(data, bytes):
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+        else:
+            os.close(fd)
+            data(Path(tmp))
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+def read_entry(path: Path) -> Optional[CacheEntry]:
+    """Read a cache entry's sidecar, returning None if it's missing or unreadable."""
+    try:
+        data: Any = get_backend().loads(path.read_bytes())
+        return CacheEntry(
+            str(data["version"]),
+            data.get("etag"),
+            data.get("last_modified"),
+            float(data.get("fetched", 0.0)),
+        )
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        LOG.warning(f"Ignoring unreadable cache metadata {path}: {e}")
+        return None
+
+
+def write_entry(path: Path, entry: CacheEntry) -> None:
+    """Write a cache entry's sidecar."""
+    write_atomic(path, get_backend().dumps(asdict(entry)))
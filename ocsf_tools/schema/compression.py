@@ -0,0 +1,167 @@
+"""Transparently compressed schema files.
+
+Exported schemas are large and very repetitive, so they compress well: gzip
+shrinks them to about a tenth of their size and xz further still. Files are
+written compressed according to their extension (or an explicit compression)
+and read according to their content, so compressed and uncompressed files can
+be mixed freely.
+
+Supported compressions are gzip (.gz) and xz (.xz) from the standard library,
+and zstd (.zst) if the zstandard package, the zstd extra of this package, is
+installed.
+
+Example:
+
+```python
+with open_write("schema-1.1.0.json.gz") as f:
+    to_stream(schema, f)
+
+with open_read("schema-1.1.0.json.gz") as f:
+    schema = from_stream(f)
+```
+"""
+
+import gzip
+import lzma
+
+from pathlib import Path
+from typing import IO, Optional, cast
+
+# zstandard is optional. Install it to read and write zstd compressed files.
+try:
+    import zstandard  # pyright: ignore[reportMissingImports]
+except ImportError:  # pragma: no cover
+    zstandard = None
+
+# The extension and the magic bytes at the start of files of each compression.
+_FORMATS = {
+    "gzip": (".gz", b"\x1f\x8b"),
+    "xz": (".xz", b"\xfd7zXZ\x00"),
+    "zstd": (".zst", b"\x28\xb5\x2f\xfd"),
+}
+
+
+def available_compressions() -> list[str]:
+    """The names of the compressions that can be used in this environment."""
+    return [name for name in _FORMATS if name != "zstd" or zstandard is not None]
+
+
+def _check(compression: str) -> None:
+    if compression not in _FORMATS:
+        raise ValueError(f"Unknown compression: {compression}")
+    if compression not in available_compressions():
+        raise ImportError(f"{compression} compression requires the zstandard package")
+
+
+def extension(compression: Optional[str]) -> str:
+    """The file extension for a compression, or an empty string for None.
+
+    Raises:
+        ValueError: If the compression is not recognized.
+    """
+    if compression is None:
+        return ""
+    if compression not in _FORMATS:
+        raise ValueError(f"Unknown compression: {compression}")
+    return _FORMATS[compression][0]
+
+
+def compression_for_path(path: str | Path) -> Optional[str]:
+    """The compression implied by a file's extension, or None if it has no compression extension."""
+    suffix = Path(path).suffix
+    for name, (ext, _) in _FORMATS.items():
+        if suffix == ext:
+            return name
+    return None
+
+
+def detect(head: bytes) -> Optional[str]:
+    """The compression of data that starts with head, or None if it isn't compressed."""
+    for name, (_, magic) in _FORMATS.items():
+        if head.startswith(magic):
+            return name
+    return None
+
+
+class _GzipWriter(gzip.GzipFile):
+    """A gzip file whose header records neither a name nor a modification time.
+
+    The output is identical for identical schemas, whatever path, such as a
+    temporary file, it is written to.
+    """
+
+    def __init__(self, path: str | Path):
+        self._raw = open(path, "wb")
+        super().__init__("", "wb", fileobj=self._raw, mtime=0)
+
+    def close(self) -> None:
+        try:
+            super().close()
+        finally:
+            self._raw.close()
+
+
+def open_read(path: str | Path) -> IO[bytes]:
+    """Open a file for reading, decompressing it as it is read if it is compressed.
+
+    The compression is detected from the file's content, not its name.
+
+    Raises:
+        FileNotFoundError: If the file doesn't exist.
+        ImportError: If the file is zstd compressed and zstandard isn't installed.
+    """
+    with open(path, "rb") as f:
+        compression = detect(f.read(6))
+
+    match compression:
+        case None:
+            return open(path, "rb")
+        case "gzip":
+            return cast(IO[bytes], gzip.open(path, "rb"))
+        case "xz":
+            return cast(IO[bytes], lzma.open(path, "rb"))
+        case _:
+            _check(compression)
+            return cast(IO[bytes], zstandard.open(path, "rb"))  # type: ignore
+
+
+def open_write(path: str | Path, compression: Optional[str] = None) -> IO[bytes]:
+    """Open a file for writing, compressing what is written to it.
+
+    Args:
+        path: The path of the file.
+        compression: The compression to use. Defaults to the compression
+            implied by the file's extension, if any.
+
+    Raises:
+        ValueError: If the compression is not recognized.
+        ImportError: If zstd is requested and zstandard isn't installed.
+    """
+    if compression is None:
+        compression = compression_for_path(path)
+
+    match compression:
+        case None:
+            return open(path, "wb")
+        case "gzip":
+            return cast(IO[bytes], _GzipWriter(path))
+        case "xz":
+            return cast(IO[bytes], lzma.open(path, "wb"))
+        case _:
+            _check(compression)
+            return cast(IO[bytes], zstandard.open(path, "wb"))  # type: ignore
+
+
+def decompress(data: bytes) -> bytes:
+    """Decompress data read from a file if it is compressed, detecting the compression from its content."""
+    compression = detect(data)
+    match compression:
+        case None:
+            return data
+        case "gzip":
+            return gzip.decompress(data)
+        case "xz":
+            return lzma.decompress(data)
+        case _:
+            _check(compression)
+            return zstandard.ZstdDecompressor().decompressobj().decompress(data)  # type: ignore
@@ -0,0 +1,260 @@
+"""A fast decoder from plain dictionaries to the OCSF schema dataclasses.
+
+dacite is a general purpose library: it reflects over the type hints of a class
+every time it builds an instance of it. An exported schema contains tens of
+thousands of attributes and enum members, but only a handful of dataclasses.
+This decoder inspects each dataclass once, compiles a function that builds
+instances of it directly, and reuses that function for every instance.
+
+Like dacite, values are checked against the type hints of the fields they
+decode into. A value of the wrong type raises a DecodeError, a ValueError that
+names the path to the value, like "classes.authentication.attributes".
+
+Example:
+
+```python
+decoder = Decoder(aliases={"@deprecated": "deprecated"})
+schema = decoder.decode(OcsfSchema, json.loads(data))
+```
+"""
+
+from dataclasses import MISSING, fields, is_dataclass
+from types import NoneType, UnionType
+from typing import Any, Callable, Mapping, Optional, TypeVar, Union, cast, get_args, get_origin, get_type_hints
+
+T = TypeVar("T")
+
+Converter = Callable[[Any], Any]
+
+
+class DecodeError(ValueError):
+    """A value that doesn't match the type it is decoded into.
+
+    Attributes:
+        reason: What is wrong with the value.
+        path: The keys and indexes leading to the value, outermost first.
+    """
+
+    def __init__(self, reason: str):
+        super().__init__(reason)
+        self.reason = reason
+        self.path: list[str] = []
+
+    def within(self, key: Any) -> "DecodeError":
+        """Add the key or index of the value's container to the path, returning the error."""
+        self.path.insert(0, str(key))
+        self.args = (f"{self.reason} at {'.'.join(self.path)}",)
+        return self
+
+
+def _type_name(hint: Any) -> str:
+    return hint.__name__ if isinstance(hint, type) else str(hint)
+
+
+def _unexpected(expected: str, value: Any) -> DecodeError:
+    return DecodeError(f"Expected {expected}, not {type(value).__name__}")
+
+
+def _plain_types(hint: Any) -> Optional[tuple[type, ...]]:
+    """The types of a plain, optional or not, value like str or Optional[int], or None for other hints."""
+    if isinstance(hint, type) and not is_dataclass(hint):
+        return (cast(type, hint),)
+
+    if get_origin(hint) in (Union, UnionType):
+        args = get_args(hint)
+        if len(args) == 2 and NoneType in args:
+            member = args[0] if args[1] is NoneType else args[1]
+            if isinstance(member, type) and not is_dataclass(member):
+                return (cast(type, member), NoneType)
+
+    return None
+
+
+class Decoder:
+    """Decode dictionaries into dataclasses with precompiled per-class decoders."""
+
+    def __init__(self, aliases: Optional[Mapping[str, str]] = None):
+        """Create a new decoder.
+
+        Args:
+            aliases: A mapping of keys found in the input to dataclass field
+                names, like {"@deprecated": "deprecated"}. Field names are
+                always accepted as keys as well.
+        """
+        self._aliases = dict(aliases) if aliases is not None else {}
+        self._decoders: dict[type, Converter] = {}
+
+    def decode(self, cls: type[T], data: dict[str, Any]) -> T:
+        """Decode a dictionary into an instance of a dataclass.
+
+        Args:
+            cls: The dataclass to build.
+            data: The dictionary to decode, as produced by json.loads.
+
+        Returns:
+            An instance of cls.
+
+        Raises:
+            DecodeError: If a required field is missing from data, or a value
+                doesn't match the type of its field.
+        """
+        return self.decoder(cls)(data)
+
+    def decoder(self, cls: type[T]) -> Callable[[dict[str, Any]], T]:
+        """Return the compiled decoding function for a dataclass, compiling it if needed."""
+        if cls not in self._decoders:
+            # Register a trampoline first so that self-referencing dataclasses
+            # resolve to the compiled decoder instead of recursing forever.
+            self._decoders[cls] = lambda data: self._decoders[cls](data)
+            self._decoders[cls] = self._compile(cls)
+
+        return cast(Callable[[dict[str, Any]], T], self._decoders[cls])
+
+    def _compile(self, cls: type[Any]) -> Converter:
+        """Build a decoding function for a dataclass."""
+        if not is_dataclass(cls):
+            raise TypeError(f"{cls.__name__} is not a dataclass")
+
+        hints = get_type_hints(cls)
+        # The field name, and either the types a plain value may have, checked
+        # inline to save a call per value, or a converter.
+        specs: dict[str, tuple[str, Optional[tuple[type, ...]], Optional[Converter]]] = {}
+        required: list[str] = []
+
+        for f in fields(cls):
+            if not f.init:
+                continue
+            types = _plain_types(hints[f.name])
+            specs[f.name] = (f.name, types, None if types is not None else self._converter(hints[f.name]))
+            if f.default is MISSING and f.default_factory is MISSING:
+                required.append(f.name)
+
+        for key, name in self._aliases.items():
+            if name in specs:
+                specs[key] = specs[name]
+
+        def decode(data: Any) -> Any:
+            if not isinstance(data, dict):
+                raise _unexpected(f"an object for {cls.__name__}", data)
+
+            members = cast(dict[str, Any], data)
+            kwargs: dict[str, Any] = {}
+            for key, value in members.items():
+                spec = specs.get(key)
+                if spec is not None:
+                    name, types, convert = spec
+                    if types is not None:
+                        if not isinstance(value, types):
+                            raise _unexpected(" or ".join(t.__name__ for t in types), value).within(key)
+                        kwargs[name] = value
+                        continue
+                    try:
+                        kwargs[name] = value if convert is None else convert(value)
+                    except DecodeError as e:
+                        raise e.within(key)
+
+            try:
+                return cls(**kwargs)
+            except TypeError:
+                missing = [name for name in required if name not in kwargs]
+                if len(missing) > 0:
+                    raise DecodeError(f"Missing required field(s) {', '.join(missing)} for {cls.__name__}")
+                raise
+
+        return decode
+
+    def _converter(self, hint: Any) -> Optional[Converter]:
+        """Build a converter for a type hint, or None if any value can be used as it is.
+
+        Converters check that values match the hint, and raise a DecodeError
+        if they don't.
+        """
+        if hint is Any:
+            return None
+
+        if isinstance(hint, type) and is_dataclass(hint):
+            return self.decoder(hint)
+
+        origin = get_origin(hint)
+        args = get_args(hint)
+
+        if origin is Union or origin is UnionType:
+            members = [arg for arg in args if arg is not NoneType]
+            if len(members) == 1:
+                member = self._converter(members[0])
+                if member is None:
+                    return None
+                return lambda value: None if value is None else member(value)
+
+            if sum(1 for arg in members if isinstance(arg, type) and is_dataclass(arg)) > 1:
+                raise TypeError(f"Unsupported union of dataclasses: {hint}")
+            converters = [self._converter(arg) for arg in members]
+            if any(c is None for c in converters):
+                return None
+            expected = " or ".join(_type_name(arg) for arg in members)
+
+            def convert_union(value: Any) -> Any:
+                if value is None and NoneType in args:
+                    return None
+                for convert in converters:
+                    try:
+                        return cast(Converter, convert)(value)
+                    except DecodeError:
+                        pass
+                raise _unexpected(expected, value)
+
+            return convert_union
+
+        if origin is dict and len(args) == 2:
+            value_converter = self._converter(args[1])
+
+            def convert_dict(value: Any) -> Any:
+                if not isinstance(value, dict):
+                    raise _unexpected("an object", value)
+                mapping = cast(dict[Any, Any], value)
+                if value_converter is None:
+                    return mapping
+                try:
+                    return {k: value_converter(v) for k, v in mapping.items()}
+                except DecodeError:
+                    # Decode again, one value at a time, to find the key of the invalid value.
+                    for k, v in mapping.items():
+                        try:
+                            value_converter(v)
+                        except DecodeError as e:
+                            raise e.within(k)
+                    raise
+
+            return convert_dict
+
+        if origin is list and len(args) == 1:
+            item_converter = self._converter(args[0])
+
+            def convert_list(value: Any) -> Any:
+                if not isinstance(value, list):
+                    raise _unexpected("a list", value)
+                items = cast(list[Any], value)
+                if item_converter is None:
+                    return items
+                try:
+                    return [item_converter(v) for v in items]
+                except DecodeError:
+                    for i, v in enumerate(items):
+                        try:
+                            item_converter(v)
+                        except DecodeError as e:
+                            raise e.within(i)
+                    raise
+
+            return convert_list
+
+        if isinstance(hint, type):
+            # bool is a subclass of int, so True is accepted as an int, as dacite does.
+            def check(value: Any) -> Any:
+                if not isinstance(value, hint):
+                    raise _unexpected(hint.__name__, value)
+                return value
+
+            return check
+
+        return None
@@ -0,0 +1,56 @@
+"""Encode the OCSF schema dataclasses for a JSON library without copying them.
+
+dataclasses.asdict deep copies a schema into nested dictionaries before it can
+be passed to json.dumps, so saving a schema briefly holds two copies of it in
+memory. The Encoder instead hands JSON libraries one model at a time through
+their `default` hook: each model becomes a shallow dictionary of its fields,
+which the library encodes and then discards.
+
+Example:
+
+```python
+encoder = Encoder(names={"deprecated": "@deprecated"})
+data = json.dumps(schema, default=encoder.default)
+```
+"""
+
+from dataclasses import fields, is_dataclass
+from typing import Any, Mapping, Optional, cast
+
+
+class Encoder:
+    """Convert dataclasses to shallow dictionaries with precomputed property names."""
+
+    def __init__(self, names: Optional[Mapping[str, str]] = None):
+        """Create a new encoder.
+
+        Args:
+            names: A mapping of dataclass field names to the keys to write
+                them as, like {"deprecated": "@deprecated"}. Other fields are
+                written under their own names.
+        """
+        self._names = dict(names) if names is not None else {}
+        self._keys: dict[type, tuple[tuple[str, str], ...]] = {}
+
+    def keys(self, cls: type[Any]) -> tuple[tuple[str, str], ...]:
+        """The (key, field name) pairs of a dataclass, in field order."""
+        keys = self._keys.get(cls)
+        if keys is None:
+            if not is_dataclass(cls):
+                raise TypeError(f"{cls.__name__} is not a dataclass")
+            keys = self._keys[cls] = tuple((self._names.get(f.name, f.name), f.name) for f in fields(cls))
+        return keys
+
+    def default(self, obj: Any) -> Any:
+        """Convert a value that JSON libraries can't encode natively.
+
+        Dataclasses become dictionaries of their fields and other mappings,
+        like LazyModels, become dictionaries. Nested values are left for the
+        JSON library, which calls default again as it reaches them.
+
+        Raises:
+            TypeError: If the value can't be encoded.
+        """
+        if isinstance(obj, Mapping):
+            return dict(cast(Mapping[Any, Any], obj))
+        return {key: getattr(obj, name) for key, name in self.keys(type(cast(object, obj)))}
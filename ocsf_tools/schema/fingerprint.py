@@ -0,0 +1,171 @@
+"""Stable content fingerprints of OCSF schema elements.
+
+A fingerprint is a hash of the content of a model: its type, and the names and
+values of its fields. Nested models contribute their own fingerprints rather
+than their content, so fingerprints are computed bottom-up like a Merkle tree
+and shared instances, like the attributes of an interned schema, are only
+hashed once.
+
+Models with equal content have the same fingerprint and, barring hash
+collisions, models with different content have different fingerprints, so
+fingerprints can be compared instead of comparing models recursively.
+Fingerprints depend only on content, never on object identity or Python's
+randomized string hashing, so they are stable across processes and Python
+versions and can be stored, for example to key caches by schema.
+
+Fingerprints are computed from the current content of a model every time they
+are requested, so they are always up to date. Models are mutable, so
+fingerprints are never stored on them implicitly. Callers that know a schema
+won't be modified can store them explicitly with store_fingerprints, which lets
+compare() skip unchanged models without comparing them. Schemas loaded from
+snapshots have the fingerprints that were pickled with them (see the snapshot
+module).
+
+Example:
+
+```python
+if fingerprint(old.classes["file_activity"]) == fingerprint(new.classes["file_activity"]):
+    print("Unchanged")
+```
+"""
+
+import hashlib
+
+from dataclasses import fields
+from typing import Any, Iterable, Mapping, Optional, cast
+
+from .model import OcsfModel
+
+# Bump this when the encoding below changes, so stored fingerprints are not
+# compared with fingerprints computed differently.
+FINGERPRINT_VERSION = 1
+
+_ATTR = "_fingerprint"
+_DIGEST_SIZE = 16
+
+
+# The models fingerprinted so far by one call, by id, with their fingerprints.
+# Keeping the models alive keeps their ids from being reused during the call.
+_Memo = dict[int, tuple[OcsfModel, bytes]]
+
+
+def _encode(value: Any, parts: list[bytes], memo: _Memo) -> None:
+    """Append an unambiguous encoding of a field value to parts."""
+    if value is None:
+        parts.append(b"N")
+    elif isinstance(value, OcsfModel):
+        parts.append(b"M" + _digest(value, memo))
+    elif isinstance(value, str):
+        data = value.encode("utf-8")
+        parts.append(b"S%d:" % len(data) + data)
+    elif isinstance(value, bool):
+        parts.append(b"T" if value else b"F")
+    elif isinstance(value, int):
+        parts.append(b"I%d;" % value)
+    elif isinstance(value, float):
+        parts.append(b"R" + repr(value).encode() + b";")
+    elif isinstance(value, Mapping):
+        # Dictionaries compare equal regardless of order, so their keys are sorted.
+        items = cast(Mapping[str, Any], value)
+        parts.append(b"D%d:" % len(items))
+        for k in sorted(items):
+            _encode(k, parts, memo)
+            _encode(items[k], parts, memo)
+    elif isinstance(value, (list, tuple)):
+        items = cast(list[Any], value)
+        parts.append(b"L%d:" % len(items))
+        for item in items:
+            _encode(item, parts, memo)
+    else:
+        raise TypeError(f"Can't fingerprint a value of type {type(cast(object, value)).__name__}")
+
+
+def _digest(model: OcsfModel, memo: _Memo) -> bytes:
+    """The raw fingerprint of a model, computing it unless it is in memo."""
+    known = memo.get(id(model))
+    if known is not None:
+        return known[1]
+
+    parts = [type(model).__name__.encode()]
+    for f in fields(cast(Any, model)):
+        parts.append(f.name.encode() + b"=")
+        _encode(getattr(model, f.name), parts, memo)
+
+    h = hashlib.blake2b(b"".join(parts), digest_size=_DIGEST_SIZE, person=b"ocsf-fp-%d" % FINGERPRINT_VERSION)
+    digest = h.digest()
+    memo[id(model)] = (model, digest)
+    return digest
+
+
+def fingerprints(model: OcsfModel) -> list[tuple[OcsfModel, bytes]]:
+    """The raw fingerprints of a model and of every model in it.
+
+    Nothing is stored on the models. Shared instances appear once.
+
+    Raises:
+        TypeError: If the model contains a value that can't be fingerprinted.
+    """
+    memo: _Memo = {}
+    _digest(model, memo)
+    return list(memo.values())
+
+
+def store_fingerprints(digests: Iterable[tuple[OcsfModel, bytes]]) -> None:
+    """Store raw fingerprints on their models, as returned by fingerprints().
+
+    Nothing updates stored fingerprints when a model is modified, so only
+    store them on models that won't be modified afterwards, like a schema
+    that is only compared.
+
+    Example:
+
+    ```python
+    store_fingerprints(fingerprints(schema))
+    ```
+    """
+    for model, digest in digests:
+        # Not through setattr, which frozen models refuse (see freeze in the
+        # model module).
+        vars(model)[_ATTR] = digest
+
+
+def state_with_fingerprint(model: OcsfModel, digest: bytes) -> dict[str, Any]:
+    """A model's instance dictionary with a raw fingerprint stored in it.
+
+    The model itself is left unchanged. A model pickled with this state, as
+    snapshots pickle them, has the fingerprint stored once it is unpickled.
+    """
+    return {**model.__dict__, _ATTR: digest}
+
+
+def has_fingerprint(model: OcsfModel) -> bool:
+    """Does a model have a stored fingerprint? See store_fingerprints."""
+    return _ATTR in model.__dict__
+
+
+def stored_fingerprint(model: OcsfModel) -> Optional[bytes]:
+    """The raw fingerprint stored on a model, or None. See store_fingerprints.
+
+    A stored fingerprint was correct when it was stored, but isn't updated if
+    the model has been modified since.
+    """
+    return model.__dict__.get(_ATTR)
+
+
+def fingerprint(model: OcsfModel) -> str:
+    """The content fingerprint of an OCSF schema element, as a hex string.
+
+    The fingerprint is computed from the model's current content; stored
+    fingerprints are ignored. Fingerprinting a schema decodes all of the events
+    and objects of a lazy schema.
+
+    Args:
+        model: The model, like an OcsfAttr, OcsfEvent, or OcsfSchema.
+
+    Returns:
+        A 32 character hex string.
+
+    Raises:
+        TypeError: If the model contains a value that can't be fingerprinted.
+    """
+    return _digest(model, {}).hex()
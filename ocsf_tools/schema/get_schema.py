@@ -7,7 +7,8 @@ from .http import OcsfServerClient
 def get_schema(versionOrFile: Optional[str] = None, client: Optional[OcsfServerClient] = None) -> OcsfSchema:
     """Fetch a schema from a filename or version.
 
-    This is a convenience function.
+    This is a convenience function. If a client with a cache directory is
+    given, snapshots of parsed schema files are kept in its cache.
 
     Example:
         ```python
@@ -17,6 +18,7 @@ def get_schema(versionOrFile: Optional[str] = None, client: Optional[OcsfServerC
 
     Args:
         versionOrFile: The name of an OCSF schema file or a valid semantic version number.
+        client: The client used to fetch schemas by version. One is created if not given.
 
     Returns:
         The requested OcsfSchema.
@@ -27,6 +29,8 @@ def get_schema(versionOrFile: Optional[str] = None, client: Optional[OcsfServerC
     """
     if versionOrFile is not None:
         try:
+            if client is not None:
+                return client.get_schema_file(versionOrFile)
             return from_file(versionOrFile)
         except FileNotFoundError:
             pass
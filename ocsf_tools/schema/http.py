@@ -9,31 +9,41 @@ schema = OcsfServerClient().get_schema()
 schema = OcsfServerClient(cache_dir="./schema_cache").get_schema("1.1.0")
 ```
 
+Requests are sent through a pool of keep-alive connections (see the pool
+module), so a client reuses one connection for the versions and every schema it
+fetches, and downloads are gzip compressed. Pass pool_size and idle_timeout to
+tune the pool, and read client.pool.stats to see what was transferred.
+
 TODO:
-- This client is synchronous and only covers a small subset of the OCSF server's
-  API. This could be replaced with a more robust OpenAPI client.
+- This client only covers a small subset of the OCSF server's API. This could
+  be replaced with a more robust OpenAPI client. See async_http for an asyncio
+  client.
 """
 
 import logging
-import json
+import re
 
 from dataclasses import dataclass
-from urllib.request import urlopen
+from urllib.error import HTTPError, URLError
 from urllib.parse import urljoin
-from typing import Optional
+from typing import IO, Iterable, Optional, cast
 from semver import Version
 from pathlib import Path
 
 from dacite import from_dict
 
+from .cache import DEFAULT_TTL, CacheEntry, read_entry, write_atomic, write_entry
+from .compression import available_compressions, compression_for_path, extension
 from .model import OcsfSchema
-from .json import from_json, from_file, to_file
+from .pool import DEFAULT_IDLE_TIMEOUT, DEFAULT_POOL_SIZE, ConnectionPool
+from .json import from_file, from_reader, get_backend, to_file
+from .snapshot import from_file_snapshot, save_snapshot
 
 
 LOG = logging.getLogger(__name__)
 
 
-def _is_semver(version: str) -> bool:
+def is_semver(version: str) -> bool:
     """Is a version string a valid semantic version?"""
     try:
         Version.parse(version)
@@ -42,6 +52,64 @@ def _is_semver(version: str) -> bool:
         return False
 
 
+# Version specifications like "1", "1.x", "1.2", or "1.2.x".
+_PREFIX = re.compile(r"^(\d+)(?:\.(\d+))?(?:\.x)?$")
+
+
+def check_version_spec(spec: str) -> None:
+    """Raise a ValueError if a version specification is invalid, before fetching versions to resolve it."""
+    if not is_semver(spec) and spec != "latest" and _PREFIX.match(spec) is None:
+        raise ValueError(f"Invalid version: {spec}")
+
+
+def resolve_version(spec: str, versions: Iterable[str]) -> str:
+    """Resolve a version specification to one of a list of versions.
+
+    Example:
+        ```python
+        resolve_version("1.x", ["1.0.0", "1.1.0", "1.2.0-dev"])  # "1.1.0"
+        ```
+
+    Args:
+        spec: One of:
+            - A semantic version, which is returned if it is in versions.
+            - "latest", the highest released (not prerelease) version.
+            - A major version, like "1" or "1.x", or a major and minor
+              version, like "1.2" or "1.2.x": the highest released version
+              starting with it.
+        versions: The available versions.
+
+    Returns:
+        The resolved version.
+
+    Raises:
+        ValueError: If spec is invalid, or no version matches it.
+    """
+    check_version_spec(spec)
+    if is_semver(spec):
+        if spec not in versions:
+            raise ValueError(f"Version {spec} not found on server")
+        return spec
+
+    match = _PREFIX.match(spec)
+
+    candidates: list[Version] = []
+    for v in versions:
+        if not is_semver(v):
+            continue
+        parsed = Version.parse(v)
+        if parsed.prerelease is not None:
+            continue
+        if match is not None:
+            if parsed.major != int(match[1]) or (match[2] is not None and parsed.minor != int(match[2])):
+                continue
+        candidates.append(parsed)
+
+    if not candidates:
+        raise ValueError(f"No version matching {spec} found on server")
+    return str(max(candidates))
+
+
 # Models representing the response from the OCSF server's /api/versions endpoint.
 @dataclass
 class OcsfServerVersion:
@@ -55,67 +123,215 @@ class OcsfServerVersions:
     versions: list[OcsfServerVersion]
 
 
+def _parse_versions(data: bytes) -> OcsfServerVersions:
+    """Parse the response of the /api/versions endpoint."""
+    return from_dict(OcsfServerVersions, get_backend().loads(data))
+
+
 class OcsfServerClient:
     """A simple caching OCSF server client.
 
     This client uses a local filesystem cache to store schemas and avoid
-    repeating requests to the OCSF server.
+    repeating requests to the OCSF server. Alongside each cached schema, it
+    keeps a binary snapshot of the parsed schema to avoid parsing the JSON
+    again (see the snapshot module).
+
+    Dev versions and the server's default version change, so they are cached
+    along with the validators the server sent (ETag and Last-Modified), and
+    revalidated with a conditional request once they are older than a TTL.
+    See the cache module.
+
+    The list of versions is cached as well (versions.json), so that versions can
+    be checked and resolved without a request, or offline: when the server can't
+    be reached, stale cached versions and schemas are used.
+
+    Cached schemas can be compressed. Cached files are found whatever their
+    compression, so changing the compression doesn't invalidate the cache.
     """
 
-    def __init__(self, base_url: str = "https://schema.ocsf.io", cache_dir: Optional[str | Path] = None):
+    def __init__(
+        self,
+        base_url: str = "https://schema.ocsf.io",
+        cache_dir: Optional[str | Path] = None,
+        snapshots: bool = True,
+        compression: Optional[str] = None,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        idle_timeout: float = DEFAULT_IDLE_TIMEOUT,
+        ttl: float = DEFAULT_TTL,
+        stale_if_error: bool = True,
+    ):
         """Create a new client.
 
         Args:
             base_url: The base URL of the OCSF server.
             cache_dir: The directory to store cached schemas in.
+            snapshots: Whether to keep snapshots of parsed schemas in cache_dir.
+            compression: The compression of newly cached schemas, like "gzip".
+                See the compression module.
+            pool_size: The maximum number of idle connections kept open to
+                the server.
+            idle_timeout: The number of seconds an idle connection is kept open.
+            ttl: The number of seconds the cached list of versions, and cached
+                dev and default versions, are used before they are revalidated
+                with the server.
+            stale_if_error: Whether to use stale cached versions and schemas
+                when the server can't be reached to revalidate them.
+
+        Raises:
+            ValueError: If the compression is not recognized, pool_size is less
+                than 1, or idle_timeout or ttl is negative.
         """
+        if ttl < 0:
+            raise ValueError(f"ttl must not be negative, not {ttl}")
+
         self._base_url = base_url
+        self._snapshots = snapshots
+        self._suffix = ".json" + extension(compression)
         self._versions: Optional[OcsfServerVersions] = None
+        self._pool = ConnectionPool(pool_size, idle_timeout)
+        self._ttl = ttl
+        self._stale_if_error = stale_if_error
         if cache_dir is not None and not isinstance(cache_dir, Path):
             self._cache_dir = Path(cache_dir)
         else:
             self._cache_dir = cache_dir
 
-    def _fetch_schema(self, version: Optional[str] = None) -> OcsfSchema:
-        """Fetch a schema from the server."""
+    @property
+    def cache_dir(self) -> Optional[Path]:
+        """The directory schemas are cached in, if any."""
+        return self._cache_dir
+
+    @property
+    def pool(self) -> ConnectionPool:
+        """The connection pool used for requests to the server."""
+        return self._pool
+
+    @property
+    def snapshots(self) -> bool:
+        """Whether snapshots of parsed schemas are kept in cache_dir."""
+        return self._snapshots
+
+    def cached_file(self, version: str) -> Optional[Path]:
+        """Find a version's cached schema file, whatever its compression.
+
+        If files with several compressions are cached, the configured
+        compression is preferred.
+
+        Args:
+            version: The version.
+
+        Returns:
+            The path of the cached file, or None if it isn't cached or
+            cache_dir isn't set.
+        """
+        if self._cache_dir is None:
+            return None
+
+        suffixes = [self._suffix, ".json"] + [".json" + extension(c) for c in available_compressions()]
+        for suffix in dict.fromkeys(suffixes):
+            file = self._cache_dir / f"schema-{version}{suffix}"
+            if file.exists():
+                return file
+        return None
+
+    def _schema_url(self, version: Optional[str] = None) -> str:
+        """The URL of a schema on the server."""
         if version is not None:
             url = urljoin(self._base_url, f"{version}/")
         else:
             url = self._base_url
 
-        url = urljoin(url, "export/schema")
+        return urljoin(url, "export/schema")
+
+    def load_versions(self) -> OcsfServerVersions:
+        """Get the available versions from memory, the cache, or the server.
+
+        The versions are kept in memory once loaded, and cached in cache_dir
+        if it is set.
+
+        Returns:
+            The server's versions and default version.
+
+        Raises:
+            URLError: If the versions aren't cached and can't be fetched.
+        """
+        if self._versions is not None:
+            return self._versions
 
-        LOG.debug(f"Fetching schema from {url} (version {version})")
-        json_str = urlopen(url).read()
-        return from_json(json_str)
+        file: Optional[Path] = None
+        entry: Optional[CacheEntry] = None
+        if self._cache_dir is not None:
+            file = self._cache_dir / "versions.json"
+            if file.exists():
+                entry = read_entry(self._cache_dir / "versions.meta")
+            if entry is not None and entry.fresh(self._ttl):
+                LOG.info(f"Reading versions from cache: {file}")
+                self._versions = _parse_versions(file.read_bytes())
+                return self._versions
 
-    def _fetch_versions(self) -> OcsfServerVersions:
-        """Fetch the available versions from the server."""
         url = urljoin(self._base_url, "api/versions")
-        data = json.loads(urlopen(url).read())
-        return from_dict(OcsfServerVersions, data)
+        try:
+            with self._pool.request(url, entry.conditional_headers() if entry is not None else None) as response:
+                data = response.read()
+        except URLError as e:
+            if entry is None or file is None or not self._stale_if_error:
+                raise
+            if isinstance(e, HTTPError) and e.code < 500:
+                raise
+            LOG.warning(f"Using cached versions, unable to fetch them from {url}: {e}")
+            self._versions = _parse_versions(file.read_bytes())
+            return self._versions
+
+        if response.status == 304 and entry is not None and file is not None:
+            data = file.read_bytes()
+        versions = _parse_versions(data)
+
+        if self._cache_dir is not None and file is not None:
+            if not self._cache_dir.exists():
+                self._cache_dir.mkdir(parents=True, exist_ok=True)
+            if response.status != 304:
+                write_atomic(file, data)
+            fetched = CacheEntry(versions.default.version).revalidated(response.headers)
+            write_entry(self._cache_dir / "versions.meta", fetched)
+
+        self._versions = versions
+        return versions
 
     def get_versions(self) -> list[str]:
         """Return the available schema versions on the server."""
-        if self._versions is None:
-            self._versions = self._fetch_versions()
-
-        return [v.version for v in self._versions.versions]
+        return [v.version for v in self.load_versions().versions]
 
     def get_default_version(self) -> str:
         """Return the server's default schema version."""
-        if self._versions is None:
-            self._versions = self._fetch_versions()
+        return self.load_versions().default.version
+
+    def resolve_version(self, spec: str) -> str:
+        """Resolve a version specification to a version available on the server.
+
+        See resolve_version.
 
-        return self._versions.default.version
+        Args:
+            spec: A version, "latest", or a major or major.minor version like
+                "1.x" or "1.2".
+
+        Returns:
+            The resolved version.
+
+        Raises:
+            ValueError: If spec is invalid, or no version on the server matches it.
+        """
+        check_version_spec(spec)
+        return resolve_version(spec, self.get_versions())
 
     def get_schema(self, version: Optional[str] = None) -> OcsfSchema:
         """Get a schema from the cache or from the server.
 
-        If version is None, the server's default version is used. The cache will
-        not be read, but it will be updated.
+        If version is None, the server's default version is used.
 
-        If cache_dir is not set, no caching will be used.
+        If cache_dir is not set, no caching will be used. Released versions are
+        cached forever. Dev versions and the default version are used from the
+        cache for ttl seconds, then revalidated with a conditional request: if
+        the server answers 304 Not Modified, the cached copy is used again.
 
         Example:
             ```python
@@ -123,8 +339,9 @@ class OcsfServerClient:
             ```
 
         Args:
-            version: The version of the schema to fetch. If None, the server's
-                default version is used.
+            version: The version of the schema to fetch, or a specification
+                like "latest" or "1.x" (see resolve_version). If None, the
+                server's default version is used.
 
         Returns:
             The requested OcsfSchema.
@@ -133,41 +350,169 @@ class OcsfServerClient:
             ValueError: If the version requested is not found on the server or
                 if the requested version is invalid.
         """
-        if version is not None:
-            # Ensure version is a valid semantic version string.
-            if not _is_semver(version):
-                raise ValueError(f"Invalid version: {version}")
-
-            # Check the cache first.
-            if self._cache_dir is not None:
-                if not self._cache_dir.exists():
-                    LOG.debug(f"Creating cache directory: {self._cache_dir}")
-                    self._cache_dir.mkdir(parents=True, exist_ok=True)
-
-                file = self._cache_dir / f"schema-{version}.json"
-                if file.exists():
-                    LOG.info(f"Reading schema from cache: {file}")
-                    return from_file(str(file))
-                else:
-                    LOG.debug(f"Cache miss: {file}")
-
-            # Ensure the version exists on the server.
-            if version not in self.get_versions():
-                raise ValueError(f"Version {version} not found on server")
-
-        # Fetch the schema from the server.
-        schema = self._fetch_schema(version)
-
-        # Cache the schema.
-        if self._cache_dir is not None:
-            ver = Version.parse(schema.version)
-            if ver.prerelease != "dev":
-                dest = str(self._cache_dir / f"schema-{schema.version}.json")
-                LOG.debug(f"Caching schema to {dest}")
-                to_file(schema, dest)
+        # Resolve specifications like "latest" or "1.x" to a version.
+        if version is not None and not is_semver(version):
+            version = self.resolve_version(version)
+
+        # Check the cache first.
+        schema = self.read_cache(version)
+        if schema is not None:
+            return schema
+
+        # Ensure the version exists on the server, unless a cached copy only
+        # needs revalidating.
+        if version is not None and self.cache_entry(version) is None and version not in self.get_versions():
+            raise ValueError(f"Version {version} not found on server")
+
+        return self.fetch_schema(version)
+
+    def is_revalidated(self, version: Optional[str]) -> bool:
+        """Is a version's cached copy revalidated, rather than used forever?
+
+        Dev versions and the server's default version (None) are revalidated.
+        """
+        return version is None or Version.parse(version).prerelease == "dev"
+
+    def _entry_path(self, cache_dir: Path, version: Optional[str]) -> Path:
+        return cache_dir / f"schema-{version or 'default'}.meta"
+
+    def cache_entry(self, version: Optional[str]) -> Optional[CacheEntry]:
+        """Read the metadata of a revalidated cache entry, if there is one.
+
+        Released versions are cached forever, without metadata, so None is
+        returned for them.
+
+        Args:
+            version: A version, or None for the server's default version.
+
+        Returns:
+            The cache entry, or None if the version isn't revalidated or has
+            no cache entry.
+        """
+        if self._cache_dir is None or not self.is_revalidated(version):
+            return None
+        return read_entry(self._entry_path(self._cache_dir, version))
+
+    def _load(self, file: Path) -> OcsfSchema:
+        """Load a cached schema file."""
+        LOG.info(f"Reading schema from cache: {file}")
+        if self._snapshots:
+            return from_file_snapshot(file)
+        return from_file(str(file))
+
+    def read_cache(self, version: Optional[str]) -> Optional[OcsfSchema]:
+        """Read a schema from the cache, without a request to the server.
+
+        Args:
+            version: A version, or None for the server's default version.
+
+        Returns:
+            The cached schema, or None if it isn't cached, cache_dir isn't
+            set, or the cached copy needs revalidating.
+        """
+        if self._cache_dir is None:
+            return None
+
+        if not self._cache_dir.exists():
+            LOG.debug(f"Creating cache directory: {self._cache_dir}")
+            self._cache_dir.mkdir(parents=True, exist_ok=True)
+
+        if version is not None and not self.is_revalidated(version):
+            cached = version
+        else:
+            entry = self.cache_entry(version)
+            if entry is None or not entry.fresh(self._ttl):
+                LOG.debug(f"Cache miss or stale: schema-{version or 'default'}")
+                return None
+            cached = entry.version
+
+        file = self.cached_file(cached)
+        if file is None:
+            LOG.debug(f"Cache miss: schema-{cached}")
+            return None
+
+        return self._load(file)
+
+    def fetch_schema(self, version: Optional[str] = None) -> OcsfSchema:
+        """Fetch a schema from the server and cache it, or revalidate the cached copy.
+
+        Unlike get_schema, the cache isn't read first and the version isn't
+        checked against the server's versions.
+
+        Args:
+            version: A version, or None for the server's default version.
+
+        Returns:
+            The fetched schema.
+
+        Raises:
+            URLError: If the schema can't be fetched, and no stale cached copy
+                can be used instead.
+        """
+        url = self._schema_url(version)
+        if self._cache_dir is None:
+            LOG.debug(f"Fetching schema from {url} (version {version})")
+            with self._pool.request(url) as response:
+                return from_reader(cast(IO[bytes], response))
+
+        entry = self.cache_entry(version)
+        file = None if entry is None else self.cached_file(entry.version)
+        if entry is not None and file is not None:
+            LOG.debug(f"Revalidating schema from {url} (version {version})")
+            try:
+                with self._pool.request(url, entry.conditional_headers()) as response:
+                    if response.status == 304:
+                        response.read()
+                        write_entry(self._entry_path(self._cache_dir, version), entry.revalidated(response.headers))
+                        return self._load(file)
+                    schema = from_reader(cast(IO[bytes], response))
+            except URLError as e:
+                if not self._stale_if_error or (isinstance(e, HTTPError) and e.code < 500):
+                    raise
+                LOG.warning(f"Using stale cached schema, unable to revalidate it with {url}: {e}")
+                return self._load(file)
+        else:
+            LOG.debug(f"Fetching schema from {url} (version {version})")
+            with self._pool.request(url) as response:
+                schema = from_reader(cast(IO[bytes], response))
+
+        dest = self._cache_dir / f"schema-{schema.version}{self._suffix}"
+        LOG.debug(f"Caching schema to {dest}")
+        write_atomic(dest, lambda tmp: to_file(schema, str(tmp), compression_for_path(dest)))
+        if self._snapshots:
+            save_snapshot(schema, dest)
+
+        fetched = CacheEntry(schema.version).revalidated(response.headers)
+        if self.is_revalidated(schema.version):
+            write_entry(self._entry_path(self._cache_dir, schema.version), fetched)
+        if version is None:
+            write_entry(self._entry_path(self._cache_dir, None), fetched)
 
         return schema
 
+    def get_schema_file(self, path: str | Path) -> OcsfSchema:
+        """Parse a schema from a local JSON file.
+
+        If cache_dir is set and snapshots are enabled, the file's snapshot is
+        kept in cache_dir rather than next to the file.
+
+        Args:
+            path: The path of the JSON file.
+
+        Returns:
+            The parsed OcsfSchema.
+
+        Raises:
+            FileNotFoundError: If the file doesn't exist.
+        """
+        if self._cache_dir is not None and self._snapshots:
+            if not self._cache_dir.exists():
+                LOG.debug(f"Creating cache directory: {self._cache_dir}")
+                self._cache_dir.mkdir(parents=True, exist_ok=True)
+            return from_file_snapshot(path, self._cache_dir)
+
+        return from_file(str(path))
+
 
 def from_http(version: Optional[str] = None) -> OcsfSchema:
     """Fetch a schema from the OCSF server.
@@ -0,0 +1,258 @@
+"""Reduce the memory footprint of a parsed OCSF schema.
+
+The export format inlines the full definition of every attribute into every
+event and object that uses it, so a parsed schema holds hundreds of identical
+copies of attributes like `metadata`, `time`, and `severity_id`, along with
+their captions, descriptions, and enums.
+
+intern_schema() rewrites a schema in place so that equal strings are interned
+and structurally identical OcsfAttr, OcsfEnumMember, and OcsfDeprecationInfo
+instances are replaced with a single shared instance. The schema compares equal
+to the original afterwards.
+
+Shared instances appear in many places in the schema, so they are frozen (see
+freeze in the model module): assigning a field of an attribute raises a
+FrozenInstanceError rather than changing it for every event and object that
+shares it. To modify an attribute, replace it with a copy, for example with
+dataclasses.replace.
+
+Example:
+
+```python
+schema = from_file("schema.json", intern=True)
+
+pool = InternPool()
+stats = intern_schema(from_file("schema-1.1.0.json"), pool)
+stats = intern_schema(from_file("schema-1.2.0.json"), pool)
+print(f"Saved {stats.saved} bytes")
+```
+"""
+
+import sys
+
+from dataclasses import dataclass, fields
+from typing import Any, Hashable, Optional, TypeVar, cast
+
+from .model import (
+    OcsfAttr,
+    OcsfDeprecationInfo,
+    OcsfEnumMember,
+    OcsfEvent,
+    OcsfModel,
+    OcsfObject,
+    OcsfSchema,
+    OcsfType,
+    freeze,
+    is_frozen,
+)
+
+M = TypeVar("M", bound=OcsfModel)
+
+
+@dataclass
+class InternStats:
+    """Memory usage of a schema before and after interning, in bytes."""
+
+    bytes_before: int
+    bytes_after: int
+
+    @property
+    def saved(self) -> int:
+        return self.bytes_before - self.bytes_after
+
+
+def _freeze(value: Any) -> Hashable:
+    """A hashable representation of a value to detect structurally identical models.
+
+    Nested models are represented by their identity, so they must already be
+    shared instances.
+    """
+    if isinstance(value, OcsfModel):
+        return ("model", id(value))
+    if isinstance(value, dict):
+        return ("dict", tuple((k, _freeze(v)) for k, v in cast(dict[Any, Any], value).items()))
+    if isinstance(value, list):
+        return ("list", tuple(_freeze(v) for v in cast(list[Any], value)))
+    # Include the type so that values like True and 1 aren't conflated.
+    return (type(cast(object, value)), value)
+
+
+class InternPool:
+    """The shared instances used by intern_schema.
+
+    A pool can be reused across schemas to share attributes and enum members
+    between several versions of the schema held in memory at once. The pool
+    keeps every instance it has seen alive for as long as it exists.
+    """
+
+    def __init__(self):
+        self._models: dict[Hashable, OcsfModel] = {}
+        self._fields: dict[type, tuple[str, ...]] = {}
+
+    def string(self, value: Optional[str]) -> Optional[str]:
+        """Intern a string."""
+        return sys.intern(value) if value is not None else None
+
+    def share(self, model: M) -> M:
+        """Return the shared instance that is structurally identical to model, frozen."""
+        names = self._fields.get(type(model))
+        if names is None:
+            names = self._fields[type(model)] = tuple(f.name for f in fields(model))  # type: ignore
+
+        key = (type(model), tuple(_freeze(getattr(model, name)) for name in names))
+        shared = cast(M, self._models.setdefault(key, model))
+        freeze(shared)
+        return shared
+
+    def deprecation(self, info: Optional[OcsfDeprecationInfo]) -> Optional[OcsfDeprecationInfo]:
+        if info is None:
+            return None
+        if is_frozen(info):
+            return self.share(info)
+
+        info.message = sys.intern(info.message)
+        info.since = sys.intern(info.since)
+        return self.share(info)
+
+    def enum_member(self, member: OcsfEnumMember) -> OcsfEnumMember:
+        if is_frozen(member):
+            return self.share(member)
+
+        member.caption = sys.intern(member.caption)
+        member.description = self.string(member.description)
+        member.notes = self.string(member.notes)
+        return self.share(member)
+
+    def attr(self, attr: OcsfAttr) -> OcsfAttr:
+        # Attributes that are already shared, as when interning a schema again,
+        # are already interned.
+        if is_frozen(attr):
+            return self.share(attr)
+
+        attr.caption = sys.intern(attr.caption)
+        attr.requirement = sys.intern(attr.requirement)
+        attr.type = sys.intern(attr.type)
+        attr.description = self.string(attr.description)
+        attr.group = self.string(attr.group)
+        attr.sibling = self.string(attr.sibling)
+        attr.deprecated = self.deprecation(attr.deprecated)
+
+        if isinstance(attr.profile, str):
+            attr.profile = sys.intern(attr.profile)
+        elif attr.profile is not None:
+            attr.profile = [sys.intern(p) for p in attr.profile]
+
+        if attr.enum is not None:
+            attr.enum = {sys.intern(k): self.enum_member(v) for k, v in attr.enum.items()}
+
+        return self.share(attr)
+
+    def _attributes(self, attributes: dict[str, OcsfAttr]) -> dict[str, OcsfAttr]:
+        return {sys.intern(k): self.attr(v) for k, v in attributes.items()}
+
+    def _names(self, names: Optional[list[str]]) -> Optional[list[str]]:
+        return [sys.intern(n) for n in names] if names is not None else None
+
+    def _name_lists(self, d: Optional[dict[str, list[str]]]) -> Optional[dict[str, list[str]]]:
+        if d is None:
+            return None
+        return {sys.intern(k): [sys.intern(n) for n in v] for k, v in d.items()}
+
+    def event(self, event: OcsfEvent) -> None:
+        """Intern the contents of an event in place."""
+        event.caption = sys.intern(event.caption)
+        event.name = sys.intern(event.name)
+        event.description = self.string(event.description)
+        event.category = self.string(event.category)
+        event.extends = self.string(event.extends)
+        event.profiles = self._names(event.profiles)
+        event.associations = self._name_lists(event.associations)
+        event.constraints = self._name_lists(event.constraints)
+        event.deprecated = self.deprecation(event.deprecated)
+        event.attributes = self._attributes(event.attributes)
+
+    def obj(self, obj: OcsfObject) -> None:
+        """Intern the contents of an object in place."""
+        obj.caption = sys.intern(obj.caption)
+        obj.name = sys.intern(obj.name)
+        obj.description = self.string(obj.description)
+        obj.extends = self.string(obj.extends)
+        obj.profiles = self._names(obj.profiles)
+        obj.constraints = self._name_lists(obj.constraints)
+        obj.deprecated = self.deprecation(obj.deprecated)
+        obj.attributes = self._attributes(obj.attributes)
+
+    def data_type(self, t: OcsfType) -> None:
+        """Intern the contents of a type in place."""
+        t.caption = sys.intern(t.caption)
+        t.description = self.string(t.description)
+        t.regex = self.string(t.regex)
+        t.type = self.string(t.type)
+        t.type_name = self.string(t.type_name)
+        t.deprecated = self.deprecation(t.deprecated)
+
+
+def footprint(obj: Any) -> int:
+    """Estimate the memory used by an object graph in bytes.
+
+    Every object reachable from obj through models, dicts, lists, and tuples is
+    counted once, no matter how many times it is referenced.
+    """
+    seen: set[int] = set()
+    total = 0
+    stack: list[Any] = [obj]
+
+    while len(stack) > 0:
+        value = stack.pop()
+        if id(value) in seen:
+            continue
+        seen.add(id(value))
+        total += sys.getsizeof(value)
+
+        if isinstance(value, OcsfModel):
+            stack.append(value.__dict__)
+        elif isinstance(value, dict):
+            for k, v in cast(dict[Any, Any], value).items():
+                stack.append(k)
+                stack.append(v)
+        elif isinstance(value, (list, tuple)):
+            stack.extend(cast(list[Any], value))
+
+    return total
+
+
+def intern_schema(schema: OcsfSchema, pool: Optional[InternPool] = None) -> InternStats:
+    """Intern strings and share identical attributes and enum members in place.
+
+    Args:
+        schema: The schema to intern. It is modified in place, and its
+            attributes, enum members, and deprecation information are frozen.
+        pool: The pool of shared instances to use. Pass the same pool when
+            interning several schemas to share instances between them.
+
+    Returns:
+        The memory used by the schema before and after interning.
+    """
+    if pool is None:
+        pool = InternPool()
+
+    before = footprint(schema)
+
+    schema.version = sys.intern(schema.version)
+    schema.classes = {sys.intern(k): v for k, v in schema.classes.items()}
+    schema.objects = {sys.intern(k): v for k, v in schema.objects.items()}
+    schema.types = {sys.intern(k): v for k, v in schema.types.items()}
+
+    for event in schema.classes.values():
+        pool.event(event)
+
+    for obj in schema.objects.values():
+        pool.obj(obj)
+
+    for t in schema.types.values():
+        pool.data_type(t)
+
+    if schema.base_event is not None:
+        pool.event(schema.base_event)
+
+    return InternStats(before, footprint(schema))
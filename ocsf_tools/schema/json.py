@@ -6,15 +6,142 @@ schema = from_json('{"version": "1.0.0", "classes": [], "objects": []}')
 schema = from_file("schema.json")
 ```
 
+JSON is decoded with a JsonBackend. If orjson is installed (it is the orjson
+extra of this package), it is used by default; otherwise, the standard
+library's json module is used. The backend can be changed with set_backend.
+from_file and from_reader decode whole documents with orjson, and parse them
+incrementally with from_stream otherwise.
+
+Schemas are always encoded by the standard library, in its default format, so
+the JSON written for a schema is the same whichever libraries are installed.
 """
 
 import json
-from dataclasses import asdict
-from typing import Any, cast
+import logging
+from abc import ABC, abstractmethod
+from dataclasses import asdict, replace
+from typing import IO, Any, Callable, Mapping, Optional, cast
 
-from dacite import from_dict
+# orjson is optional. Install it to speed up loading and saving schemas.
+try:
+    import orjson  # pyright: ignore[reportMissingImports]
+except ImportError:  # pragma: no cover
+    orjson = None
 
+from .compression import open_read, open_write
+from .decoder import Decoder
+from .encoder import Encoder
+from .intern import intern_schema
+from .lazy import is_lazy, lazy_schema
 from .model import OcsfSchema
+from .stream import DEFAULT_CHUNK_SIZE, stream_schema
+
+LOG = logging.getLogger(__name__)
+
+
+class JsonBackend(ABC):
+    """A JSON library used to encode and decode schemas."""
+
+    name: str
+
+    @abstractmethod
+    def loads(self, data: str | bytes) -> Any:
+        """Decode a JSON document from a string or UTF-8 encoded bytes."""
+        raise NotImplementedError()
+
+    @abstractmethod
+    def dumps(self, obj: Any, default: Optional[Callable[[Any], Any]] = None) -> bytes:
+        """Encode a value as a UTF-8 encoded JSON document.
+
+        Args:
+            obj: The value to encode.
+            default: A function called with values, including dataclasses,
+                that the backend can't encode natively. It returns a value that
+                can be encoded in their place.
+        """
+        raise NotImplementedError()
+
+
+class StdlibJsonBackend(JsonBackend):
+    """The standard library's json module."""
+
+    name = "json"
+
+    def loads(self, data: str | bytes) -> Any:
+        return json.loads(data)
+
+    def dumps(self, obj: Any, default: Optional[Callable[[Any], Any]] = None) -> bytes:
+        return json.dumps(obj, default=default).encode("utf-8")
+
+
+class OrjsonBackend(JsonBackend):
+    """The orjson library, which is considerably faster than the standard library."""
+
+    name = "orjson"
+
+    def __init__(self):
+        if orjson is None:
+            raise ImportError("orjson is not installed")
+
+    def loads(self, data: str | bytes) -> Any:
+        return orjson.loads(data)  # type: ignore
+
+    def dumps(self, obj: Any, default: Optional[Callable[[Any], Any]] = None) -> bytes:
+        if default is None:
+            return orjson.dumps(obj)  # type: ignore
+        # orjson encodes dataclasses itself unless told to pass them to default.
+        return orjson.dumps(obj, default=default, option=orjson.OPT_PASSTHROUGH_DATACLASS)  # type: ignore
+
+
+def available_backends() -> list[str]:
+    """The names of the JSON backends that can be used in this environment."""
+    return ["json"] if orjson is None else ["orjson", "json"]
+
+
+def _create_backend(name: str) -> JsonBackend:
+    match name:
+        case "json":
+            return StdlibJsonBackend()
+        case "orjson":
+            return OrjsonBackend()
+        case _:
+            raise ValueError(f"Unknown JSON backend: {name}")
+
+
+_backend: JsonBackend = _create_backend(available_backends()[0])
+
+# Writes schemas, whichever backend is in use.
+_WRITER: JsonBackend = StdlibJsonBackend()
+
+# The separators that the standard library writes between items and between
+# keys and values.
+_ITEM_SEPARATOR = b", "
+_KEY_SEPARATOR = b": "
+
+
+def get_backend() -> JsonBackend:
+    """The JSON backend currently in use."""
+    return _backend
+
+
+def set_backend(backend: str | JsonBackend) -> JsonBackend:
+    """Change the JSON backend.
+
+    Args:
+        backend: A JsonBackend or the name of one of the available_backends.
+
+    Returns:
+        The previous backend, so that it can be restored.
+
+    Raises:
+        ValueError: If the backend name is not recognized.
+        ImportError: If the backend's library is not installed.
+    """
+    global _backend
+    previous = _backend
+    _backend = backend if isinstance(backend, JsonBackend) else _create_backend(backend)
+    return previous
+
 
 # Certain OCSF properties have special characters in their names.
 _KEY_TRANSFORMS = {
@@ -29,58 +156,184 @@ _NAME_TRANSFORMS = {
 
 
 def keys_to_names(d: dict[str, Any]) -> dict[str, Any]:
-    """Transform OCSF property names in JSON to Python-friendly names."""
-    ops: list[tuple[str, str]] = []
+    """Transform OCSF property names in JSON to Python-friendly names.
+
+    from_json renames properties while decoding, so this is only needed for
+    dictionaries decoded by other means.
+    """
+    return {
+        _KEY_TRANSFORMS.get(k, k): keys_to_names(cast(dict[str, Any], v)) if isinstance(v, dict) else v
+        for k, v in d.items()
+    }
 
-    for k, v in d.items():
-        if k in _KEY_TRANSFORMS:
-            ops.append((k, _KEY_TRANSFORMS[k]))
 
-        if isinstance(v, dict):
-            d[k] = keys_to_names(cast(dict[str, Any], v))
+def names_to_keys(d: dict[str, Any]) -> dict[str, Any]:
+    """Transform Python-friendly names to OCSF property names in JSON.
 
-    for op in ops:
-        d[op[1]] = d[op[0]]
-        del d[op[0]]
+    to_dict renames properties while encoding, so this is only needed for
+    dictionaries built by other means.
+    """
+    return {
+        _NAME_TRANSFORMS.get(k, k): names_to_keys(cast(dict[str, Any], v)) if isinstance(v, dict) else v
+        for k, v in d.items()
+    }
 
-    return d
 
+def _named_dict(items: list[tuple[str, Any]]) -> dict[str, Any]:
+    """Build the dictionary for a model's fields, using OCSF property names.
+
+    asdict only calls this for dataclasses, so the keys of dictionaries like
+    attributes and enums are never renamed.
+    """
+    return {_NAME_TRANSFORMS.get(k, k): v for k, v in items}
+
+
+# The decoder renames OCSF property names while it builds the dataclasses, so
+# keys_to_names is not needed when parsing.
+_DECODER = Decoder(aliases=_KEY_TRANSFORMS)
+_ENCODER = Encoder(names=_NAME_TRANSFORMS)
+
+
+def _intern(schema: OcsfSchema) -> OcsfSchema:
+    stats = intern_schema(schema)
+    LOG.info(f"Interning schema {schema.version} saved {stats.saved} of {stats.bytes_before} bytes")
+    return schema
+
+
+def from_json(data: str | bytes, intern: bool = False, lazy: bool = False) -> OcsfSchema:
+    """Parse an OCSF schema from a JSON string.
+
+    Args:
+        data: The JSON string, or UTF-8 encoded bytes.
+        intern: Intern strings and share identical attributes and enum members
+            to reduce memory usage. The shared instances are frozen.
+            See intern_schema.
+        lazy: Only decode events and objects when they are first accessed. See
+            the lazy module.
+
+    Raises:
+        ValueError: If both intern and lazy are set.
+    """
+    if lazy:
+        if intern:
+            raise ValueError("A schema can't be both interned and lazy")
+        # The lazy index relies on the standard library's scanner, which needs a str.
+        return lazy_schema(data.decode("utf-8") if isinstance(data, bytes) else data, _DECODER)
+
+    schema = _DECODER.decode(OcsfSchema, _backend.loads(data))
+    return _intern(schema) if intern else schema
 
-def names_to_keys(d: dict[str, Any]) -> dict[str, Any]:
-    """Transform Python-friendly names to OCSF property names in JSON."""
-    for k, v in d.items():
-        if k in _NAME_TRANSFORMS:
-            d[_NAME_TRANSFORMS[k]] = d[k]
-            del d[k]
 
-        if isinstance(k, dict):
-            d[k] = names_to_keys(v)
+def from_stream(fp: IO[bytes] | IO[str], chunk_size: int = DEFAULT_CHUNK_SIZE) -> OcsfSchema:
+    """Parse an OCSF schema incrementally from a binary or text stream.
 
-    return d
+    Events and objects are built as they are read, so the whole JSON document
+    is never held in memory. See the stream module.
 
+    Args:
+        fp: The stream, like an open file or an HTTP response.
+        chunk_size: The number of bytes or characters to read at a time.
+    """
+    return stream_schema(fp, _DECODER, chunk_size)
 
-def from_json(data: str) -> OcsfSchema:
-    """Parse an OCSF schema from a JSON string."""
-    return from_dict(OcsfSchema, keys_to_names(json.loads(data)))  # type: ignore
+
+def from_reader(fp: IO[bytes] | IO[str]) -> OcsfSchema:
+    """Parse an OCSF schema from a binary or text stream as quickly as possible.
+
+    With the standard library backend, the stream is parsed incrementally with
+    from_stream. Other backends, like orjson, decode a whole document much
+    faster than the incremental parser, so the stream is read in full and
+    decoded by the backend with from_json.
+
+    Args:
+        fp: The stream, like an open file or an HTTP response.
+    """
+    if isinstance(_backend, StdlibJsonBackend):
+        return from_stream(fp)
+    return from_json(fp.read())
 
 
 def to_dict(schema: OcsfSchema) -> dict[str, Any]:
     """Convert an OCSF schema to a dictionary."""
-    return names_to_keys(asdict(schema))
+    if is_lazy(schema):
+        schema = replace(schema, classes=dict(schema.classes), objects=dict(schema.objects))
+    return asdict(schema, dict_factory=_named_dict)
 
 
 def to_json(schema: OcsfSchema) -> str:
-    """Convert an OCSF schema to a JSON string."""
-    return json.dumps(to_dict(schema))
+    """Convert an OCSF schema to a JSON string.
+
+    The string is the same whichever JSON backend is in use.
+    """
+    return _WRITER.dumps(schema, _ENCODER.default).decode("utf-8")
+
+
+def to_stream(schema: OcsfSchema, fp: IO[bytes]) -> None:
+    """Write an OCSF schema as JSON to a binary stream.
+
+    The schema is encoded one event, object, and type at a time, so neither a
+    copy of the schema as dictionaries nor the complete JSON document is ever
+    held in memory. The output is identical to to_json, whatever the JSON
+    backend.
+
+    Args:
+        schema: The schema.
+        fp: The stream, like a file opened in binary mode.
+    """
+
+    def dumps(value: Any) -> bytes:
+        return _WRITER.dumps(value, _ENCODER.default)
+
+    fp.write(b"{")
+    for i, (key, name) in enumerate(_ENCODER.keys(OcsfSchema)):
+        if i > 0:
+            fp.write(_ITEM_SEPARATOR)
+        fp.write(dumps(key) + _KEY_SEPARATOR)
+
+        value = getattr(schema, name)
+        if isinstance(value, Mapping):
+            fp.write(b"{")
+            for j, (k, v) in enumerate(cast(Mapping[str, Any], value).items()):
+                if j > 0:
+                    fp.write(_ITEM_SEPARATOR)
+                fp.write(dumps(k) + _KEY_SEPARATOR + dumps(v))
+            fp.write(b"}")
+        else:
+            fp.write(dumps(value))
+    fp.write(b"}")
+
+
+def from_file(path: str, intern: bool = False, lazy: bool = False) -> OcsfSchema:
+    """Parse an OCSF schema from a JSON file.
+
+    Compressed files are decompressed as they are read. See the compression
+    module.
+
+    Args:
+        path: The path of the JSON file.
+        intern: Intern strings and share identical attributes and enum members.
+            See from_json.
+        lazy: Only decode events and objects when they are first accessed. See
+            from_json. Otherwise, the file is parsed with from_reader.
+    """
+    if lazy:
+        with open_read(path) as f:
+            return from_json(f.read(), intern, lazy)
 
+    with open_read(path) as f:
+        schema = from_reader(f)
+    return _intern(schema) if intern else schema
 
-def from_file(path: str) -> OcsfSchema:
-    """Parse an OCSF schema from a JSON file."""
-    with open(path, "r") as f:
-        return from_json(f.read())
 
+def to_file(schema: OcsfSchema, path: str, compression: Optional[str] = None) -> None:
+    """Write an OCSF schema to a JSON file. See to_stream.
 
-def to_file(schema: OcsfSchema, path: str) -> None:
-    """Write an OCSF schema to a JSON file."""
-    with open(path, "w") as f:
-        f.write(to_json(schema))
+    Args:
+        schema: The schema.
+        path: The path of the JSON file.
+        compression: The compression to use, like "gzip". Defaults to the
+            compression implied by the file's extension, like .gz, if any. See
+            the compression module.
+    """
+    with open_write(path, compression) as f:
+        to_stream(schema, f)
@@ -0,0 +1,192 @@
+"""Lazily decoded OCSF schemas.
+
+Most tools only look at a handful of the events and objects in a schema, but a
+schema parsed by from_json builds all of them up front. A lazy schema keeps the
+JSON text and an index of where each event and object starts in it, and only
+decodes an event or object into an OcsfEvent or OcsfObject the first time it is
+read.
+
+Building the index still scans the whole document, but each event and object is
+discarded as soon as its extent is known, so the full dictionary produced by
+json.loads never exists at once.
+
+The classes and objects of a lazy schema are LazyModels mappings rather than
+dicts. They behave like dicts in every other respect.
+
+Example:
+
+```python
+schema = from_file("schema.json", lazy=True)
+event = schema.classes["authentication"]  # Only authentication is decoded
+```
+"""
+
+import json
+import re
+
+from json.scanner import make_scanner
+from typing import Any, Callable, Generator, Generic, Iterator, MutableMapping, TypeVar, cast
+
+from .decoder import Decoder
+from .model import OcsfEvent, OcsfModel, OcsfObject, OcsfSchema
+
+M = TypeVar("M", bound=OcsfModel)
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+# The scanner that JSONDecoder uses to decode a value starting at a position.
+_SCAN: Callable[[str, int], tuple[Any, int]] = make_scanner(cast(Any, json.JSONDecoder()))
+
+# Members of the top-level object that are indexed rather than decoded.
+_INDEXED = ("classes", "objects")
+
+
+class LazyModels(MutableMapping[str, M], Generic[M]):
+    """A mapping of names to models that are decoded on first access."""
+
+    def __init__(self, raw: dict[str, Any], decode: Callable[[Any], M]):
+        """Create a new mapping.
+
+        Args:
+            raw: A dictionary of names to undecoded models, in any form that
+                decode accepts. It is taken over by the mapping.
+            decode: The function used to decode a model.
+        """
+        # Values are either undecoded or decoded models. Keeping both in one
+        # dict preserves the order of the original JSON.
+        self._items = raw
+        self._decode = decode
+
+    def __getitem__(self, key: str) -> M:
+        value = self._items[key]
+        if not isinstance(value, OcsfModel):
+            value = self._decode(value)
+            self._items[key] = value
+        return cast(M, value)
+
+    def __setitem__(self, key: str, value: M) -> None:
+        self._items[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        del self._items[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._items)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._items
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({len(self._items)} items, {self.decoded()} decoded)"
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # The decode function can't be pickled, so pickle as a plain dict.
+        return (dict, (dict(self.items()),))
+
+    def is_decoded(self, key: str) -> bool:
+        """Has the model at key been decoded yet?"""
+        return isinstance(self._items[key], OcsfModel)
+
+    def decoded(self) -> int:
+        """The number of models that have been decoded."""
+        return sum(1 for v in self._items.values() if isinstance(v, OcsfModel))
+
+
+def is_lazy(schema: OcsfSchema) -> bool:
+    """Does a schema have lazily decoded classes or objects?"""
+    return isinstance(schema.classes, LazyModels) or isinstance(schema.objects, LazyModels)
+
+
+def _skip(text: str, pos: int) -> int:
+    """Skip whitespace."""
+    match = _WHITESPACE.match(text, pos)
+    return match.end() if match is not None else pos
+
+
+def _expect(text: str, pos: int, char: str) -> int:
+    """Skip whitespace and a single expected character."""
+    pos = _skip(text, pos)
+    if text[pos : pos + 1] != char:
+        raise json.JSONDecodeError(f"Expecting '{char}'", text, pos)
+    return pos + 1
+
+
+def _members(text: str, pos: int) -> Generator[tuple[str, int], int, int]:
+    """Iterate over the members of the JSON object that starts at pos.
+
+    Yields the key and the position of the value of each member. The caller
+    must send the position of the end of the value back to the generator. The
+    generator returns the position of the end of the object.
+    """
+    pos = _skip(text, _expect(text, pos, "{"))
+    if text[pos : pos + 1] == "}":
+        return pos + 1
+
+    while True:
+        pos = _skip(text, pos)
+        key, pos = _SCAN(text, pos)
+        if not isinstance(key, str):
+            raise json.JSONDecodeError("Expecting property name", text, pos)
+        pos = _skip(text, _expect(text, pos, ":"))
+
+        end = yield (key, pos)
+        pos = _skip(text, end)
+
+        if text[pos : pos + 1] == "}":
+            return pos + 1
+        pos = _expect(text, pos, ",")
+
+
+def _index(text: str, pos: int) -> tuple[dict[str, int], int]:
+    """Index the positions of the values of the JSON object that starts at pos.
+
+    Returns the index and the position of the end of the object.
+    """
+    index: dict[str, int] = {}
+    members = _members(text, pos)
+    try:
+        key, start = next(members)
+        while True:
+            index[key] = start
+            _, end = _SCAN(text, start)
+            key, start = members.send(end)
+    except StopIteration as stop:
+        return index, stop.value
+
+
+def lazy_schema(text: str, decoder: Decoder) -> OcsfSchema:
+    """Build a lazy schema from the JSON text of an exported schema.
+
+    Args:
+        text: The JSON text. It is kept by the schema to decode events and
+            objects on demand.
+        decoder: The decoder used to build the schema's models.
+    """
+    data: dict[str, Any] = {}
+    indexes: dict[str, dict[str, int]] = {}
+
+    members = _members(text, 0)
+    try:
+        key, start = next(members)
+        while True:
+            if key in _INDEXED:
+                indexes[key], end = _index(text, start)
+            else:
+                data[key], end = _SCAN(text, start)
+            key, start = members.send(end)
+    except StopIteration:
+        pass
+
+    def decode_at(decode: Callable[[dict[str, Any]], M]) -> Callable[[int], M]:
+        return lambda pos: decode(_SCAN(text, pos)[0])
+
+    schema = decoder.decode(OcsfSchema, data)
+    schema.classes = cast(
+        dict[str, OcsfEvent], LazyModels(indexes.get("classes", {}), decode_at(decoder.decoder(OcsfEvent)))
+    )
+    schema.objects = cast(
+        dict[str, OcsfObject], LazyModels(indexes.get("objects", {}), decode_at(decoder.decoder(OcsfObject)))
+    )
+    return schema
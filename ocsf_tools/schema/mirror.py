@@ -0,0 +1,272 @@
+"""Mirror schema versions from the OCSF server into a cache directory.
+
+Fills a cache directory ahead of time, for example while building an image that
+will run offline. The list of versions is fetched (and cached, see
+OcsfServerClient), then every selected version is downloaded in parallel and
+written atomically to the cache along with its snapshot. Versions that are
+already cached and valid are skipped, so running the mirror again only fetches
+what is missing.
+
+A cached file is valid if it has an up to date snapshot (see has_snapshot), or
+if it can be parsed, in which case its snapshot is written.
+
+Usage:
+
+```
+$ python -m ocsf_tools.schema.mirror --cache ./schema_cache
+$ python -m ocsf_tools.schema.mirror --cache ./schema_cache 1.x ">=1.1.0,<1.3.0" 1.3.0-dev
+```
+
+Versions may be exact versions, "latest", major or minor versions like "1.x" or
+"1.2" (see resolve_version), or ranges of comparisons separated by commas, like
+">=1.1.0,<2.0.0". Without versions, every released version is mirrored.
+
+Example:
+
+```python
+client = OcsfServerClient(cache_dir="./schema_cache")
+report = mirror(client, ["1.x"])
+print(f"{len(report.downloaded)} downloaded at {report.throughput / 1e6:.1f} MB/s")
+```
+"""
+
+import logging
+import sys
+import time
+
+from argparse import ArgumentParser
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import partial
+from pathlib import Path
+from typing import Iterable, Optional, Sequence
+from urllib.error import URLError
+
+from semver import Version
+
+from .http import OcsfServerClient, is_semver, resolve_version
+from .snapshot import has_snapshot
+
+LOG = logging.getLogger(__name__)
+
+# The default number of versions downloaded at once.
+DEFAULT_WORKERS = 4
+
+_OPERATORS = ("<", ">", "=", "!")
+
+
+@dataclass
+class MirrorResult:
+    """The outcome of mirroring one version.
+
+    Attributes:
+        version: The version.
+        status: "downloaded", "skipped" if it was already cached and valid, or
+            "failed".
+        seconds: The time taken.
+        size: The size of the cached file, in bytes.
+        error: The error, if it failed.
+    """
+
+    version: str
+    status: str
+    seconds: float
+    size: int = 0
+    error: Optional[str] = None
+
+
+@dataclass
+class MirrorReport:
+    """The outcome of mirroring several versions.
+
+    Attributes:
+        results: The outcome of each version, in the order they were selected.
+        seconds: The wall clock time taken, including fetching the versions.
+        bytes_received: The number of response body bytes received from the
+            server, before decoding.
+    """
+
+    results: list[MirrorResult]
+    seconds: float
+    bytes_received: int
+
+    def _with_status(self, status: str) -> list[MirrorResult]:
+        return [r for r in self.results if r.status == status]
+
+    @property
+    def downloaded(self) -> list[MirrorResult]:
+        return self._with_status("downloaded")
+
+    @property
+    def skipped(self) -> list[MirrorResult]:
+        return self._with_status("skipped")
+
+    @property
+    def failed(self) -> list[MirrorResult]:
+        return self._with_status("failed")
+
+    @property
+    def throughput(self) -> float:
+        """Bytes received per second."""
+        return self.bytes_received / self.seconds if self.seconds > 0 else 0.0
+
+
+def _in_range(version: Version, spec: str) -> bool:
+    """Does a version match every comparison in a range like ">=1.1.0,<2.0.0"?"""
+    try:
+        return all(version.match(part.strip()) for part in spec.split(","))
+    except ValueError as e:
+        raise ValueError(f"Invalid version range: {spec}") from e
+
+
+def select_versions(specs: Iterable[str], versions: Sequence[str], prereleases: bool = False) -> list[str]:
+    """Select versions to mirror.
+
+    Args:
+        specs: Exact versions, "latest", major or minor versions like "1.x",
+            or ranges like ">=1.1.0,<2.0.0". If empty, every version is
+            selected.
+        versions: The versions available on the server.
+        prereleases: Whether ranges, and the selection of every version,
+            include prereleases like 1.3.0-dev. Prereleases requested
+            exactly are always selected.
+
+    Returns:
+        The selected versions, without duplicates, in the order of versions.
+
+    Raises:
+        ValueError: If a spec is invalid, or no version matches it.
+    """
+    specs = list(specs)
+    available = [v for v in versions if is_semver(v)]
+    if not specs:
+        return [v for v in available if prereleases or Version.parse(v).prerelease is None]
+
+    selected: set[str] = set()
+    for spec in specs:
+        if spec.startswith(_OPERATORS):
+            matches = [
+                v
+                for v in available
+                if (prereleases or Version.parse(v).prerelease is None) and _in_range(Version.parse(v), spec)
+            ]
+            if not matches:
+                raise ValueError(f"No version matching {spec} found on server")
+            selected.update(matches)
+        else:
+            selected.add(resolve_version(spec, available))
+
+    return [v for v in available if v in selected]
+
+
+def _valid(client: OcsfServerClient, file: Path) -> bool:
+    """Is a cached schema file valid? Writes its snapshot if it is missing."""
+    if client.snapshots and has_snapshot(file):
+        return True
+
+    try:
+        client.get_schema_file(file)
+        return True
+    except Exception as e:
+        LOG.warning(f"Replacing invalid cached schema {file}: {e}")
+        return False
+
+
+def _mirror_version(client: OcsfServerClient, version: str) -> MirrorResult:
+    """Download one version into the cache, unless it is already cached and valid."""
+    start = time.perf_counter()
+    try:
+        # Dev versions are revalidated by get_schema instead.
+        if not client.is_revalidated(version):
+            file = client.cached_file(version)
+            if file is not None:
+                if _valid(client, file):
+                    return MirrorResult(version, "skipped", time.perf_counter() - start, file.stat().st_size)
+                file.unlink()
+
+        schema = client.get_schema(version)
+        file = client.cached_file(schema.version)
+        size = file.stat().st_size if file is not None else 0
+        return MirrorResult(version, "downloaded", time.perf_counter() - start, size)
+    except (URLError, OSError, ValueError) as e:
+        return MirrorResult(version, "failed", time.perf_counter() - start, error=str(e))
+
+
+def mirror(
+    client: OcsfServerClient,
+    specs: Iterable[str] = (),
+    workers: int = DEFAULT_WORKERS,
+    prereleases: bool = False,
+) -> MirrorReport:
+    """Mirror schema versions into a client's cache directory.
+
+    Args:
+        client: The client, which must have a cache directory.
+        specs: The versions to mirror. See select_versions.
+        workers: The number of versions downloaded at once.
+        prereleases: Whether ranges, and the selection of every version,
+            include prereleases.
+
+    Returns:
+        The outcome of each version. Versions that fail to download are
+        reported rather than raised.
+
+    Raises:
+        ValueError: If the client has no cache directory, workers is less than
+            1, or a spec is invalid.
+        URLError: If the versions can't be fetched or read from the cache.
+    """
+    cache_dir = client.cache_dir
+    if cache_dir is None:
+        raise ValueError("The client has no cache directory to mirror into")
+    if workers < 1:
+        raise ValueError(f"workers must be at least 1, not {workers}")
+
+    start = time.perf_counter()
+    received = client.pool.stats.bytes_received
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    versions = select_versions(specs, client.get_versions(), prereleases)
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        results = list(pool.map(partial(_mirror_version, client), versions))
+
+    return MirrorReport(results, time.perf_counter() - start, client.pool.stats.bytes_received - received)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Run the mirror from the command line, returning the exit status."""
+    parser = ArgumentParser(description="Mirror OCSF schema versions into a cache directory")
+    parser.add_argument("versions", nargs="*", help='Versions, like 1.1.0, latest, 1.x, or ">=1.1.0,<2.0.0"')
+    parser.add_argument("--cache", default="./schema_cache", help="Path to the schema cache directory")
+    parser.add_argument("--url", default="https://schema.ocsf.io", help="Base URL of the OCSF server")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS, help="Number of parallel downloads")
+    parser.add_argument("--compression", help="Compression of cached schemas, like gzip")
+    parser.add_argument("--prereleases", action="store_true", help="Include prereleases in ranges")
+    args = parser.parse_args(argv)
+
+    try:
+        client = OcsfServerClient(args.url, args.cache, compression=args.compression, pool_size=max(1, args.workers))
+        report = mirror(client, args.versions, args.workers, args.prereleases)
+    except ValueError as e:
+        print(e)
+        return 1
+    except URLError:
+        print("Unable to communicate with the OCSF server")
+        return 1
+
+    for result in report.results:
+        line = f"{result.version:<16} {result.status:<10} {result.size / 1e6:>8.2f} MB {result.seconds:>8.2f} s"
+        if result.error is not None:
+            line += f"  {result.error}"
+        print(line)
+
+    print(
+        f"Mirrored {len(report.results)} versions to {args.cache} in {report.seconds:.2f} s: "
+        f"{len(report.downloaded)} downloaded, {len(report.skipped)} skipped, {len(report.failed)} failed"
+    )
+    print(f"Received {report.bytes_received / 1e6:.2f} MB at {report.throughput / 1e6:.2f} MB/s")
+    return 1 if report.failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
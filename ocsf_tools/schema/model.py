@@ -1,14 +1,70 @@
 """This module contains the dataclasses that represent the OCSF schema."""
 
 from abc import ABC
-from dataclasses import dataclass, field
+from dataclasses import FrozenInstanceError, dataclass, field
 from enum import StrEnum
-from typing import Any, Optional, TypeVar
+from typing import Any, ClassVar, Optional, TypeVar
 
 
 class OcsfModel(ABC): ...
 
 
+class _Frozen(OcsfModel):
+    """The base of the read-only variants of the model classes. See freeze."""
+
+    # The class the variant was made from. Frozen instances report it as their
+    # __class__, so they compare equal to its instances and are compared,
+    # copied, and pickled like them.
+    _model: ClassVar[type[OcsfModel]]
+
+    @property
+    def __class__(self) -> type[OcsfModel]:  # pyright: ignore[reportIncompatibleMethodOverride]
+        return self._model
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise FrozenInstanceError(f"cannot assign to field '{name}' of a frozen {self._model.__name__}")
+
+    def __delattr__(self, name: str) -> None:
+        raise FrozenInstanceError(f"cannot delete field '{name}' of a frozen {self._model.__name__}")
+
+    def __reduce_ex__(self, protocol: Any) -> tuple[Any, ...]:
+        # Copies and pickles are instances of the model class, and not frozen.
+        reduced = object.__reduce_ex__(self, protocol)
+        assert isinstance(reduced, tuple)
+        return (reduced[0], (self._model,) + tuple(reduced[1][1:])) + reduced[2:]
+
+
+# The read-only variant of each model class, created when first needed.
+_FROZEN_CLASSES: dict[type[OcsfModel], type[_Frozen]] = {}
+
+
+def freeze(model: OcsfModel) -> None:
+    """Make a model read-only, for example because it is shared by several parents.
+
+    Assigning or deleting a field of a frozen model raises a
+    dataclasses.FrozenInstanceError. The dictionaries and lists in its fields
+    can still be modified. A frozen model otherwise behaves like any other:
+    it compares equal to unfrozen models with the same content, and copies of
+    it, like those made by copy.deepcopy or dataclasses.replace, are not frozen.
+
+    Freezing a model costs nothing, and doesn't slow down other models.
+    """
+    cls = type(model)
+    if issubclass(cls, _Frozen):
+        return
+
+    frozen = _FROZEN_CLASSES.get(cls)
+    if frozen is None:
+        namespace = {"_model": cls, "__qualname__": cls.__qualname__, "__module__": cls.__module__}
+        frozen = _FROZEN_CLASSES[cls] = type(cls.__name__, (_Frozen, cls), namespace)
+    model.__class__ = frozen
+
+
+def is_frozen(model: OcsfModel) -> bool:
+    """Has a model been frozen with freeze()?"""
+    return isinstance(model, _Frozen)
+
+
 # TODO: is this used?
 @dataclass
 class OcsfVersion(OcsfModel):
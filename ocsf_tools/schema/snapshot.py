@@ -0,0 +1,294 @@
+"""Binary snapshots of parsed OCSF schemas.
+
+Parsing a schema from JSON is the slowest part of loading it. A snapshot is a
+pickle of the parsed OcsfSchema object graph, stored alongside the JSON file it
+was parsed from, that can be loaded instead of parsing the JSON again.
+
+Each snapshot is keyed by a hash of the JSON file's content (as stored, so
+compressed if the file is compressed), the version of this library, and the
+fields of the schema models, so a snapshot is ignored (and replaced) as soon as
+any of them change. Snapshots that can't be read for any reason are treated as
+missing.
+
+Hashing the JSON file on every load would cost more than the rest of the
+checks, so snapshots also record the size and modification time of the file
+they were written for. The file is only hashed when those have changed, and if
+its content hasn't, the recorded size and modification time are updated. A file
+rewritten with the same size within the resolution of the filesystem's
+timestamps is not noticed, as with other tools keyed by modification time.
+
+Snapshots stored in another directory than their JSON file, like a shared
+cache directory, are named after the file and a hash of its absolute path, so
+JSON files with the same name don't replace each other's snapshots.
+
+Models are pickled with their fingerprints, computed when the snapshot was
+written, so schemas loaded from a snapshot have them stored (see
+store_fingerprints in the fingerprint module) without another pass over the
+models. Writing a snapshot doesn't store fingerprints on the schema being
+written.
+
+Snapshots are pickles. Only read them from directories you trust, like your own
+schema cache.
+
+Example:
+
+```python
+schema = from_file_snapshot("schema_cache/schema-1.1.0.json")
+```
+"""
+
+import gc
+import hashlib
+import logging
+import pickle
+
+from dataclasses import fields
+from functools import cache
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+from typing import IO, Any, Optional, cast
+
+from .cache import write_atomic
+from .compression import decompress
+from .fingerprint import FINGERPRINT_VERSION, fingerprints, state_with_fingerprint
+from .json import from_json
+from .model import (
+    OcsfAttr,
+    OcsfDeprecationInfo,
+    OcsfEnumMember,
+    OcsfEvent,
+    OcsfObject,
+    OcsfSchema,
+    OcsfType,
+)
+
+LOG = logging.getLogger(__name__)
+
+_MAGIC = b"OCSF-SNAPSHOT-3\n"
+_SUFFIX = ".snapshot"
+
+
+@cache
+def _library_version() -> str:
+    try:
+        return version("ocsf-tools")
+    except PackageNotFoundError:
+        return "unknown"
+
+
+# The model layout is part of the key so that snapshots are invalidated by
+# changes to the models, even when the library version hasn't been bumped.
+# Snapshots hold fingerprints computed before they were written, so the
+# fingerprint version is too.
+_MODEL_SIGNATURE = f"fingerprint:{FINGERPRINT_VERSION};" + ";".join(
+    f"{cls.__name__}:{','.join(f.name for f in fields(cls))}"
+    for cls in (OcsfSchema, OcsfEvent, OcsfObject, OcsfAttr, OcsfEnumMember, OcsfType, OcsfDeprecationInfo)
+)
+
+
+def snapshot_key(data: bytes) -> bytes:
+    """Compute the key of a snapshot for the given JSON content."""
+    h = hashlib.sha256(data)
+    h.update(_library_version().encode())
+    h.update(_MODEL_SIGNATURE.encode())
+    return h.hexdigest().encode()
+
+
+def _stamp(path: Path) -> bytes:
+    """The size and modification time of a JSON file, with what else the key depends on.
+
+    Raises:
+        FileNotFoundError: If the file doesn't exist.
+    """
+    st = path.stat()
+    return b"%d:%d:%s:%s" % (st.st_size, st.st_mtime_ns, _library_version().encode(), _MODEL_SIGNATURE.encode())
+
+
+def snapshot_path(path: str | Path, snapshot_dir: Optional[str | Path] = None) -> Path:
+    """The location of the snapshot for a JSON file.
+
+    Args:
+        path: The path of the JSON file.
+        snapshot_dir: The directory to store the snapshot in. Defaults to the
+            directory of the JSON file. In another directory, the snapshot's
+            name includes a hash of the file's absolute path.
+    """
+    path = Path(path)
+    if snapshot_dir is None or Path(snapshot_dir).resolve() == path.parent.resolve():
+        return path.parent / (path.name + _SUFFIX)
+
+    digest = hashlib.sha256(str(path.resolve()).encode()).hexdigest()[:16]
+    return Path(snapshot_dir) / f"{path.name}.{digest}{_SUFFIX}"
+
+
+class _Pickler(pickle.Pickler):
+    """Pickles models with their fingerprints stored, without storing them on the models."""
+
+    def __init__(self, file: IO[bytes], digests: dict[int, bytes]):
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self._digests = digests
+
+    def reducer_override(self, obj: Any) -> Any:
+        digest = self._digests.get(id(obj))
+        if digest is None:
+            return NotImplemented
+        # The default reduction, with the fingerprint added to the state.
+        reduced = cast(tuple[Any, ...], obj.__reduce_ex__(pickle.HIGHEST_PROTOCOL))
+        return reduced[0], reduced[1], state_with_fingerprint(obj, digest)
+
+
+def _loads(body: bytes) -> Any:
+    """Unpickle a snapshot's schema."""
+    # Unpickling creates many objects and no garbage, so garbage collections
+    # triggered along the way only cost time.
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        return pickle.loads(body)
+    finally:
+        if enabled:
+            gc.enable()
+
+
+def _read(dest: Path, path: Path, stamp: bytes) -> Optional[OcsfSchema]:
+    """Read the snapshot of a JSON file, returning None if it's missing, stale, or unreadable."""
+    try:
+        with open(dest, "rb") as f:
+            if f.readline() != _MAGIC:
+                LOG.debug(f"Stale snapshot: {dest}")
+                return None
+            key = f.readline().rstrip(b"\n")
+            recorded = f.readline().rstrip(b"\n")
+            body = f.read()
+    except FileNotFoundError:
+        return None
+    except OSError as e:
+        LOG.warning(f"Ignoring unreadable snapshot {dest}: {e}")
+        return None
+
+    if recorded != stamp and key != snapshot_key(path.read_bytes()):
+        LOG.debug(f"Stale snapshot: {dest}")
+        return None
+
+    try:
+        schema = _loads(body)
+    except Exception as e:
+        LOG.warning(f"Ignoring unreadable snapshot {dest}: {e}")
+        return None
+
+    if not isinstance(schema, OcsfSchema):
+        LOG.warning(f"Ignoring snapshot {dest}: not an OcsfSchema")
+        return None
+
+    if recorded != stamp:
+        # The file was touched or copied without changing: record its new
+        # stamp so it isn't hashed again.
+        try:
+            write_atomic(dest, _MAGIC + key + b"\n" + stamp + b"\n" + body)
+        except OSError as e:
+            LOG.debug(f"Unable to update snapshot {dest}: {e}")
+
+    return schema
+
+
+def _write(schema: OcsfSchema, dest: Path, key: bytes, stamp: bytes) -> None:
+    """Write a snapshot of a schema, keyed by key and stamp."""
+    # The models are kept alive while they are pickled, so their ids identify
+    # them.
+    digests = fingerprints(schema)
+    by_id = {id(model): digest for model, digest in digests}
+
+    def write(tmp: Path) -> None:
+        with open(tmp, "wb") as f:
+            f.write(_MAGIC)
+            f.write(key + b"\n")
+            f.write(stamp + b"\n")
+            _Pickler(f, by_id).dump(schema)
+
+    write_atomic(dest, write)
+
+
+def has_snapshot(path: str | Path, snapshot_dir: Optional[str | Path] = None) -> bool:
+    """Does a JSON file have an up to date snapshot?
+
+    Only the snapshot's header is read, so this is much faster than loading it.
+    A file with an up to date snapshot was parsed successfully when the
+    snapshot was written.
+
+    Args:
+        path: The path of the JSON file.
+        snapshot_dir: The directory snapshots are stored in. Defaults to the
+            directory of the JSON file.
+    """
+    path = Path(path)
+    try:
+        stamp = _stamp(path)
+        with open(snapshot_path(path, snapshot_dir), "rb") as f:
+            if f.readline() != _MAGIC:
+                return False
+            key = f.readline().rstrip(b"\n")
+            if f.readline().rstrip(b"\n") == stamp:
+                return True
+        return key == snapshot_key(path.read_bytes())
+    except OSError:
+        return False
+
+
+def save_snapshot(schema: OcsfSchema, path: str | Path, snapshot_dir: Optional[str | Path] = None) -> Path:
+    """Save a snapshot of a schema that was parsed from (or written to) a JSON file.
+
+    Args:
+        schema: The schema.
+        path: The JSON file the schema corresponds to.
+        snapshot_dir: The directory to store the snapshot in. Defaults to the
+            directory of the JSON file.
+
+    Returns:
+        The path of the snapshot.
+    """
+    path = Path(path)
+    # Stamped before reading, so a change made while reading is noticed.
+    stamp = _stamp(path)
+    key = snapshot_key(path.read_bytes())
+
+    dest = snapshot_path(path, snapshot_dir)
+    LOG.debug(f"Writing snapshot to {dest}")
+    _write(schema, dest, key, stamp)
+    return dest
+
+
+def from_file_snapshot(path: str | Path, snapshot_dir: Optional[str | Path] = None) -> OcsfSchema:
+    """Parse an OCSF schema from a JSON file, using a snapshot if one is available.
+
+    If there is no usable snapshot, the JSON file is parsed and a new snapshot
+    is written. Failing to write the snapshot is logged but is not an error.
+
+    Args:
+        path: The path of the JSON file.
+        snapshot_dir: The directory to store snapshots in. Defaults to the
+            directory of the JSON file.
+
+    Returns:
+        The parsed OcsfSchema.
+
+    Raises:
+        FileNotFoundError: If the JSON file doesn't exist.
+    """
+    path = Path(path)
+    stamp = _stamp(path)
+    dest = snapshot_path(path, snapshot_dir)
+
+    schema = _read(dest, path, stamp)
+    if schema is not None:
+        LOG.debug(f"Read schema from snapshot: {dest}")
+        return schema
+
+    data = path.read_bytes()
+    schema = from_json(decompress(data))
+
+    try:
+        _write(schema, dest, snapshot_key(data), stamp)
+    except OSError as e:
+        LOG.warning(f"Unable to write snapshot {dest}: {e}")
+
+    return schema
@@ -0,0 +1,185 @@
+"""Parse an OCSF schema incrementally from a file or HTTP response.
+
+Reading a whole exported schema into memory, decoding it with json.loads, and
+then building the dataclasses holds three copies of the schema in memory at
+once. stream_schema reads the JSON in chunks and builds each event and object as
+soon as its JSON has been read, so peak memory stays close to the size of the
+parsed schema plus the largest single event or object.
+
+Use it through from_stream in the json module, which supplies the decoder.
+
+Example:
+
+```python
+with open("schema.json", "rb") as f:
+    schema = from_stream(f)
+
+with urlopen("https://schema.ocsf.io/export/schema") as response:
+    schema = from_stream(response)
+```
+"""
+
+import codecs
+import json
+import re
+
+from json.scanner import make_scanner
+from typing import IO, Any, Callable, cast
+
+from .decoder import DecodeError, Decoder
+from .model import OcsfEvent, OcsfObject, OcsfSchema
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+# The scanner that JSONDecoder uses to decode a value starting at a position.
+_SCAN: Callable[[str, int], tuple[Any, int]] = make_scanner(cast(Any, json.JSONDecoder()))
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+
+class _Reader:
+    """A buffer over a stream that decodes JSON values one at a time."""
+
+    def __init__(self, fp: IO[bytes] | IO[str], chunk_size: int):
+        self._fp = fp
+        self._chunk_size = chunk_size
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self._text = ""
+        self._pos = 0
+        self._eof = False
+
+    def _fill(self, size: int) -> None:
+        """Read up to size more characters into the buffer, dropping what's been consumed."""
+        data = self._fp.read(size)
+        if isinstance(data, bytes):
+            text = self._decoder.decode(data, final=len(data) == 0)
+        else:
+            text = data
+
+        if len(data) == 0:
+            self._eof = True
+
+        self._text = self._text[self._pos :] + text
+        self._pos = 0
+
+    def _skip(self) -> None:
+        """Skip whitespace, reading more of the stream if needed."""
+        while True:
+            match = _WHITESPACE.match(self._text, self._pos)
+            self._pos = match.end() if match is not None else self._pos
+            if self._pos < len(self._text) or self._eof:
+                return
+            self._fill(self._chunk_size)
+
+    def peek(self) -> str:
+        """The next character that isn't whitespace, or an empty string at the end of the stream."""
+        self._skip()
+        return self._text[self._pos : self._pos + 1]
+
+    def expect(self, char: str) -> None:
+        """Consume an expected character."""
+        if self.peek() != char:
+            raise json.JSONDecodeError(f"Expecting '{char}'", self._text, self._pos)
+        self._pos += 1
+
+    def value(self) -> Any:
+        """Decode the next JSON value, reading more of the stream until it's complete."""
+        self._skip()
+        size = self._chunk_size
+        while True:
+            try:
+                value, end = _SCAN(self._text, self._pos)
+                # A number at the very end of the buffer may be truncated.
+                if end < len(self._text) or self._eof:
+                    self._pos = end
+                    return value
+            except (json.JSONDecodeError, StopIteration):
+                if self._eof:
+                    raise json.JSONDecodeError("Invalid or truncated JSON value", self._text, self._pos)
+
+            # Grow the reads so large values aren't rescanned too many times.
+            self._fill(size)
+            size *= 2
+
+    def members(self) -> "_Members":
+        """Iterate over the keys of the JSON object that starts at the current position.
+
+        The caller must consume each member's value before asking for the next key.
+        """
+        return _Members(self)
+
+
+class _Members:
+    """An iterator over the keys of a JSON object in a _Reader."""
+
+    def __init__(self, reader: _Reader):
+        self._reader = reader
+        self._first = True
+        reader.expect("{")
+
+    def __iter__(self) -> "_Members":
+        return self
+
+    def __next__(self) -> str:
+        reader = self._reader
+        if reader.peek() == "}":
+            reader.expect("}")
+            raise StopIteration
+
+        if not self._first:
+            reader.expect(",")
+        self._first = False
+
+        key = reader.value()
+        if not isinstance(key, str):
+            raise json.JSONDecodeError("Expecting property name", "", 0)
+        reader.expect(":")
+        return key
+
+
+def stream_schema(fp: IO[bytes] | IO[str], decoder: Decoder, chunk_size: int = DEFAULT_CHUNK_SIZE) -> OcsfSchema:
+    """Parse an OCSF schema incrementally from a binary or text stream.
+
+    Args:
+        fp: The stream, like an open file or an HTTP response. Binary streams
+            must be UTF-8 encoded.
+        decoder: The decoder used to build the schema's models.
+        chunk_size: The number of bytes or characters to read at a time.
+
+    Returns:
+        The parsed OcsfSchema.
+
+    Raises:
+        json.JSONDecodeError: If the stream doesn't contain a valid JSON object.
+        DecodeError: If the object isn't a valid schema.
+    """
+    reader = _Reader(fp, chunk_size)
+    data: dict[str, Any] = {}
+    classes: dict[str, OcsfEvent] = {}
+    objects: dict[str, OcsfObject] = {}
+    decode_event = decoder.decoder(OcsfEvent)
+    decode_object = decoder.decoder(OcsfObject)
+
+    for key in reader.members():
+        if key == "classes" and reader.peek() == "{":
+            for name in reader.members():
+                try:
+                    classes[name] = decode_event(reader.value())
+                except DecodeError as e:
+                    raise e.within(name).within(key)
+        elif key == "objects" and reader.peek() == "{":
+            for name in reader.members():
+                try:
+                    objects[name] = decode_object(reader.value())
+                except DecodeError as e:
+                    raise e.within(name).within(key)
+        else:
+            data[key] = reader.value()
+
+    if reader.peek() != "":
+        raise json.JSONDecodeError("Extra data", "", 0)
+
+    schema = decoder.decode(OcsfSchema, data)
+    schema.classes = classes
+    schema.objects = objects
+    return schema
@@ -145,6 +145,14 @@ class Validator(ABC, Generic[Context]):
         if name in self._severities:
             finding.severity = Severity(self._severities[name])
 
+    def _run(self, rule: Rule[Context]) -> list[Finding]:
+        """Run one rule on the context.
+
+        Subclasses can override this to give their rules more than the
+        context, like data shared by several rules.
+        """
+        return rule.validate(self.context)
+
     def validate(self) -> ValidationFindings[Context]:
         """Run the validation rules and return the findings."""
         findings: ValidationFindings[Context] = {}
@@ -152,7 +160,7 @@ class Validator(ABC, Generic[Context]):
 
         for rule in self.rules():
             findings[rule] = []
-            results = rule.validate(self.context)
+            results = self._run(rule)
             for finding in results:
                 self._override_severity(finding)
                 findings[rule].append(finding)
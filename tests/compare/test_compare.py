@@ -1,17 +1,38 @@
 # pyright: reportPrivateUsage = false
-from typing import Optional, Any
+import copy
+import os
+import pytest
+
+from dataclasses import fields, replace
+from typing import Optional, Any, cast
 
 from ocsf_tools.compare import (
+    comparison_plan,
     compare,
     compare_dict,
+    values_unchanged,
     Change,
     NoChange,
     ChangedAttr,
     ChangedEnumMember,
+    ChangedModel,
+    ChangedSchema,
+    LazyDifferences,
+    SparseDifferences,
     Removal,
     Addition,
 )
-from ocsf_tools.schema import OcsfAttr, OcsfEnumMember
+from ocsf_tools.schema import (
+    OcsfAttr,
+    OcsfEnumMember,
+    OcsfEvent,
+    OcsfObject,
+    fingerprints,
+    from_file,
+    store_fingerprints,
+)
+
+CACHE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "../..", "schema_cache")
 
 
 def test_compare_primitives():
@@ -169,3 +190,196 @@ def test_compare_dict_ocsf_models():
     assert diff["3"] == NoChange()
     assert diff["4"] == NoChange()
     assert diff["5"] == Addition(after=OcsfEnumMember(caption="Flattened"))
+
+
+def test_compare_dict_fingerprints():
+    """Test that compare_dict uses stored fingerprints to recognize unchanged models only if trusted."""
+
+    old = {"a": OcsfEnumMember(caption="A"), "b": OcsfEnumMember(caption="B")}
+    new = {"a": OcsfEnumMember(caption="A"), "b": OcsfEnumMember(caption="B2")}
+    for member in list(old.values()) + list(new.values()):
+        store_fingerprints(fingerprints(member))
+
+    diff = compare_dict(old, new, trust_fingerprints=True)
+    assert isinstance(diff, dict)
+    assert diff["a"] == NoChange()
+    assert diff["b"] == ChangedEnumMember(caption=Change(before="B", after="B2"))
+
+    # The stored fingerprints are now stale, and are ignored unless trusted.
+    new["a"].caption = "A2"
+    diff = compare_dict(old, new)
+    assert isinstance(diff, dict)
+    assert diff["a"] == ChangedEnumMember(caption=Change(before="A", after="A2"))
+
+
+def test_values_unchanged():
+    """Test that values_unchanged uses identity, then trusted fingerprints, then equality."""
+
+    a = OcsfEnumMember(caption="A")
+    assert values_unchanged(a, a)
+    assert values_unchanged(a, OcsfEnumMember(caption="A"))
+    assert not values_unchanged(a, OcsfEnumMember(caption="B"))
+    assert values_unchanged(1, 1) and not values_unchanged(1, 2)
+
+    b = OcsfEnumMember(caption="A")
+    store_fingerprints(fingerprints(a))
+    store_fingerprints(fingerprints(b))
+    b.caption = "B"
+    # b's stored fingerprint is stale, which only matters if it is trusted.
+    assert values_unchanged(a, b, trust_fingerprints=True)
+    assert not values_unchanged(a, b)
+
+
+def test_compare_modified_after_fingerprinting():
+    """Test that a schema modified after its fingerprints were stored is compared by content."""
+
+    old = from_file(os.path.join(CACHE, "schema-1.1.0.json"))
+    new = from_file(os.path.join(CACHE, "schema-1.1.0.json"))
+    store_fingerprints(fingerprints(old))
+    store_fingerprints(fingerprints(new))
+
+    new.classes["authentication"].attributes["user"].requirement = "optional"
+    diff = compare(old, new, sparse=True)
+    assert isinstance(diff, ChangedSchema)
+    user = cast(Any, diff.classes["authentication"]).attributes["user"]
+    assert user.requirement == Change(before="required", after="optional")
+
+    changed = copy.deepcopy(old)
+    changed.classes["authentication"].caption = "Logon"
+    diff = compare(old, changed, sparse=True)
+    assert isinstance(diff, ChangedSchema)
+    assert cast(Any, diff.classes["authentication"]).caption == Change(before="Authentication", after="Logon")
+
+
+def test_compare_schemas_fingerprints():
+    """Test that comparing schemas gives the same result with and without fingerprints."""
+
+    old = from_file(os.path.join(CACHE, "schema-1.1.0.json"))
+    new = from_file(os.path.join(CACHE, "schema-1.2.0.json"))
+    expected = compare(old, new)
+
+    store_fingerprints(fingerprints(old))
+    store_fingerprints(fingerprints(new))
+    assert compare(old, new, trust_fingerprints=True) == expected
+
+
+def test_compare_schemas_interned():
+    """Test that an interned schema, with frozen shared attributes, compares like a plain one."""
+
+    old = from_file(os.path.join(CACHE, "schema-1.1.0.json"))
+    new = from_file(os.path.join(CACHE, "schema-1.2.0.json"))
+    expected = compare(old, new)
+
+    interned = from_file(os.path.join(CACHE, "schema-1.2.0.json"), intern=True)
+    assert compare(old, interned) == expected
+    assert compare(old, interned, sparse=True) == compare(old, new, sparse=True)
+
+
+def test_comparison_plan():
+    """Test that fields are classified by their type hints, once per model class."""
+
+    plan = comparison_plan(OcsfAttr)
+    assert plan.diff_class is ChangedAttr
+    assert plan.dicts == ()
+    assert plan.optional_dicts == ("enum",)
+    assert plan.models == ("deprecated",)
+    assert "caption" in plan.primitives
+    assert "profile" in plan.primitives
+
+    plan = comparison_plan(OcsfEvent)
+    assert plan.dicts == ("attributes",)
+    assert set(plan.optional_dicts) == {"associations", "constraints"}
+
+    assert comparison_plan(OcsfAttr) is comparison_plan(OcsfAttr)
+
+
+def test_compare_dict_sparse():
+    """Test that a sparse compare_dict leaves out unchanged keys."""
+
+    old = {"a": 1, "b": 2, "c": 3}
+    new = {"b": 2, "c": 4, "d": 5}
+    diff = cast(SparseDifferences[str, int], compare_dict(old, new, sparse=True))
+
+    assert isinstance(diff, SparseDifferences)
+    assert dict(diff) == {"a": Removal(before=1), "c": Change(before=3, after=4), "d": Addition(after=5)}
+    assert diff.is_unchanged("b")
+    assert not diff.is_unchanged("a")
+    assert not diff.is_unchanged("x")
+    assert list(diff.unchanged()) == ["b"]
+    assert diff.difference("b") == NoChange()
+    assert diff.difference("c") == Change(before=3, after=4)
+    with pytest.raises(KeyError):
+        diff.difference("x")
+
+
+def without_unchanged(diff: Any) -> Any:
+    """Remove unchanged keys from the dictionaries of a full comparison."""
+    if isinstance(diff, dict):
+        return {k: without_unchanged(v) for k, v in cast(dict[Any, Any], diff).items() if not isinstance(v, NoChange)}
+    if isinstance(diff, ChangedModel):
+        return replace(diff, **{f.name: without_unchanged(getattr(diff, f.name)) for f in fields(diff)})  # type: ignore
+    return diff
+
+
+def test_compare_schemas_sparse():
+    """Test that a sparse comparison has exactly the changes of a full one."""
+
+    old = from_file(os.path.join(CACHE, "schema-1.1.0.json"))
+    new = from_file(os.path.join(CACHE, "schema-1.2.0.json"))
+    full = compare(old, new)
+    sparse = compare(old, new, sparse=True)
+
+    assert sparse == without_unchanged(full)
+    assert isinstance(full, ChangedSchema) and isinstance(sparse, ChangedSchema)
+    objects = cast(SparseDifferences[str, OcsfObject], sparse.objects)
+    assert isinstance(objects, SparseDifferences)
+    for name, diff in full.objects.items():
+        assert objects.is_unchanged(name) == isinstance(diff, NoChange)
+
+
+def test_compare_dict_lazy():
+    """Test that LazyDifferences only computes differences when they are read."""
+
+    old = {"a": OcsfEnumMember(caption="A"), "b": OcsfEnumMember(caption="B"), "c": OcsfEnumMember(caption="C")}
+    new = {"b": OcsfEnumMember(caption="B"), "c": OcsfEnumMember(caption="C2"), "d": OcsfEnumMember(caption="D")}
+    diff = LazyDifferences(old, new)
+
+    assert diff.computed() == 0
+    assert "c" in diff
+    assert list(diff) == ["a", "c", "d"]
+    assert len(diff) == 3
+    assert diff.computed() == 0
+    assert diff["c"] == ChangedEnumMember(caption=Change(before="C", after="C2"))
+    assert diff.computed() == 1
+
+    assert "b" not in diff
+    assert diff.is_unchanged("b")
+    assert diff.difference("b") == NoChange()
+    with pytest.raises(KeyError):
+        diff["b"]
+    with pytest.raises(KeyError):
+        diff.difference("x")
+
+    assert list(diff) == ["a", "c", "d"]
+    assert dict(diff) == compare_dict(old, new, sparse=True)
+    assert list(diff.unchanged()) == ["b"]
+
+
+def test_compare_schemas_lazy():
+    """Test that a lazy comparison has the same changes as a sparse one, computed on access."""
+
+    old = from_file(os.path.join(CACHE, "schema-1.1.0.json"))
+    new = from_file(os.path.join(CACHE, "schema-1.2.0.json"))
+    sparse = compare(old, new, sparse=True)
+    lazy = compare(old, new, sparse=True, lazy=True)
+    assert isinstance(sparse, ChangedSchema) and isinstance(lazy, ChangedSchema)
+
+    classes = cast(LazyDifferences[str, OcsfEvent], lazy.classes)
+    assert "network_activity" in classes
+    assert len(classes) > 1
+    assert classes.computed() == 0
+    classes["network_activity"]
+    assert classes.computed() == 1
+
+    assert dict(classes) == sparse.classes
+    assert dict(lazy.objects) == sparse.objects
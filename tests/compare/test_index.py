@@ -0,0 +1,83 @@
+import os
+
+from ocsf_tools.compare import (
+    Addition,
+    Change,
+    ChangedAttr,
+    ChangedEvent,
+    ChangedObject,
+    ChangedSchema,
+    DiffIndex,
+    IndexEntry,
+    Removal,
+    compare,
+)
+from ocsf_tools.schema import OcsfAttr, OcsfElementType, OcsfEnumMember, OcsfEvent, OcsfObject, from_file
+
+CACHE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "../..", "schema_cache")
+
+EVENT = OcsfElementType.EVENT
+OBJECT = OcsfElementType.OBJECT
+
+
+def attr(caption: str) -> OcsfAttr:
+    return OcsfAttr(caption=caption, description="", requirement="optional", type="int_t")
+
+
+def test_diff_index():
+    """Test that changes are filed by kind and element type."""
+
+    removed_event = OcsfEvent(caption="Old", name="old")
+    added_object = OcsfObject(caption="New", name="new")
+    type_change = Change[str]("str_t", "int_t")
+    requirement_change = Change[str]("optional", "required")
+    member = OcsfEnumMember(caption="One")
+    changed_attr = ChangedAttr(type=type_change, enum={"1": Removal(member), "2": Addition(member)})
+    changed_event = ChangedEvent(attributes={"a": changed_attr, "b": Removal(attr("B"))})
+    changed_object = ChangedObject(
+        attributes={"c": ChangedAttr(requirement=requirement_change), "d": Addition(attr("D"))}
+    )
+
+    index = DiffIndex(
+        ChangedSchema(
+            classes={"old": Removal(removed_event), "changed": changed_event},
+            objects={"new": Addition(added_object), "changed": changed_object},
+        )
+    )
+
+    assert index.removed_records() == [IndexEntry(EVENT, "old", Removal(removed_event))]
+    assert index.removed_records(OBJECT) == []
+    assert index.added_records() == [IndexEntry(OBJECT, "new", Addition(added_object))]
+    assert index.changed_records() == [
+        IndexEntry(EVENT, "changed", changed_event),
+        IndexEntry(OBJECT, "changed", changed_object),
+    ]
+    assert index.removed_attributes() == [IndexEntry(EVENT, "changed", Removal(attr("B")), "b")]
+    assert index.added_attributes(OBJECT) == [IndexEntry(OBJECT, "changed", Addition(attr("D")), "d")]
+    assert index.changed_attributes(EVENT) == [IndexEntry(EVENT, "changed", changed_attr, "a")]
+    assert index.changed_fields("type") == [IndexEntry(EVENT, "changed", type_change, "a")]
+    assert index.changed_fields("requirement", EVENT) == []
+    assert index.changed_fields("requirement", OBJECT) == [IndexEntry(OBJECT, "changed", requirement_change, "c")]
+    assert index.changed_fields("caption") == []
+    assert index.removed_enum_members() == [IndexEntry(EVENT, "changed", Removal(member), "a", "1")]
+    assert index.added_enum_members() == [IndexEntry(EVENT, "changed", Addition(member), "a", "2")]
+
+
+def test_diff_index_schemas():
+    """Test an index of real schemas against a scan of the comparison."""
+
+    old = from_file(os.path.join(CACHE, "schema-1.0.0.json"))
+    new = from_file(os.path.join(CACHE, "schema-1.1.0.json"))
+    diff = compare(old, new, sparse=True)
+    assert isinstance(diff, ChangedSchema)
+    index = DiffIndex(diff)
+
+    expected = [
+        (name, attr_name)
+        for name, event in diff.classes.items()
+        if isinstance(event, ChangedEvent)
+        for attr_name, attr in event.attributes.items()
+        if isinstance(attr, ChangedAttr) and isinstance(attr.type, Change)
+    ]
+    assert [(entry.name, entry.attr) for entry in index.changed_fields("type", EVENT)] == expected
+    assert len(index.removed_attributes()) > 0
@@ -0,0 +1,82 @@
+import os
+import pytest
+
+from typing import Any, cast
+
+from ocsf_tools.compare import ChangedAttr, ChangedEvent, ChangedSchema, compare, compare_inherited
+from ocsf_tools.schema import OcsfAttr, OcsfEvent, OcsfSchema, fingerprints, from_file, store_fingerprints
+
+CACHE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "../..", "schema_cache")
+
+
+def attr(caption: str, requirement: str = "optional") -> OcsfAttr:
+    return OcsfAttr(caption=caption, description="", requirement=requirement, type="int_t")
+
+
+def event(name: str, extends: str, **attributes: OcsfAttr) -> OcsfEvent:
+    return OcsfEvent(caption=name.title(), name=name, extends=extends, attributes=attributes)
+
+
+def schema(time: OcsfAttr, uid: OcsfAttr) -> OcsfSchema:
+    """A schema whose events share the time attribute of base_event and the uid of their parent."""
+    base = event("base_event", "", time=time)
+    parent = event("parent", "base_event", time=time, uid=uid)
+    return OcsfSchema(
+        version="1.0.0",
+        base_event=base,
+        classes={
+            "child": event("child", "parent", time=time, uid=uid, own=attr("Own")),
+            "parent": parent,
+            "other": event("other", "network", time=time, uid=attr("UID")),
+        },
+    )
+
+
+@pytest.mark.parametrize("sparse", [False, True])
+def test_compare_inherited(sparse: bool):
+    """Test that inherited attribute differences are computed once and shared."""
+
+    old = schema(attr("Time"), attr("UID"))
+    new = schema(attr("Time", "required"), attr("Unique ID"))
+    diff = compare_inherited(old, new, sparse)
+    assert diff == compare(old, new, sparse)
+
+    base = cast(ChangedEvent, diff.base_event)
+    classes = cast(dict[str, Any], diff.classes)
+    assert isinstance(base.attributes["time"], ChangedAttr)
+    for name in ("child", "parent", "other"):
+        assert classes[name].attributes["time"] is base.attributes["time"]
+    assert classes["child"].attributes["uid"] is classes["parent"].attributes["uid"]
+    assert ("uid" in classes["other"].attributes) is not sparse
+
+
+@pytest.mark.parametrize("sparse", [False, True])
+def test_compare_inherited_schemas(sparse: bool):
+    """Test that comparing real schemas gives the same result as compare, with and without fingerprints."""
+
+    old = from_file(os.path.join(CACHE, "schema-1.1.0.json"), intern=True)
+    new = from_file(os.path.join(CACHE, "schema-1.2.0.json"), intern=True)
+    expected = compare(old, new, sparse)
+    assert compare_inherited(old, new, sparse) == expected
+
+    store_fingerprints(fingerprints(old))
+    store_fingerprints(fingerprints(new))
+    diff = compare_inherited(old, new, sparse, trust_fingerprints=True)
+    assert isinstance(diff, ChangedSchema)
+    assert diff == expected
+
+
+def test_compare_inherited_stale_fingerprints():
+    """Test that stored fingerprints are ignored unless trusted, so modified attributes aren't taken as inherited."""
+
+    old = schema(attr("Time"), attr("Unique ID"))
+    new = schema(attr("Time"), attr("Unique ID"))
+    # An equal copy of the inherited attribute, rather than the parent's instance.
+    new.classes["child"].attributes["time"] = attr("Time")
+    store_fingerprints(fingerprints(old))
+    store_fingerprints(fingerprints(new))
+
+    new.classes["child"].attributes["time"].requirement = "required"
+    diff = compare_inherited(old, new)
+    assert diff == compare(old, new)
+    assert isinstance(cast(Any, diff.classes["child"]).attributes["time"], ChangedAttr)
@@ -0,0 +1,50 @@
+import copy
+import pickle
+
+from typing import Any
+
+from ocsf_tools.compare import Addition, Change, ChangedAttr, ChangedSchema, Difference, NoChange, Removal
+
+
+def test_no_change_singleton():
+    """Test that NoChange is a single shared instance."""
+    assert NoChange() is NoChange()
+    assert NoChange[bool]() is NoChange()
+    assert ChangedAttr().caption is NoChange()
+    assert copy.deepcopy(NoChange[Any]()) is NoChange()
+    assert pickle.loads(pickle.dumps(NoChange())) is NoChange()
+
+
+def test_no_change_equality():
+    """Test that NoChange is only equal to NoChange."""
+    assert NoChange() == NoChange[int]()
+    assert NoChange() != Change(before=None, after=None)
+    assert NoChange() != None  # noqa: E711
+    assert repr(NoChange[Any]()) == "NoChange()"
+
+
+def test_slots():
+    """Test that differences don't have a per-instance __dict__."""
+    diffs: list[Difference[Any]] = [Addition(after=1), Removal(before=1), Change(before=1, after=2), NoChange()]
+    for diff in diffs + [ChangedAttr()]:
+        assert not hasattr(diff, "__dict__")
+
+
+def test_pattern_matching():
+    """Test that differences can be matched by class."""
+    matched: list[str] = []
+    diffs: list[Difference[Any]] = [Addition(after=1), Removal(before=1), Change(before=1, after=2), NoChange()]
+    for diff in diffs + [ChangedSchema()]:
+        match diff:
+            case Addition(after=after):
+                matched.append(f"added {after}")
+            case Removal(before=before):
+                matched.append(f"removed {before}")
+            case Change(before=before, after=after):
+                matched.append(f"changed {before} to {after}")
+            case NoChange():
+                matched.append("unchanged")
+            case _:
+                matched.append("model")
+
+    assert matched == ["added 1", "removed 1", "changed 1 to 2", "unchanged", "model"]
@@ -0,0 +1,66 @@
+import os
+import pytest
+
+from typing import cast
+
+from ocsf_tools.compare import ChangedEvent, ChangedSchema, SparseDifferences, compare
+from ocsf_tools.compare.parallel import compare_parallel
+from ocsf_tools.schema import OcsfAttr, OcsfObject, OcsfSchema, from_file
+
+CACHE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "../..", "schema_cache")
+
+
+@pytest.fixture(scope="module")
+def schemas() -> tuple[OcsfSchema, OcsfSchema]:
+    old = from_file(os.path.join(CACHE, "schema-1.1.0.json"))
+    new = from_file(os.path.join(CACHE, "schema-1.2.0.json"))
+    return old, new
+
+
+def test_compare_parallel(schemas: tuple[OcsfSchema, OcsfSchema]):
+    """Test that a parallel comparison equals a serial one, in the same order."""
+    old, new = schemas
+    serial = cast(ChangedSchema, compare(old, new))
+    parallel = compare_parallel(old, new, workers=2, cutoff=0)
+
+    assert parallel == serial
+    assert list(parallel.classes) == list(serial.classes)
+    assert list(parallel.objects) == list(serial.objects)
+
+
+def test_compare_parallel_sparse(schemas: tuple[OcsfSchema, OcsfSchema]):
+    """Test that a sparse parallel comparison equals a sparse serial one."""
+    old, new = schemas
+    serial = cast(ChangedSchema, compare(old, new, sparse=True))
+    parallel = compare_parallel(old, new, workers=2, cutoff=0, sparse=True)
+
+    assert parallel == serial
+    objects = cast(SparseDifferences[str, OcsfObject], parallel.objects)
+    assert isinstance(objects, SparseDifferences)
+    assert list(objects.unchanged()) == list(cast(SparseDifferences[str, OcsfObject], serial.objects).unchanged())
+
+
+def test_compare_parallel_sparse_shares_dicts(schemas: tuple[OcsfSchema, OcsfSchema]):
+    """Test that the SparseDifferences of a parallel comparison hold the compared schemas' own dictionaries."""
+    old, new = schemas
+    parallel = compare_parallel(old, new, workers=2, cutoff=0, sparse=True)
+
+    checked = 0
+    for name, diff in parallel.classes.items():
+        if isinstance(diff, ChangedEvent):
+            attributes = cast(SparseDifferences[str, OcsfAttr], diff.attributes)
+            assert attributes.before is old.classes[name].attributes
+            assert attributes.after is new.classes[name].attributes
+            checked += 1
+    assert checked > 0
+
+
+def test_compare_parallel_serial(schemas: tuple[OcsfSchema, OcsfSchema]):
+    """Test the serial fallbacks and the worker count."""
+    old, new = schemas
+    expected = compare(old, new)
+    assert compare_parallel(old, new, workers=1) == expected
+    assert compare_parallel(old, new, workers=2, cutoff=10_000) == expected
+
+    with pytest.raises(ValueError):
+        compare_parallel(old, new, workers=0)
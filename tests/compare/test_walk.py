@@ -0,0 +1,152 @@
+import os
+import pytest
+
+from dataclasses import fields
+from typing import Any, Iterator, cast
+
+from ocsf_tools.compare import (
+    Addition,
+    Change,
+    ChangedModel,
+    Difference,
+    Removal,
+    compare,
+    iter_differences,
+)
+from ocsf_tools.compare.walk import Path
+from ocsf_tools.schema import (
+    OcsfAttr,
+    OcsfEnumMember,
+    OcsfEvent,
+    OcsfSchema,
+    fingerprints,
+    from_file,
+    store_fingerprints,
+)
+
+CACHE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "../..", "schema_cache")
+
+
+def leaves(diff: Any, path: Path = ()) -> Iterator[tuple[Path, Difference[Any]]]:
+    """The (path, Difference) leaves of a sparse comparison."""
+    if isinstance(diff, dict):
+        for key, value in cast(dict[str, Any], diff).items():
+            yield from leaves(value, path + (key,))
+    elif isinstance(diff, ChangedModel):
+        for f in fields(cast(Any, diff)):
+            yield from leaves(getattr(cast(Any, diff), f.name), path + (f.name,))
+    elif isinstance(diff, (Addition, Removal, Change)):
+        yield path, cast(Difference[Any], diff)
+
+
+def attr(caption: str, requirement: str = "optional", **kwargs: Any) -> OcsfAttr:
+    return OcsfAttr(caption=caption, description="", requirement=requirement, type="int_t", **kwargs)
+
+
+def test_iter_differences():
+    """Test the records yielded for a small change."""
+
+    old = OcsfEvent(
+        caption="Test",
+        name="test",
+        attributes={
+            "a": attr("A"),
+            "b": attr("B", enum={"1": OcsfEnumMember(caption="One")}),
+            "c": attr("C"),
+        },
+    )
+    new = OcsfEvent(
+        caption="Test",
+        name="test",
+        attributes={
+            "a": attr("A", requirement="required"),
+            "b": attr("B", enum={"2": OcsfEnumMember(caption="Two")}),
+            "d": attr("D"),
+        },
+    )
+
+    assert list(iter_differences(old, new)) == [
+        (("attributes", "a", "requirement"), Change(before="optional", after="required")),
+        (("attributes", "b", "enum", "1"), Removal(before=OcsfEnumMember(caption="One"))),
+        (("attributes", "b", "enum", "2"), Addition(after=OcsfEnumMember(caption="Two"))),
+        (("attributes", "c"), Removal(before=attr("C"))),
+        (("attributes", "d"), Addition(after=attr("D"))),
+    ]
+
+    assert list(iter_differences(old, old)) == []
+    assert list(iter_differences(1, 2)) == [((), Change(before=1, after=2))]
+
+
+def test_iter_differences_schemas():
+    """Test that the records are the leaves of a sparse comparison."""
+
+    old = from_file(os.path.join(CACHE, "schema-1.1.0.json"))
+    new = from_file(os.path.join(CACHE, "schema-1.2.0.json"))
+
+    records = list(iter_differences(old, new))
+    assert len(records) > 0
+    assert dict(records) == dict(leaves(compare(old, new, sparse=True)))
+
+
+def test_iter_differences_prefixes():
+    """Test that prefix filters select differences and prune what they don't select."""
+
+    old = from_file(os.path.join(CACHE, "schema-1.1.0.json"))
+    new = from_file(os.path.join(CACHE, "schema-1.2.0.json"))
+
+    prefix = ("classes", "network_activity", "attributes")
+    records = list(iter_differences(old, new, prefixes=[prefix, ("version",)]))
+    expected = [r for r in iter_differences(old, new) if r[0][:3] == prefix or r[0][:1] == ("version",)]
+    assert records == expected
+    assert any(path[:1] == ("version",) for path, _ in records)
+
+    # A pruned branch is never compared, so a value that can't be compared isn't a problem.
+    broken = OcsfSchema(version=new.version, classes=new.classes, objects=cast(Any, {"x": object()}))
+    assert list(iter_differences(old, broken, prefixes=[prefix])) == records[:-1]
+
+
+def test_iter_differences_compares_once(monkeypatch: pytest.MonkeyPatch):
+    """Test that values above a prefix aren't compared as a whole, and changed values are compared once."""
+
+    old = from_file(os.path.join(CACHE, "schema-1.1.0.json"))
+    new = from_file(os.path.join(CACHE, "schema-1.2.0.json"))
+    expected = list(iter_differences(old, new, prefixes=[("classes", "file_activity")]))
+    assert len(expected) > 0
+
+    def no_eq(self: object, other: object) -> bool:
+        raise AssertionError("the schemas were compared as a whole")
+
+    compared: list[str] = []
+    event_eq = OcsfEvent.__eq__
+
+    def counting_eq(self: OcsfEvent, other: object) -> bool:
+        compared.append(self.name)
+        return event_eq(self, other)
+
+    monkeypatch.setattr(OcsfSchema, "__eq__", no_eq)
+    monkeypatch.setattr(OcsfEvent, "__eq__", counting_eq)
+    assert list(iter_differences(old, new, prefixes=[("classes", "file_activity")])) == expected
+    assert compared == ["file_activity"]
+
+
+def test_iter_differences_fingerprints():
+    """Test that stored fingerprints are only used to skip unchanged values if trusted."""
+
+    old = OcsfEvent(caption="Test", name="test", attributes={"a": attr("A"), "b": attr("B")})
+    new = OcsfEvent(caption="Test", name="test", attributes={"a": attr("A"), "b": attr("B2")})
+    store_fingerprints(fingerprints(old))
+    store_fingerprints(fingerprints(new))
+
+    changed = [(("attributes", "b", "caption"), Change(before="B", after="B2"))]
+    assert list(iter_differences(old, new, trust_fingerprints=True)) == changed
+
+    # The stored fingerprints are now stale, and hide the change if trusted.
+    new.attributes["a"].caption = "A2"
+    assert list(iter_differences(old, new, trust_fingerprints=True)) == changed
+    assert (
+        list(iter_differences(old, new))
+        == [
+            (("attributes", "a", "caption"), Change(before="A", after="A2")),
+        ]
+        + changed
+    )
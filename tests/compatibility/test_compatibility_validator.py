@@ -0,0 +1,40 @@
+import os
+import pytest
+
+from typing import cast
+
+from ocsf_tools.compare import ChangedSchema, Removal, compare
+from ocsf_tools.compatibility import CompatibilityValidator
+from ocsf_tools.compatibility.removed_records import NoRemovedRecordsRule
+from ocsf_tools.schema import OcsfEvent, from_file
+
+CACHE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "../..", "schema_cache")
+
+
+@pytest.mark.parametrize("before,after", [("1.0.0", "1.1.0"), ("1.1.0", "1.2.0"), ("1.2.0", "1.0.0")])
+def test_sparse_findings(before: str, after: str):
+    """Test that the validator finds the same problems in sparse, lazy, and full comparisons."""
+    old = from_file(os.path.join(CACHE, f"schema-{before}.json"))
+    new = from_file(os.path.join(CACHE, f"schema-{after}.json"))
+
+    full = CompatibilityValidator(cast(ChangedSchema, compare(old, new))).validate()
+    expected = {rule.id(): sorted(map(repr, findings)) for rule, findings in full.items()}
+
+    for lazy in (False, True):
+        diff = compare(old, new, sparse=True, lazy=lazy)
+        results = CompatibilityValidator(cast(ChangedSchema, diff)).validate()
+        assert {rule.id(): sorted(map(repr, findings)) for rule, findings in results.items()} == expected
+    assert any(len(findings) > 0 for findings in full.values())
+
+
+def test_validate_after_modification():
+    """Test that validating a comparison again sees changes made to it since."""
+    diff = ChangedSchema()
+    validator = CompatibilityValidator(diff)
+    rule = NoRemovedRecordsRule()
+    assert sum(len(findings) for findings in validator.validate().values()) == 0
+    assert len(rule.validate(diff)) == 0
+
+    diff.classes["x"] = Removal(OcsfEvent(caption="X", name="x"))
+    assert sum(len(findings) for findings in validator.validate().values()) == 1
+    assert len(rule.validate(diff)) == 1
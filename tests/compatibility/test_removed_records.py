@@ -1,4 +1,10 @@
-from ocsf_tools.schema import OcsfEvent, OcsfObject, OcsfAttr, OcsfEnumMember
+import pytest
+import random
+
+from difflib import get_close_matches
+from typing import Any
+
+from ocsf_tools.schema import OcsfEvent, OcsfObject, OcsfAttr, OcsfEnumMember, has_fingerprint
 from ocsf_tools.compare import ChangedSchema, Addition, Removal, ChangedEvent, ChangedObject, ChangedAttr
 from ocsf_tools.compatibility.removed_records import (
     NoRemovedRecordsRule,
@@ -99,6 +105,34 @@ def test_renamed_event_uid():
     assert isinstance(findings[0], RenamedEventFinding)
 
 
+def test_renamed_event_equal_uid():
+    """Test that class_uids are matched by content, without modifying them."""
+
+    def class_uid(members: dict[str, str]) -> dict[str, OcsfAttr]:
+        enum = {k: OcsfEnumMember(caption) for k, caption in members.items()}
+        return {"class_uid": OcsfAttr("class_uid", "Class UID", "required", "enum_t", enum=enum)}
+
+    removed = class_uid({"1020": "Email Delivery Activity", "1021": "Other"})
+    added = class_uid({"1021": "Other", "1020": "Email Delivery Activity"})
+    s = ChangedSchema()
+    s.classes["email_delivery_activity"] = Removal(
+        OcsfEvent(name="email_delivery_activity", caption="Email Delivery Activity", attributes=removed)
+    )
+    s.classes["email_delivery"] = Addition(OcsfEvent(name="email_delivery", caption="Email Activity", attributes=added))
+
+    findings = NoRemovedRecordsRule().validate(s)
+    assert len(findings) == 1
+    assert isinstance(findings[0], RenamedEventFinding)
+    assert not has_fingerprint(removed["class_uid"])
+    assert not has_fingerprint(added["class_uid"])
+
+    # A different class_uid isn't a rename.
+    added["class_uid"].enum = {"1022": OcsfEnumMember("Email Delivery Activity")}
+    findings = NoRemovedRecordsRule().validate(s)
+    assert len(findings) == 1
+    assert isinstance(findings[0], RemovedEventFinding)
+
+
 def test_renamed_object():
     """Test that a RenamedObjectFinding is created when an object is renamed."""
     s = ChangedSchema()
@@ -145,3 +179,86 @@ def test_renamed_enum_member():
     findings = rule.validate(s)
     assert len(findings) == 1
     assert isinstance(findings[0], RenamedEnumMemberFinding)
+
+
+def test_renamed_first_match():
+    """Test that a removal matching several additions is renamed to the first one."""
+    s = ChangedSchema()
+    s.objects["kill_chain"] = Removal(OcsfObject(name="kill_chain", caption="Kill Chain"))
+    s.objects["kill_chain_b"] = Addition(OcsfObject(name="kill_chain_b", caption="Kill Chain"))
+    s.objects["kill_chain_a"] = Addition(OcsfObject(name="kill_chain_a", caption="Kill Chain"))
+
+    rule = NoRemovedRecordsRule()
+    findings = rule.validate(s)
+    assert len(findings) == 1
+    assert isinstance(findings[0], RenamedObjectFinding)
+    assert findings[0].after == "kill_chain_b"
+
+
+def test_renamed_similarity():
+    """Test that similar captions identify renames only when a similarity threshold is set."""
+    s = ChangedSchema()
+    s.classes["email_delivery_activity"] = ChangedEvent(
+        attributes={
+            "email_id": Removal(OcsfAttr("Email Address", "required", "string_t")),
+            "email_addr": Addition(OcsfAttr("Email Addr", "required", "string_t")),
+            "sender": Addition(OcsfAttr("Sender", "required", "string_t")),
+        }
+    )
+
+    findings = NoRemovedRecordsRule().validate(s)
+    assert len(findings) == 1
+    assert isinstance(findings[0], RemovedAttrFinding)
+
+    findings = NoRemovedRecordsRule(similarity=0.8).validate(s)
+    assert len(findings) == 1
+    assert isinstance(findings[0], RenamedAttrFinding)
+    assert findings[0].after == "email_addr"
+
+    findings = NoRemovedRecordsRule(similarity=0.95).validate(s)
+    assert isinstance(findings[0], RemovedAttrFinding)
+
+    with pytest.raises(ValueError):
+        NoRemovedRecordsRule(similarity=1.5)
+
+
+def test_renamed_similarity_matches_difflib():
+    """Test that the most similar caption is chosen as difflib.get_close_matches would choose it."""
+    rng = random.Random(0)
+    words = ["Email", "Address", "User", "Name", "Id", "Time", "Src", "Dst", "Port", "Host"]
+
+    def caption() -> str:
+        return " ".join(rng.choice(words) for _ in range(rng.randint(1, 4)))
+
+    added = list(dict.fromkeys(caption() for _ in range(200)))
+    removed = [c for c in dict.fromkeys(caption() + rng.choice(["", "s", " X"]) for _ in range(200)) if c not in added]
+    attrs: dict[str, Any] = {f"old_{i}": Removal(OcsfAttr(c, "optional", "string_t")) for i, c in enumerate(removed)}
+    attrs.update({f"new_{i}": Addition(OcsfAttr(c, "optional", "string_t")) for i, c in enumerate(added)})
+    s = ChangedSchema()
+    s.classes["event"] = ChangedEvent(attributes=attrs)
+
+    for similarity in (0.0, 0.5, 0.8, 0.9):
+        findings = NoRemovedRecordsRule(similarity).validate(s)
+        assert len(findings) == len(removed)
+        for finding, removed_caption in zip(findings, removed):
+            close = get_close_matches(removed_caption, added, n=1, cutoff=similarity)
+            if close:
+                assert isinstance(finding, RenamedAttrFinding)
+                assert finding.after == f"new_{added.index(close[0])}"
+            else:
+                assert isinstance(finding, RemovedAttrFinding)
+
+
+def test_many_removals(capsys: pytest.CaptureFixture[str]):
+    """Test a large refactor: every event renamed, in order, and nothing printed."""
+    s = ChangedSchema()
+    for i in range(500):
+        s.classes[f"event_{i}"] = Removal(OcsfEvent(name=f"event_{i}", caption=f"Event {i}"))
+    for i in range(500):
+        s.classes[f"new_event_{i}"] = Addition(OcsfEvent(name=f"new_event_{i}", caption=f"Event {i}"))
+
+    findings = NoRemovedRecordsRule().validate(s)
+    assert [(f.before, f.after) for f in findings if isinstance(f, RenamedEventFinding)] == [
+        (f"event_{i}", f"new_event_{i}") for i in range(500)
+    ]
+    assert capsys.readouterr().out == ""
@@ -0,0 +1,163 @@
+import gzip
+import hashlib
+import threading
+import time
+import zlib
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Iterator
+from urllib.parse import urlsplit, urlunsplit
+
+import pytest
+
+from ocsf_tools.schema import available_backends, set_backend
+
+SCHEMA_CACHE = Path(__file__).parent.parent.parent / "schema_cache"
+VERSIONS = ["1.0.0", "1.1.0", "1.2.0"]
+DEV_VERSION = "1.3.0-dev"
+LAST_MODIFIED = "Mon, 03 Jun 2024 12:00:00 GMT"
+
+
+@pytest.fixture(params=available_backends())
+def json_backend(request: pytest.FixtureRequest) -> Iterator[str]:
+    """Run a test with each available JSON backend.
+
+    Modules that test decoding use it for all of their tests, with
+    pytestmark = pytest.mark.usefixtures("json_backend").
+    """
+    previous = set_backend(request.param)
+    yield request.param
+    set_backend(previous)
+
+
+class StandInServer:
+    """A local stand-in for the OCSF server's /api/versions and export/schema endpoints.
+
+    Attributes:
+        url: The base URL of the server.
+        bodies: The response bodies, by path. The dev version is 1.2.0
+            renamed, and may be changed.
+        requests: The paths requested so far.
+        statuses: The statuses of the responses so far.
+        delays: Seconds to wait before answering a request, by path.
+        clients: The addresses of the connections made so far.
+        encoding: The Content-Encoding of responses, if the client accepts it:
+            "gzip", "deflate", or None.
+        close: Close each connection after one response, without telling the
+            client.
+        validators: Send ETag and Last-Modified headers, and answer
+            conditional requests with 304 Not Modified.
+        max_concurrent: The most requests being answered at once so far.
+        proxied: The request targets received as a proxy so far: whole URLs,
+            which are answered as if only their path was requested, and the
+            host:port of CONNECT requests, which are refused.
+    """
+
+    def __init__(self, server: ThreadingHTTPServer, bodies: dict[str, bytes]):
+        self.url = f"http://127.0.0.1:{server.server_address[1]}/"
+        self.bodies = bodies
+        self.requests: list[str] = []
+        self.statuses: list[int] = []
+        self.delays: dict[str, float] = {}
+        self.clients: set[tuple[str, int]] = set()
+        self.encoding: str | None = None
+        self.close = False
+        self.validators = True
+        self.max_concurrent = 0
+        self.proxied: list[str] = []
+        self._in_flight = 0
+        self._lock = threading.Lock()
+
+    def started(self) -> None:
+        """Count a request being answered."""
+        with self._lock:
+            self._in_flight += 1
+            self.max_concurrent = max(self.max_concurrent, self._in_flight)
+
+    def finished(self) -> None:
+        """Count a request answered."""
+        with self._lock:
+            self._in_flight -= 1
+
+    def schema_path(self, version: str) -> str:
+        return f"/{version}/export/schema"
+
+
+@pytest.fixture
+def ocsf_server() -> Iterator[StandInServer]:
+    """Serve the schemas in schema_cache from a local HTTP server."""
+    bodies = {f"/{v}/export/schema": (SCHEMA_CACHE / f"schema-{v}.json").read_bytes() for v in VERSIONS}
+    bodies["/export/schema"] = bodies[f"/{VERSIONS[-1]}/export/schema"]
+    bodies[f"/{DEV_VERSION}/export/schema"] = bodies["/export/schema"].replace(
+        f'"version": "{VERSIONS[-1]}"'.encode(), f'"version": "{DEV_VERSION}"'.encode(), 1
+    )
+    versions = [{"url": f"/{v}/", "version": v} for v in VERSIONS + [DEV_VERSION]]
+    bodies["/api/versions"] = (
+        '{"default": {"url": "/", "version": "%s"}, "versions": %s}' % (VERSIONS[-1], str(versions).replace("'", '"'))
+    ).encode()
+
+    stand_in: StandInServer
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            stand_in.started()
+            try:
+                self.respond()
+            finally:
+                stand_in.finished()
+
+        def do_CONNECT(self):
+            stand_in.proxied.append(self.path)
+            self.send_error(502)
+
+        def respond(self):
+            if self.path.startswith("http://"):
+                stand_in.proxied.append(self.path)
+                self.path = urlunsplit(("", "", *urlsplit(self.path)[2:4], ""))
+            stand_in.requests.append(self.path)
+            stand_in.clients.add(self.client_address)
+            time.sleep(stand_in.delays.get(self.path, 0))
+            body = stand_in.bodies.get(self.path)
+            if body is None:
+                stand_in.statuses.append(404)
+                self.send_error(404)
+                return
+
+            etag = '"%s"' % hashlib.sha256(body).hexdigest()[:16]
+            if stand_in.validators and self.headers.get("If-None-Match") == etag:
+                stand_in.statuses.append(304)
+                self.send_response(304)
+                self.send_header("ETag", etag)
+                self.end_headers()
+                self.close_connection = stand_in.close
+                return
+
+            stand_in.statuses.append(200)
+            self.send_response(200)
+            if stand_in.validators:
+                self.send_header("ETag", etag)
+                self.send_header("Last-Modified", LAST_MODIFIED)
+            encoding = stand_in.encoding
+            if encoding is not None and encoding in self.headers.get("Accept-Encoding", ""):
+                body = gzip.compress(body) if encoding == "gzip" else zlib.compress(body)
+                self.send_header("Content-Encoding", encoding)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+            self.close_connection = stand_in.close
+
+        def log_message(self, format: str, *args: object) -> None:
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    stand_in = StandInServer(server, bodies)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield stand_in
+    server.shutdown()
+    server.server_close()
+    thread.join()
@@ -0,0 +1,105 @@
+import asyncio
+
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from ocsf_tools.schema import AsyncOcsfServerClient, OcsfSchema, get_schema_async
+
+
+def test_get_schemas(ocsf_server: Any):
+    """Test fetching several schemas concurrently, fetching the versions once."""
+    client = AsyncOcsfServerClient(ocsf_server.url)
+    schemas = asyncio.run(client.get_schemas(["1.0.0", "1.2.0", "1.1.0"]))
+
+    assert [s.version for s in schemas] == ["1.0.0", "1.2.0", "1.1.0"]
+    assert all(isinstance(s, OcsfSchema) for s in schemas)
+    assert ocsf_server.requests.count("/api/versions") == 1
+    assert sorted(ocsf_server.requests) == sorted(
+        ["/api/versions", "/1.0.0/export/schema", "/1.1.0/export/schema", "/1.2.0/export/schema"]
+    )
+
+
+def test_get_versions(ocsf_server: Any):
+    """Test fetching the versions, which the synchronous client then reuses."""
+    client = AsyncOcsfServerClient(ocsf_server.url)
+
+    async def fetch():
+        return await asyncio.gather(client.get_versions(), client.get_default_version())
+
+    versions, default = asyncio.run(fetch())
+    assert versions == ["1.0.0", "1.1.0", "1.2.0", "1.3.0-dev"]
+    assert default == "1.2.0"
+    assert client.client.get_versions() == versions
+    assert ocsf_server.requests == ["/api/versions"]
+
+
+def test_get_schema_default(ocsf_server: Any):
+    """Test fetching the server's default schema."""
+    schema = asyncio.run(AsyncOcsfServerClient(ocsf_server.url).get_schema())
+    assert schema.version == "1.2.0"
+    assert ocsf_server.requests == ["/export/schema"]
+
+
+def test_get_schemas_cached(ocsf_server: Any, tmp_path: Path):
+    """Test that cached schemas are read from the cache rather than the server."""
+    asyncio.run(AsyncOcsfServerClient(ocsf_server.url, tmp_path).get_schemas(["1.0.0", "1.1.0"]))
+    assert (tmp_path / "schema-1.0.0.json").exists()
+    assert (tmp_path / "schema-1.1.0.json").exists()
+
+    ocsf_server.requests.clear()
+    schemas = asyncio.run(AsyncOcsfServerClient(ocsf_server.url, tmp_path).get_schemas(["1.0.0", "1.1.0"]))
+    assert [s.version for s in schemas] == ["1.0.0", "1.1.0"]
+    assert ocsf_server.requests == []
+
+
+def test_get_schema_invalid(ocsf_server: Any):
+    """Test that invalid and unknown versions raise a ValueError."""
+    client = AsyncOcsfServerClient(ocsf_server.url)
+
+    with pytest.raises(ValueError, match="Invalid version"):
+        asyncio.run(client.get_schema("not-a-version"))
+
+    with pytest.raises(ValueError, match="not found"):
+        asyncio.run(client.get_schema("9.9.9"))
+
+
+def test_concurrency_invalid():
+    """Test that a concurrency below 1 is rejected."""
+    with pytest.raises(ValueError):
+        AsyncOcsfServerClient(concurrency=0)
+
+
+def test_get_schemas_overlap(ocsf_server: Any):
+    """Test that several schemas are downloaded at once."""
+    for version in ("1.0.0", "1.1.0", "1.2.0"):
+        ocsf_server.delays[ocsf_server.schema_path(version)] = 0.3
+
+    client = AsyncOcsfServerClient(ocsf_server.url)
+    asyncio.run(client.get_schemas(["1.0.0", "1.1.0", "1.2.0"]))
+    assert ocsf_server.max_concurrent >= 2
+
+
+def test_get_schemas_concurrency_limit(ocsf_server: Any):
+    """Test that a concurrency of 1 fetches one schema at a time."""
+    for version in ("1.0.0", "1.1.0"):
+        ocsf_server.delays[ocsf_server.schema_path(version)] = 0.2
+
+    client = AsyncOcsfServerClient(ocsf_server.url, concurrency=1)
+    asyncio.run(client.get_schemas(["1.0.0", "1.1.0"]))
+    assert ocsf_server.max_concurrent == 1
+
+
+def test_get_schema_async(ocsf_server: Any):
+    """Test loading a file and a version concurrently."""
+    client = AsyncOcsfServerClient(ocsf_server.url)
+    file = str(Path(__file__).parent.parent.parent / "schema_cache" / "schema-1.0.0.json")
+
+    async def load():
+        return await asyncio.gather(get_schema_async(file, client), get_schema_async("1.1.0", client))
+
+    before, after = asyncio.run(load())
+    assert before.version == "1.0.0"
+    assert after.version == "1.1.0"
+    assert "/1.0.0/export/schema" not in ocsf_server.requests
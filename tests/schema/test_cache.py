@@ -0,0 +1,152 @@
+import asyncio
+import os
+
+from email.message import Message
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from ocsf_tools.schema import AsyncOcsfServerClient, OcsfServerClient
+from ocsf_tools.schema.cache import CacheEntry, read_entry, write_atomic, write_entry
+
+DEV = "1.3.0-dev"
+
+
+def test_entry_round_trip(tmp_path: Path):
+    """Test writing and reading a cache entry's sidecar."""
+    entry = CacheEntry(DEV, '"abc"', "Mon, 03 Jun 2024 12:00:00 GMT", 1000.0)
+    write_entry(tmp_path / "schema-dev.meta", entry)
+    assert read_entry(tmp_path / "schema-dev.meta") == entry
+    assert read_entry(tmp_path / "missing.meta") is None
+
+    (tmp_path / "bad.meta").write_text("{not json")
+    assert read_entry(tmp_path / "bad.meta") is None
+
+
+def test_write_atomic_mode(tmp_path: Path):
+    """Test that atomically written files get the umask's permissions, not mkstemp's owner-only ones."""
+    umask = os.umask(0)
+    os.umask(umask)
+    expected = 0o666 & ~umask
+    assert expected != 0o600
+
+    path = tmp_path / "schema.json"
+    write_atomic(path, b"{}")
+    assert path.read_bytes() == b"{}"
+    assert path.stat().st_mode & 0o777 == expected
+
+    def write(tmp: Path) -> None:
+        tmp.write_text("{}")
+
+    path = tmp_path / "schema.json.gz"
+    write_atomic(path, write)
+    assert path.stat().st_mode & 0o777 == expected
+
+
+def test_entry_validators():
+    """Test freshness, conditional headers, and revalidation of an entry."""
+    entry = CacheEntry(DEV, '"abc"', None, 1000.0)
+    assert entry.fresh(60, now=1059)
+    assert not entry.fresh(60, now=1060)
+    assert not entry.fresh(0, now=1000)
+    assert entry.conditional_headers() == {"If-None-Match": '"abc"'}
+    assert CacheEntry(DEV).conditional_headers() == {}
+
+    headers = Message()
+    headers["Last-Modified"] = "Mon, 03 Jun 2024 12:00:00 GMT"
+    revalidated = entry.revalidated(headers)
+    assert revalidated.etag == '"abc"'
+    assert revalidated.last_modified == "Mon, 03 Jun 2024 12:00:00 GMT"
+    assert revalidated.fresh(60)
+
+
+def test_dev_version_cached(ocsf_server: Any, tmp_path: Path):
+    """Test that a dev version is cached and used without requests until its TTL passes."""
+    schema = OcsfServerClient(ocsf_server.url, tmp_path).get_schema(DEV)
+    assert schema.version == DEV
+    assert (tmp_path / f"schema-{DEV}.json").exists()
+    assert read_entry(tmp_path / f"schema-{DEV}.meta") is not None
+
+    ocsf_server.requests.clear()
+    assert OcsfServerClient(ocsf_server.url, tmp_path).get_schema(DEV) == schema
+    assert ocsf_server.requests == []
+
+
+def test_dev_version_not_modified(ocsf_server: Any, tmp_path: Path):
+    """Test that a stale dev version is revalidated with one conditional request."""
+    schema = OcsfServerClient(ocsf_server.url, tmp_path).get_schema(DEV)
+    ocsf_server.requests.clear()
+    ocsf_server.statuses.clear()
+
+    client = OcsfServerClient(ocsf_server.url, tmp_path, ttl=0)
+    assert client.get_schema(DEV) == schema
+    assert ocsf_server.requests == [f"/{DEV}/export/schema"]
+    assert ocsf_server.statuses == [304]
+    assert client.pool.stats.bytes_received == 0
+
+
+def test_dev_version_modified(ocsf_server: Any, tmp_path: Path):
+    """Test that a changed dev version is downloaded and cached again."""
+    OcsfServerClient(ocsf_server.url, tmp_path).get_schema(DEV)
+    path = f"/{DEV}/export/schema"
+    ocsf_server.bodies[path] = ocsf_server.bodies[path].replace(b'"Email URL Activity"', b'"Email Link Activity"', 1)
+
+    schema = OcsfServerClient(ocsf_server.url, tmp_path, ttl=0).get_schema(DEV)
+    assert schema.classes["email_url_activity"].caption == "Email Link Activity"
+    assert ocsf_server.statuses[-1] == 200
+
+    ocsf_server.statuses.clear()
+    assert OcsfServerClient(ocsf_server.url, tmp_path, ttl=0).get_schema(DEV) == schema
+    assert ocsf_server.statuses == [304]
+
+
+def test_default_version_cached(ocsf_server: Any, tmp_path: Path):
+    """Test that the default version is cached, and revalidated once stale."""
+    schema = OcsfServerClient(ocsf_server.url, tmp_path).get_schema()
+    assert schema.version == "1.2.0"
+    assert (tmp_path / "schema-1.2.0.json").exists()
+    entry = read_entry(tmp_path / "schema-default.meta")
+    assert entry is not None and entry.version == "1.2.0"
+
+    ocsf_server.requests.clear()
+    assert OcsfServerClient(ocsf_server.url, tmp_path).get_schema() == schema
+    assert ocsf_server.requests == []
+
+    assert OcsfServerClient(ocsf_server.url, tmp_path, ttl=0).get_schema() == schema
+    assert ocsf_server.requests == ["/export/schema"]
+    assert ocsf_server.statuses[-1] == 304
+
+
+def test_without_validators(ocsf_server: Any, tmp_path: Path):
+    """Test that a stale entry without validators is downloaded again."""
+    ocsf_server.validators = False
+    OcsfServerClient(ocsf_server.url, tmp_path).get_schema(DEV)
+    OcsfServerClient(ocsf_server.url, tmp_path, ttl=0).get_schema(DEV)
+    assert ocsf_server.statuses[-1] == 200
+
+
+def test_release_not_revalidated(ocsf_server: Any, tmp_path: Path):
+    """Test that released versions are cached forever, without metadata."""
+    schema = OcsfServerClient(ocsf_server.url, tmp_path).get_schema("1.1.0")
+    assert not (tmp_path / "schema-1.1.0.meta").exists()
+
+    ocsf_server.requests.clear()
+    assert OcsfServerClient(ocsf_server.url, tmp_path, ttl=0).get_schema("1.1.0") == schema
+    assert ocsf_server.requests == []
+
+
+def test_async_not_modified(ocsf_server: Any, tmp_path: Path):
+    """Test that the async client revalidates stale entries too."""
+    asyncio.run(AsyncOcsfServerClient(ocsf_server.url, tmp_path).get_schemas([DEV, None]))
+    ocsf_server.statuses.clear()
+
+    schemas = asyncio.run(AsyncOcsfServerClient(ocsf_server.url, tmp_path, ttl=0).get_schemas([DEV, None]))
+    assert [s.version for s in schemas] == [DEV, "1.2.0"]
+    assert ocsf_server.statuses == [304, 304]
+
+
+def test_invalid_ttl():
+    """Test that a negative TTL is rejected."""
+    with pytest.raises(ValueError):
+        OcsfServerClient(ttl=-1)
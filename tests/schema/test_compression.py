@@ -0,0 +1,115 @@
+import os
+import pytest
+import shutil
+
+from pathlib import Path
+
+from ocsf_tools.schema import OcsfServerClient, from_file, from_file_snapshot, to_file
+from ocsf_tools.schema.compression import (
+    available_compressions,
+    compression_for_path,
+    decompress,
+    detect,
+    extension,
+    open_read,
+)
+
+LOCATION = os.path.dirname(os.path.abspath(__file__))
+SCHEMA_JSON = os.path.join(LOCATION, "../..", "schema_cache/schema-1.0.0.json")
+
+
+@pytest.mark.parametrize("compression", available_compressions())
+def test_round_trip(tmp_path: Path, compression: str):
+    """Test that a schema survives writing to and reading from a compressed file."""
+    schema = from_file(SCHEMA_JSON)
+    path = tmp_path / f"schema.json{extension(compression)}"
+    to_file(schema, str(path))
+
+    assert detect(path.read_bytes()) == compression
+    assert path.stat().st_size < os.path.getsize(SCHEMA_JSON) / 4
+    assert from_file(str(path)) == schema
+    assert from_file(str(path), lazy=True) == schema
+
+
+def test_gzip_reproducible(tmp_path: Path):
+    """Test that gzip output doesn't depend on the file's name or when it was written."""
+    schema = from_file(SCHEMA_JSON)
+    to_file(schema, str(tmp_path / "a.json.gz"))
+    to_file(schema, str(tmp_path / "tmpxyz.tmp"), "gzip")
+
+    data = (tmp_path / "a.json.gz").read_bytes()
+    assert data == (tmp_path / "tmpxyz.tmp").read_bytes()
+    # The header has no FNAME field.
+    assert data[3] & 0x08 == 0
+
+
+@pytest.mark.parametrize("compression", available_compressions())
+def test_detected_by_content(tmp_path: Path, compression: str):
+    """Test that compressed files are read correctly whatever their name."""
+    schema = from_file(SCHEMA_JSON)
+    path = tmp_path / "schema.json"
+    to_file(schema, str(path), compression)
+
+    assert detect(path.read_bytes()) == compression
+    assert from_file(str(path)) == schema
+    with open_read(path) as f:
+        assert f.read() == decompress(path.read_bytes())
+
+
+def test_uncompressed():
+    """Test that uncompressed files are read as they are."""
+    with open(SCHEMA_JSON, "rb") as f:
+        data = f.read()
+
+    assert detect(data) is None
+    assert decompress(data) is data
+    with open_read(SCHEMA_JSON) as f:
+        assert f.read() == data
+
+
+def test_compression_for_path():
+    """Test that compressions are chosen by extension."""
+    assert compression_for_path("schema.json") is None
+    assert compression_for_path("schema.json.gz") == "gzip"
+    assert compression_for_path("schema.json.xz") == "xz"
+    assert compression_for_path("schema.json.zst") == "zstd"
+
+
+def test_unknown_compression(tmp_path: Path):
+    """Test that an unknown compression is rejected."""
+    with pytest.raises(ValueError):
+        to_file(from_file(SCHEMA_JSON), str(tmp_path / "schema.json"), "brotli")
+
+    with pytest.raises(ValueError):
+        OcsfServerClient(cache_dir=tmp_path, compression="brotli")
+
+
+@pytest.mark.skipif("zstd" in available_compressions(), reason="zstandard is installed")
+def test_zstd_unavailable(tmp_path: Path):
+    """Test that zstd requires the zstandard package."""
+    with pytest.raises(ImportError):
+        to_file(from_file(SCHEMA_JSON), str(tmp_path / "schema.json.zst"))
+
+
+def test_snapshot_of_compressed_file(tmp_path: Path):
+    """Test that snapshots work with compressed files."""
+    schema = from_file(SCHEMA_JSON)
+    path = tmp_path / "schema.json.gz"
+    to_file(schema, str(path))
+
+    assert from_file_snapshot(path) == schema
+    assert from_file_snapshot(path) == schema
+
+
+@pytest.mark.parametrize("cached", ["schema-1.0.0.json", "schema-1.0.0.json.gz", "schema-1.0.0.json.xz"])
+def test_client_reads_any_compression(tmp_path: Path, cached: str):
+    """Test that the client finds cached schemas whatever their compression."""
+    schema = from_file(SCHEMA_JSON)
+    if cached.endswith(".json"):
+        shutil.copy(SCHEMA_JSON, tmp_path / cached)
+    else:
+        to_file(schema, str(tmp_path / cached))
+
+    # The base URL is unreachable, so the schema must come from the cache.
+    client = OcsfServerClient(base_url="http://localhost:9/", cache_dir=tmp_path, compression="gzip")
+    assert client.get_schema("1.0.0") == schema
@@ -0,0 +1,88 @@
+import json
+import os
+import pytest
+
+from typing import Any
+
+from dacite import from_dict
+
+from ocsf_tools.schema import OcsfSchema, OcsfAttr, OcsfDeprecationInfo, from_json, keys_to_names
+from ocsf_tools.schema.decoder import DecodeError, Decoder
+
+LOCATION = os.path.dirname(os.path.abspath(__file__))
+CACHE = os.path.join(LOCATION, "../..", "schema_cache")
+VERSIONS = ["1.0.0", "1.1.0", "1.2.0"]
+
+pytestmark = pytest.mark.usefixtures("json_backend")
+
+
+@pytest.mark.parametrize("version", VERSIONS)
+def test_matches_dacite(version: str):
+    """Test that the decoder builds the same schema as dacite."""
+    with open(os.path.join(CACHE, f"schema-{version}.json"), "r") as f:
+        data = f.read()
+
+    expected = from_dict(OcsfSchema, keys_to_names(json.loads(data)))
+    assert from_json(data) == expected
+
+
+def test_aliases():
+    """Test that aliased keys and field names are both accepted."""
+    decoder = Decoder(aliases={"@deprecated": "deprecated"})
+    data = {"caption": "Test", "requirement": "optional", "type": "string_t"}
+
+    attr = decoder.decode(OcsfAttr, data | {"@deprecated": {"message": "Gone", "since": "1.1.0"}})
+    assert attr.deprecated == OcsfDeprecationInfo(message="Gone", since="1.1.0")
+
+    attr = decoder.decode(OcsfAttr, data | {"deprecated": {"message": "Gone", "since": "1.1.0"}})
+    assert attr.deprecated == OcsfDeprecationInfo(message="Gone", since="1.1.0")
+
+
+def test_ignores_unknown_keys():
+    """Test that keys without a matching field are ignored."""
+    attr = Decoder().decode(OcsfAttr, {"caption": "Test", "requirement": "optional", "type": "string_t", "x": 1})
+    assert attr == OcsfAttr(caption="Test", requirement="optional", type="string_t")
+
+
+def test_missing_required_field():
+    """Test that a missing required field raises a ValueError."""
+    with pytest.raises(ValueError):
+        Decoder().decode(OcsfAttr, {"caption": "Test", "type": "string_t"})
+
+
+@pytest.mark.parametrize(
+    "data, path",
+    [
+        ({"version": 1}, "version"),
+        ({"version": "1.0.0", "classes": []}, "classes"),
+        ({"version": "1.0.0", "classes": {"a": []}}, "classes.a"),
+        ({"version": "1.0.0", "types": {"t": {"caption": "T", "range": [0, "9"]}}}, "types.t.range.1"),
+        (
+            {
+                "version": "1.0.0",
+                "objects": {"o": {"caption": "O", "name": "o", "attributes": {"x": {"requirement": 1}}}},
+            },
+            "objects.o.attributes.x.requirement",
+        ),
+    ],
+)
+def test_invalid_types(data: dict[str, Any], path: str):
+    """Test that a value of the wrong type raises a ValueError naming its path."""
+    with pytest.raises(DecodeError) as e:
+        Decoder(aliases={"@deprecated": "deprecated"}).decode(OcsfSchema, data)
+
+    assert isinstance(e.value, ValueError)
+    assert ".".join(e.value.path) == path
+    assert str(e.value).endswith(f"at {path}")
+
+
+def test_union():
+    """Test that values of a union are accepted if they match any of its members."""
+    decoder = Decoder()
+    data = {"caption": "Test", "requirement": "optional", "type": "string_t"}
+
+    assert decoder.decode(OcsfAttr, data | {"profile": "host"}).profile == "host"
+    assert decoder.decode(OcsfAttr, data | {"profile": ["host"]}).profile == ["host"]
+    assert decoder.decode(OcsfAttr, data | {"profile": None}).profile is None
+    with pytest.raises(DecodeError):
+        decoder.decode(OcsfAttr, data | {"profile": 1})
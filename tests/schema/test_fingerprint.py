@@ -0,0 +1,157 @@
+import copy
+import os
+import pickle
+import pytest
+import subprocess
+import sys
+
+from pathlib import Path
+from typing import Any
+
+from ocsf_tools.schema import (
+    OcsfAttr,
+    OcsfDeprecationInfo,
+    OcsfEnumMember,
+    OcsfEvent,
+    OcsfSchema,
+    fingerprint,
+    fingerprints,
+    from_file,
+    from_file_snapshot,
+    has_fingerprint,
+    store_fingerprints,
+    stored_fingerprint,
+)
+
+LOCATION = os.path.dirname(os.path.abspath(__file__))
+SCHEMA_JSON = os.path.join(LOCATION, "../..", "schema_cache/schema-1.0.0.json")
+
+
+def attr(**kwargs: Any) -> OcsfAttr:
+    """An attribute with some fields replaced."""
+    fields: dict[str, Any] = {"caption": "Time", "requirement": "required", "type": "timestamp_t"}
+    return OcsfAttr(**(fields | kwargs))
+
+
+def test_known_fingerprints():
+    """Test that fingerprints don't change between releases.
+
+    If this test fails, the fingerprint encoding has changed and
+    FINGERPRINT_VERSION must be bumped.
+    """
+    assert fingerprint(OcsfSchema(version="1.0.0")) == "458060f859419a4753f6a0635a05c437"
+    assert fingerprint(attr(enum={"1": OcsfEnumMember(caption="One")})) == "0123de4824c3541608c4bb56b02d9b22"
+
+
+def test_stable_across_processes():
+    """Test that fingerprints don't depend on the process, like its string hash seed."""
+    script = f"from ocsf_tools.schema import fingerprint, from_file; print(fingerprint(from_file({SCHEMA_JSON!r})))"
+    expected = fingerprint(from_file(SCHEMA_JSON))
+
+    for seed in ("1", "2"):
+        result = subprocess.run(
+            [sys.executable, "-c", script],
+            capture_output=True,
+            text=True,
+            check=True,
+            env=os.environ | {"PYTHONHASHSEED": seed},
+        )
+        assert result.stdout.strip() == expected
+
+
+def test_equal_models():
+    """Test that equal models have equal fingerprints, whatever the order of their dictionaries."""
+    a = attr(enum={"1": OcsfEnumMember(caption="One"), "2": OcsfEnumMember(caption="Two")})
+    b = attr(enum={"2": OcsfEnumMember(caption="Two"), "1": OcsfEnumMember(caption="One")})
+
+    assert a == b
+    assert fingerprint(a) == fingerprint(b)
+
+
+@pytest.mark.parametrize(
+    "other",
+    [
+        attr(caption="Times"),
+        attr(description=""),
+        attr(is_array=True),
+        attr(observable=1),
+        attr(profile="datetime"),
+        attr(profile=["datetime"]),
+        attr(deprecated=OcsfDeprecationInfo(message="Gone", since="1.1.0")),
+        attr(enum={}),
+        attr(enum={"1": OcsfEnumMember(caption="One")}),
+    ],
+)
+def test_different_models(other: OcsfAttr):
+    """Test that a change to any field changes the fingerprint."""
+    assert fingerprint(attr()) != fingerprint(other)
+
+
+def test_different_types():
+    """Test that models of different types with the same fields have different fingerprints."""
+    event = OcsfEvent(caption="Thing", name="thing")
+    schema = from_file(SCHEMA_JSON)
+    obj = schema.objects["user"]
+
+    assert fingerprint(event) != fingerprint(obj)
+
+
+def test_schema():
+    """Test that schemas parsed in different ways have the same fingerprint."""
+    expected = fingerprint(from_file(SCHEMA_JSON))
+
+    assert fingerprint(from_file(SCHEMA_JSON, intern=True)) == expected
+    assert fingerprint(from_file(SCHEMA_JSON, lazy=True)) == expected
+    assert fingerprint(pickle.loads(pickle.dumps(from_file(SCHEMA_JSON)))) == expected
+
+
+def test_nested_change():
+    """Test that a change deep in a schema changes the schema's fingerprint."""
+    schema = from_file(SCHEMA_JSON)
+    before = fingerprint(schema)
+
+    changed = copy.deepcopy(schema)
+    changed.objects["user"].attributes["name"].caption = "Username"
+    assert fingerprint(changed) != before
+    assert fingerprint(schema) == before
+
+
+def test_not_stored():
+    """Test that fingerprints aren't stored implicitly, so they follow changes to models."""
+    schema = from_file(SCHEMA_JSON)
+    before = fingerprint(schema)
+    assert not has_fingerprint(schema)
+
+    schema.objects["user"].attributes["name"].caption = "Username"
+    assert fingerprint(schema) != before
+
+
+def test_store_fingerprints():
+    """Test that stored fingerprints are those fingerprint() computes, with shared instances once."""
+    schema = from_file(SCHEMA_JSON, intern=True)
+    digests = fingerprints(schema)
+    assert len({id(model) for model, _ in digests}) == len(digests)
+
+    store_fingerprints(digests)
+    assert stored_fingerprint(schema) == bytes.fromhex(fingerprint(schema))
+    user = schema.objects["user"]
+    assert stored_fingerprint(user) == bytes.fromhex(fingerprint(user))
+
+    # Stored fingerprints aren't updated, and fingerprint() ignores them.
+    user.caption = "Changed"
+    assert stored_fingerprint(user) != bytes.fromhex(fingerprint(user))
+
+
+def test_snapshot_keeps_fingerprints(tmp_path: Path):
+    """Test that schemas loaded from snapshots have their fingerprints already."""
+    path = tmp_path / "schema.json"
+    path.write_bytes(Path(SCHEMA_JSON).read_bytes())
+
+    expected = fingerprint(from_file(SCHEMA_JSON))
+    parsed = from_file_snapshot(path)
+    schema = from_file_snapshot(path)
+
+    # Writing the snapshot left the parsed schema alone.
+    assert not has_fingerprint(parsed)
+    assert stored_fingerprint(schema) == bytes.fromhex(expected)
+    assert stored_fingerprint(schema.objects["user"]) == bytes.fromhex(fingerprint(schema.objects["user"]))
@@ -0,0 +1,117 @@
+import os
+import pickle
+
+from copy import deepcopy
+from dataclasses import FrozenInstanceError, replace
+
+import pytest
+
+from ocsf_tools.schema import InternPool, OcsfEvent, fingerprint, freeze, from_file, intern_schema, is_frozen
+
+LOCATION = os.path.dirname(os.path.abspath(__file__))
+CACHE = os.path.join(LOCATION, "../..", "schema_cache")
+
+
+def load(version: str, intern: bool = False):
+    return from_file(os.path.join(CACHE, f"schema-{version}.json"), intern)
+
+
+def test_intern_preserves_schema():
+    """Test that an interned schema is equal to the original."""
+    schema = load("1.1.0")
+    stats = intern_schema(schema)
+
+    assert schema == load("1.1.0")
+    assert stats.saved > 0
+    assert stats.bytes_after < stats.bytes_before
+
+
+def test_intern_shares_attributes():
+    """Test that identical attributes are shared between events."""
+    schema = load("1.1.0", intern=True)
+
+    assert schema.classes["authentication"].attributes["time"] is schema.classes["file_activity"].attributes["time"]
+
+
+def test_intern_shares_enum_members():
+    """Test that identical enum members are shared between different attributes."""
+    schema = load("1.1.0", intern=True)
+
+    activity_a = schema.classes["authentication"].attributes["activity_id"]
+    activity_b = schema.classes["file_activity"].attributes["activity_id"]
+    assert activity_a.enum is not None and activity_b.enum is not None
+    assert activity_a.enum["0"] is activity_b.enum["0"]
+
+
+def test_intern_does_not_share_different_attributes():
+    """Test that attributes that differ are not shared."""
+    schema = load("1.1.0", intern=True)
+
+    activity_a = schema.classes["authentication"].attributes["activity_id"]
+    activity_b = schema.classes["file_activity"].attributes["activity_id"]
+    assert activity_a is not activity_b
+    assert activity_a != activity_b
+
+
+def test_intern_pool_shares_across_schemas():
+    """Test that a pool shares identical attributes between schema versions."""
+    pool = InternPool()
+    old = load("1.1.0")
+    new = load("1.2.0")
+    intern_schema(old, pool)
+    intern_schema(new, pool)
+
+    shared = [
+        name
+        for name, attr in old.classes["authentication"].attributes.items()
+        if attr is new.classes["authentication"].attributes.get(name)
+    ]
+    assert len(shared) > 0
+
+
+def test_intern_freezes_shared_instances():
+    """Test that shared instances can't be modified, but copies of them can."""
+    schema = load("1.1.0", intern=True)
+    time = schema.classes["authentication"].attributes["time"]
+    assert is_frozen(time)
+
+    with pytest.raises(FrozenInstanceError):
+        time.caption = "Changed"
+    with pytest.raises(FrozenInstanceError):
+        del time.description
+    assert schema.classes["file_activity"].attributes["time"].caption != "Changed"
+
+    activity = schema.classes["authentication"].attributes["activity_id"]
+    assert activity.enum is not None
+    with pytest.raises(FrozenInstanceError):
+        activity.enum["0"].caption = "Changed"
+
+    # Replacing the attribute with a modified copy only changes one event.
+    schema.classes["authentication"].attributes["time"] = replace(time, caption="Changed")
+    assert schema.classes["file_activity"].attributes["time"].caption != "Changed"
+    assert not is_frozen(deepcopy(time))
+
+    # Interning an interned schema again reuses its shared instances.
+    intern_schema(schema)
+    assert schema.classes["file_activity"].attributes["time"] is time
+
+
+def test_frozen_models():
+    """Test that frozen models compare, copy, and pickle like other models."""
+    schema = load("1.1.0")
+    event = schema.classes["authentication"]
+    copy = deepcopy(event)
+    freeze(event)
+    freeze(event)
+
+    assert is_frozen(event)
+    assert event == copy and copy == event
+    assert type(event).__name__ == "OcsfEvent"
+    assert isinstance(event, OcsfEvent)
+    assert fingerprint(event) == fingerprint(copy)
+    assert repr(event) == repr(copy)
+
+    for unfrozen in (deepcopy(event), pickle.loads(pickle.dumps(event)), replace(event)):
+        assert type(unfrozen) is OcsfEvent
+        assert unfrozen == event
+        unfrozen.caption = "Changed"
@@ -0,0 +1,201 @@
+import io
+import json
+import os
+import pytest
+
+from pathlib import Path
+from typing import Any
+
+from ocsf_tools.schema import (
+    OcsfAttr,
+    OcsfDeprecationInfo,
+    OcsfEnumMember,
+    OcsfObject,
+    OcsfSchema,
+    available_backends,
+    from_file,
+    from_json,
+    from_reader,
+    get_backend,
+    keys_to_names,
+    names_to_keys,
+    set_backend,
+    to_dict,
+    to_file,
+    to_json,
+    to_stream,
+)
+
+LOCATION = os.path.dirname(os.path.abspath(__file__))
+SCHEMA_JSON = os.path.join(LOCATION, "../..", "schema_cache/schema-1.1.0.json")
+CACHED = [os.path.join(LOCATION, "../..", f"schema_cache/schema-{v}.json") for v in ("1.0.0", "1.1.0", "1.2.0")]
+
+pytestmark = pytest.mark.usefixtures("json_backend")
+
+DEPRECATED = OcsfDeprecationInfo(message="Use something else.", since="1.1.0")
+
+
+def _deprecated_schema() -> OcsfSchema:
+    """A schema with deprecation info at every depth it can appear."""
+    attr = OcsfAttr(
+        caption="Thing",
+        requirement="optional",
+        type="integer_t",
+        deprecated=DEPRECATED,
+        enum={"1": OcsfEnumMember(caption="One")},
+    )
+    obj = OcsfObject(caption="Obj", name="obj", attributes={"deprecated": attr}, deprecated=DEPRECATED)
+    return OcsfSchema(version="1.1.0", objects={"obj": obj})
+
+
+def test_backend_selected(json_backend: str):
+    """Test that the backend fixture selects the backend."""
+    assert get_backend().name == json_backend
+
+
+def test_from_json_bytes():
+    """Test decoding a schema from bytes."""
+    with open(SCHEMA_JSON, "rb") as f:
+        data = f.read()
+
+    assert from_json(data) == from_json(data.decode("utf-8"))
+
+
+def test_json_round_trip():
+    """Test that a schema survives conversion to JSON and back."""
+    schema = from_file(SCHEMA_JSON)
+    assert from_json(to_json(schema)) == schema
+
+
+@pytest.mark.parametrize("cached", CACHED)
+def test_file_round_trip(tmp_path: Path, cached: str):
+    """Test that a schema survives writing to and reading from a file."""
+    schema = from_file(cached)
+    path = os.path.join(tmp_path, "schema.json")
+    to_file(schema, path)
+    assert from_file(path) == schema
+
+
+class CountingReader(io.BytesIO):
+    """A stream that counts the times it is read."""
+
+    reads = 0
+
+    def read(self, size: int | None = -1) -> bytes:
+        self.reads += 1
+        return super().read(size)
+
+
+def test_from_reader(json_backend: str):
+    """Test that orjson decodes a stream whole, and the standard library parses it incrementally."""
+    with open(SCHEMA_JSON, "rb") as f:
+        data = f.read()
+
+    stream = CountingReader(data)
+    assert from_reader(stream) == from_json(data)
+    assert from_reader(io.StringIO(data.decode("utf-8"))) == from_json(data)
+    if json_backend == "json":
+        assert stream.reads > 1
+    else:
+        assert stream.reads == 1
+
+
+class RecordingStream(io.BytesIO):
+    """A binary stream that records the size of each write."""
+
+    def __init__(self):
+        super().__init__()
+        self.writes: list[int] = []
+
+    def write(self, b: Any) -> int:
+        self.writes.append(len(b))
+        return super().write(b)
+
+
+@pytest.mark.parametrize("cached", CACHED)
+def test_to_stream_matches_to_dict(cached: str):
+    """Test that streaming a schema writes exactly what encoding to_dict does."""
+    schema = from_file(cached)
+    stream = RecordingStream()
+    to_stream(schema, stream)
+
+    expected = json.dumps(to_dict(schema)).encode("utf-8")
+    assert stream.getvalue() == expected
+    assert to_json(schema).encode("utf-8") == expected
+    # The document is written in pieces, never as a whole.
+    assert max(stream.writes) < len(expected) / 10
+
+
+@pytest.mark.parametrize("cached", CACHED)
+def test_to_json_canonical(cached: str):
+    """Test that to_json writes what the standard library does, whatever the backend."""
+    schema = from_file(cached)
+    assert to_json(schema) == json.dumps(to_dict(schema))
+
+
+def test_to_file_canonical(tmp_path: Path):
+    """Test that a file written with either backend is byte-identical to the standard library's output."""
+    schema = from_file(CACHED[-1])
+    expected = json.dumps(to_dict(schema)).encode("utf-8")
+
+    for backend in available_backends():
+        previous = set_backend(backend)
+        try:
+            path = tmp_path / f"{backend}.json"
+            to_file(schema, str(path))
+        finally:
+            set_backend(previous)
+        assert path.read_bytes() == expected
+
+
+def test_to_stream_lazy():
+    """Test that streaming a lazy schema writes the same document as the eager schema."""
+    eager = io.BytesIO()
+    to_stream(from_file(SCHEMA_JSON), eager)
+    lazy = io.BytesIO()
+    to_stream(from_file(SCHEMA_JSON, lazy=True), lazy)
+
+    assert lazy.getvalue() == eager.getvalue()
+
+
+def test_to_dict_property_names():
+    """Test that deprecation info is written as @deprecated at every depth."""
+    data = to_dict(_deprecated_schema())
+    obj = data["objects"]["obj"]
+
+    assert "deprecated" not in obj
+    assert obj["@deprecated"] == {"message": "Use something else.", "since": "1.1.0"}
+    # Attribute names are data, not model fields, and are left alone.
+    assert obj["attributes"]["deprecated"]["@deprecated"] == obj["@deprecated"]
+    assert "deprecated" not in obj["attributes"]["deprecated"]
+
+
+def test_deprecated_round_trip(tmp_path: Path):
+    """Test that deprecation info survives a round trip through a file."""
+    schema = _deprecated_schema()
+    path = os.path.join(tmp_path, "schema.json")
+    to_file(schema, path)
+
+    with open(path) as f:
+        assert json.load(f) == to_dict(schema)
+
+    assert from_file(path) == schema
+
+
+def test_names_to_keys():
+    """Test that names_to_keys renames nested properties without losing any."""
+    data: dict[str, Any] = {"deprecated": {"since": "1.0.0"}, "attributes": {"a": {"deprecated": {}, "include": "x"}}}
+    expected: dict[str, Any] = {
+        "@deprecated": {"since": "1.0.0"},
+        "attributes": {"a": {"@deprecated": {}, "$include": "x"}},
+    }
+
+    assert names_to_keys(data) == expected
+    assert keys_to_names(expected) == data
+    assert keys_to_names(json.loads(json.dumps(names_to_keys(data)))) == data
+
+
+def test_unknown_backend():
+    """Test that an unknown backend is rejected."""
+    with pytest.raises(ValueError):
+        set_backend("simdjson")
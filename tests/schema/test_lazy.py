@@ -0,0 +1,69 @@
+import os
+import pickle
+import pytest
+
+from ocsf_tools.compare import compare
+from ocsf_tools.schema import LazyModels, OcsfEvent, OcsfSchema, from_file, from_json, to_dict
+
+LOCATION = os.path.dirname(os.path.abspath(__file__))
+CACHE = os.path.join(LOCATION, "../..", "schema_cache")
+
+pytestmark = pytest.mark.usefixtures("json_backend")
+
+
+def load(version: str, lazy: bool = False):
+    return from_file(os.path.join(CACHE, f"schema-{version}.json"), lazy=lazy)
+
+
+def test_lazy_decodes_on_access():
+    """Test that only the events that are read are decoded."""
+    schema = load("1.1.0", lazy=True)
+    assert isinstance(schema.classes, LazyModels)
+    assert schema.classes.decoded() == 0
+
+    event = schema.classes["authentication"]
+    assert isinstance(event, OcsfEvent)
+    assert schema.classes.is_decoded("authentication")
+    assert schema.classes.decoded() == 1
+    assert schema.classes["authentication"] is event
+
+
+def test_lazy_small_document():
+    """Test a lazy schema from a small document with empty and missing members."""
+    schema = from_json('{ "version" : "1.0.0", "classes" : { }, "types": {} }', lazy=True)
+    assert schema == OcsfSchema(version="1.0.0")
+    assert len(schema.classes) == 0
+    assert len(schema.objects) == 0
+
+
+def test_lazy_equals_eager():
+    """Test that a lazy schema is equal to an eagerly parsed one."""
+    lazy = load("1.1.0", lazy=True)
+    eager = load("1.1.0")
+
+    assert list(lazy.classes.keys()) == list(eager.classes.keys())
+    assert list(lazy.objects.keys()) == list(eager.objects.keys())
+    assert lazy == eager
+
+
+def test_lazy_compare():
+    """Test that lazy schemas can be compared."""
+    assert compare(load("1.0.0", lazy=True), load("1.1.0", lazy=True)) == compare(load("1.0.0"), load("1.1.0"))
+
+
+def test_lazy_to_dict():
+    """Test that lazy schemas can be converted to a dictionary."""
+    assert to_dict(load("1.0.0", lazy=True)) == to_dict(load("1.0.0"))
+
+
+def test_lazy_pickle():
+    """Test that lazy schemas can be pickled."""
+    schema = pickle.loads(pickle.dumps(load("1.0.0", lazy=True)))
+    assert isinstance(schema.classes, dict)
+    assert schema == load("1.0.0")
+
+
+def test_lazy_intern():
+    """Test that lazy and interned schemas are mutually exclusive."""
+    with pytest.raises(ValueError):
+        from_file(os.path.join(CACHE, "schema-1.0.0.json"), intern=True, lazy=True)
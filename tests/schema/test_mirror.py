@@ -0,0 +1,99 @@
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from ocsf_tools.schema import OcsfServerClient
+from ocsf_tools.schema.mirror import main, mirror, select_versions
+
+VERSIONS = ["1.0.0", "1.1.0", "1.2.0", "1.3.0-dev", "2.0.0"]
+
+
+def test_select_versions():
+    """Test selecting versions by exact version, prefix, and range."""
+    assert select_versions([], VERSIONS) == ["1.0.0", "1.1.0", "1.2.0", "2.0.0"]
+    assert select_versions([], VERSIONS, prereleases=True) == VERSIONS
+    assert select_versions(["1.x"], VERSIONS) == ["1.2.0"]
+    assert select_versions([">=1.1.0,<2.0.0"], VERSIONS) == ["1.1.0", "1.2.0"]
+    assert select_versions([">=1.1.0,<2.0.0"], VERSIONS, prereleases=True) == ["1.1.0", "1.2.0", "1.3.0-dev"]
+    assert select_versions(["2.0.0", "1.3.0-dev", "1.0.0", "1.0.0"], VERSIONS) == ["1.0.0", "1.3.0-dev", "2.0.0"]
+
+
+def test_select_versions_invalid():
+    """Test that invalid or unmatched specifications raise a ValueError."""
+    with pytest.raises(ValueError, match="Invalid version range"):
+        select_versions([">=1.x"], VERSIONS)
+
+    with pytest.raises(ValueError, match="No version matching"):
+        select_versions([">3.0.0"], VERSIONS)
+
+    with pytest.raises(ValueError, match="Invalid version"):
+        select_versions(["newest"], VERSIONS)
+
+
+def test_mirror(ocsf_server: Any, tmp_path: Path):
+    """Test mirroring every released version, then skipping them the second time."""
+    report = mirror(OcsfServerClient(ocsf_server.url, tmp_path))
+    assert [r.version for r in report.downloaded] == ["1.0.0", "1.1.0", "1.2.0"]
+    assert report.bytes_received > 0
+    assert (tmp_path / "versions.json").exists()
+    for version in ("1.0.0", "1.1.0", "1.2.0"):
+        assert (tmp_path / f"schema-{version}.json").exists()
+        assert (tmp_path / f"schema-{version}.json.snapshot").exists()
+    assert not list(tmp_path.glob("*.tmp*"))
+
+    ocsf_server.requests.clear()
+    report = mirror(OcsfServerClient(ocsf_server.url, tmp_path))
+    assert [r.version for r in report.skipped] == ["1.0.0", "1.1.0", "1.2.0"]
+    assert ocsf_server.requests == []
+
+
+def test_mirror_invalid_entry(ocsf_server: Any, tmp_path: Path):
+    """Test that a cached file that can't be parsed is downloaded again."""
+    mirror(OcsfServerClient(ocsf_server.url, tmp_path), ["1.0.0", "1.1.0"])
+    (tmp_path / "schema-1.0.0.json").write_text('{"version": "1.0.0", "classes": {')
+
+    report = mirror(OcsfServerClient(ocsf_server.url, tmp_path), ["1.0.0", "1.1.0"])
+    assert [r.version for r in report.downloaded] == ["1.0.0"]
+    assert [r.version for r in report.skipped] == ["1.1.0"]
+    assert OcsfServerClient(ocsf_server.url, tmp_path).get_schema("1.0.0").version == "1.0.0"
+
+
+def test_mirror_parallel(ocsf_server: Any, tmp_path: Path):
+    """Test that versions are downloaded in parallel, or one at a time with one worker."""
+    for version in ("1.0.0", "1.1.0", "1.2.0"):
+        ocsf_server.delays[ocsf_server.schema_path(version)] = 0.3
+
+    report = mirror(OcsfServerClient(ocsf_server.url, tmp_path / "parallel", snapshots=False), workers=3)
+    assert len(report.downloaded) == 3
+    assert ocsf_server.max_concurrent >= 2
+
+    ocsf_server.max_concurrent = 0
+    report = mirror(OcsfServerClient(ocsf_server.url, tmp_path / "serial", snapshots=False), workers=1)
+    assert len(report.downloaded) == 3
+    assert ocsf_server.max_concurrent == 1
+
+
+def test_mirror_failure(ocsf_server: Any, tmp_path: Path):
+    """Test that a version that can't be downloaded is reported, not raised."""
+    del ocsf_server.bodies[ocsf_server.schema_path("1.0.0")]
+    report = mirror(OcsfServerClient(ocsf_server.url, tmp_path), ["1.0.0", "1.1.0"])
+    assert [r.version for r in report.failed] == ["1.0.0"]
+    assert [r.version for r in report.downloaded] == ["1.1.0"]
+
+
+def test_mirror_without_cache():
+    """Test that a client without a cache directory is rejected."""
+    with pytest.raises(ValueError):
+        mirror(OcsfServerClient())
+
+
+def test_main(ocsf_server: Any, tmp_path: Path, capsys: pytest.CaptureFixture[str]):
+    """Test the command line entry point."""
+    assert main(["--cache", str(tmp_path), "--url", ocsf_server.url, "1.x", "1.3.0-dev"]) == 0
+    out = capsys.readouterr().out
+    assert "1.2.0" in out and "1.3.0-dev" in out
+    assert "2 downloaded, 0 skipped, 0 failed" in out
+    assert "MB/s" in out
+
+    assert main(["--cache", str(tmp_path), "--url", ocsf_server.url, "9.x"]) == 1
@@ -1,9 +1,13 @@
 import os
+import pytest
+
 from ocsf_tools.schema import OcsfEvent, from_json
 
 LOCATION = os.path.dirname(os.path.abspath(__file__))
 SCHEMA_JSON = os.path.join(LOCATION, "../..", "schema_cache/schema-1.1.0.json")
 
+pytestmark = pytest.mark.usefixtures("json_backend")
+
 JSON_DATA = """{
   "version": "1.0",
   "classes": {
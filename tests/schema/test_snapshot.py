@@ -0,0 +1,120 @@
+import os
+import shutil
+
+from pathlib import Path
+
+from ocsf_tools.schema import OcsfSchema, OcsfServerClient, from_file, from_file_snapshot, has_snapshot
+from ocsf_tools.schema.snapshot import snapshot_path
+
+LOCATION = os.path.dirname(os.path.abspath(__file__))
+SCHEMA_JSON = os.path.join(LOCATION, "../..", "schema_cache/schema-1.0.0.json")
+
+
+def copy_schema(tmp_path: Path) -> Path:
+    dest = tmp_path / "schema-1.0.0.json"
+    shutil.copy(SCHEMA_JSON, dest)
+    return dest
+
+
+def test_snapshot_written_and_read(tmp_path: Path):
+    """Test that a snapshot is written on the first load and used on the next."""
+    path = copy_schema(tmp_path)
+    expected = from_file(str(path))
+
+    schema = from_file_snapshot(path)
+    assert schema == expected
+    assert snapshot_path(path).exists()
+
+    # The second load reads the snapshot rather than writing a new one.
+    mtime = snapshot_path(path).stat().st_mtime_ns
+    assert from_file_snapshot(path) == expected
+    assert snapshot_path(path).stat().st_mtime_ns == mtime
+
+
+def test_has_snapshot(tmp_path: Path):
+    """Test checking for an up to date snapshot without loading it."""
+    path = copy_schema(tmp_path)
+    assert not has_snapshot(path)
+
+    from_file_snapshot(path)
+    assert has_snapshot(path)
+
+    path.write_text('{"version": "9.9.9"}')
+    assert not has_snapshot(path)
+    assert not has_snapshot(tmp_path / "missing.json")
+
+
+def test_stale_snapshot(tmp_path: Path):
+    """Test that a snapshot is replaced when the JSON file changes."""
+    path = copy_schema(tmp_path)
+    from_file_snapshot(path)
+
+    path.write_text('{"version": "9.9.9"}')
+    schema = from_file_snapshot(path)
+    assert schema == OcsfSchema(version="9.9.9")
+    assert from_file_snapshot(path) == OcsfSchema(version="9.9.9")
+
+
+def test_corrupt_snapshot(tmp_path: Path):
+    """Test that a corrupt snapshot falls back to the JSON file."""
+    path = copy_schema(tmp_path)
+    from_file_snapshot(path)
+
+    snap = snapshot_path(path)
+    snap.write_bytes(snap.read_bytes()[:1000])
+
+    assert from_file_snapshot(path) == from_file(str(path))
+
+
+def test_client_snapshot(tmp_path: Path):
+    """Test that the client keeps snapshots next to cached schemas."""
+    path = copy_schema(tmp_path)
+    client = OcsfServerClient(cache_dir=tmp_path)
+
+    schema = client.get_schema("1.0.0")
+    assert schema.version == "1.0.0"
+    assert snapshot_path(path).exists()
+
+
+def test_client_snapshots_disabled(tmp_path: Path):
+    """Test that the client doesn't write snapshots when they're disabled."""
+    path = copy_schema(tmp_path)
+    client = OcsfServerClient(cache_dir=tmp_path, snapshots=False)
+
+    client.get_schema("1.0.0")
+    assert not snapshot_path(path).exists()
+
+
+def test_touched_file(tmp_path: Path):
+    """Test that a snapshot is kept when its file is touched without changing, and restamped."""
+    path = copy_schema(tmp_path)
+    expected = from_file_snapshot(path)
+
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    assert has_snapshot(path)
+    assert from_file_snapshot(path) == expected
+
+    # The new modification time was recorded, so the file isn't hashed again.
+    mtime = snapshot_path(path).stat().st_mtime_ns
+    assert from_file_snapshot(path) == expected
+    assert snapshot_path(path).stat().st_mtime_ns == mtime
+
+
+def test_shared_snapshot_dir(tmp_path: Path):
+    """Test that JSON files with the same name keep separate snapshots in a shared directory."""
+    before = tmp_path / "before" / "schema.json"
+    after = tmp_path / "after" / "schema.json"
+    for path, version in ((before, "1.0.0"), (after, "1.1.0")):
+        path.parent.mkdir()
+        path.write_text('{"version": "%s"}' % version)
+
+    snapshots = tmp_path / "snapshots"
+    snapshots.mkdir()
+    assert snapshot_path(before, snapshots) != snapshot_path(after, snapshots)
+    assert snapshot_path(before, before.parent) == snapshot_path(before)
+
+    assert from_file_snapshot(before, snapshots).version == "1.0.0"
+    assert from_file_snapshot(after, snapshots).version == "1.1.0"
+    assert has_snapshot(before, snapshots)
+    assert has_snapshot(after, snapshots)
@@ -0,0 +1,75 @@
+import io
+import json
+import os
+import pytest
+
+from ocsf_tools.schema import OcsfEnumMember, from_json, from_stream
+
+LOCATION = os.path.dirname(os.path.abspath(__file__))
+CACHE = os.path.join(LOCATION, "../..", "schema_cache")
+VERSIONS = ["1.0.0", "1.1.0", "1.2.0"]
+
+SMALL_SCHEMA = {
+    "version": "1.0.0",
+    "classes": {
+        "café": {
+            "name": "café",
+            "caption": "Café ☕",
+            "uid": 1234567,
+            "attributes": {
+                "status": {
+                    "caption": "Status",
+                    "type": "int_t",
+                    "requirement": "required",
+                    "enum": {"1": {"caption": "Über"}},
+                    "@deprecated": {"message": "Gone", "since": "1.1.0"},
+                }
+            },
+        }
+    },
+    "objects": {},
+    "types": {"int_t": {"caption": "Integer", "max_len": 12}},
+}
+
+
+@pytest.mark.parametrize("version", VERSIONS)
+def test_stream_file(version: str):
+    """Test that streaming a schema file produces the same schema as from_json."""
+    path = os.path.join(CACHE, f"schema-{version}.json")
+    with open(path, "rb") as f:
+        schema = from_stream(f)
+
+    with open(path, "r") as f:
+        assert schema == from_json(f.read())
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 7, 64])
+def test_stream_small_chunks(chunk_size: int):
+    """Test that values and multi-byte characters split across chunks are decoded correctly."""
+    data = json.dumps(SMALL_SCHEMA, ensure_ascii=False, indent=2)
+    schema = from_stream(io.BytesIO(data.encode("utf-8")), chunk_size=chunk_size)
+
+    assert schema == from_json(data)
+    assert schema.classes["café"].uid == 1234567
+    assert schema.classes["café"].attributes["status"].enum == {"1": OcsfEnumMember(caption="Über")}
+    assert schema.classes["café"].attributes["status"].deprecated is not None
+    assert schema.types["int_t"].max_len == 12
+
+
+def test_stream_text():
+    """Test streaming from a text stream."""
+    data = json.dumps(SMALL_SCHEMA)
+    assert from_stream(io.StringIO(data), chunk_size=5) == from_json(data)
+
+
+def test_stream_truncated():
+    """Test that a truncated stream raises a JSONDecodeError."""
+    data = json.dumps(SMALL_SCHEMA).encode("utf-8")
+    with pytest.raises(json.JSONDecodeError):
+        from_stream(io.BytesIO(data[: len(data) // 2]), chunk_size=16)
+
+
+def test_stream_extra_data():
+    """Test that data after the schema raises a JSONDecodeError."""
+    with pytest.raises(json.JSONDecodeError):
+        from_stream(io.BytesIO(b'{"version": "1.0.0"} {}'))
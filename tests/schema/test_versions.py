@@ -0,0 +1,89 @@
+from pathlib import Path
+from typing import Any
+from urllib.error import URLError
+
+import pytest
+
+from ocsf_tools.schema import OcsfServerClient, resolve_version
+
+VERSIONS = ["1.0.0", "1.1.0", "1.2.0", "1.3.0-dev", "2.0.0-rc.1"]
+
+# Nothing listens on port 1, so requests to it fail like requests while offline.
+OFFLINE = "http://127.0.0.1:1/"
+
+
+def test_resolve_version():
+    """Test resolving version specifications."""
+    assert resolve_version("1.1.0", VERSIONS) == "1.1.0"
+    assert resolve_version("1.3.0-dev", VERSIONS) == "1.3.0-dev"
+    assert resolve_version("latest", VERSIONS) == "1.2.0"
+    assert resolve_version("1", VERSIONS) == "1.2.0"
+    assert resolve_version("1.x", VERSIONS) == "1.2.0"
+    assert resolve_version("1.1", VERSIONS) == "1.1.0"
+    assert resolve_version("1.0.x", VERSIONS) == "1.0.0"
+    assert resolve_version("1.10.x", ["1.2.0", "1.10.0", "1.9.0"]) == "1.10.0"
+
+
+def test_resolve_version_invalid():
+    """Test that invalid or unmatched specifications raise a ValueError."""
+    with pytest.raises(ValueError, match="Invalid version"):
+        resolve_version("newest", VERSIONS)
+
+    with pytest.raises(ValueError, match="not found"):
+        resolve_version("1.4.0", VERSIONS)
+
+    with pytest.raises(ValueError, match="No version matching"):
+        resolve_version("2.x", VERSIONS)
+
+
+def test_versions_cached(ocsf_server: Any, tmp_path: Path):
+    """Test that a new client reads the versions from the cache."""
+    versions = OcsfServerClient(ocsf_server.url, tmp_path).get_versions()
+    assert (tmp_path / "versions.json").exists()
+    assert ocsf_server.requests == ["/api/versions"]
+
+    client = OcsfServerClient(ocsf_server.url, tmp_path)
+    assert client.get_versions() == versions
+    assert client.get_default_version() == "1.2.0"
+    assert client.resolve_version("1.x") == "1.2.0"
+    assert ocsf_server.requests == ["/api/versions"]
+
+
+def test_versions_revalidated(ocsf_server: Any, tmp_path: Path):
+    """Test that stale cached versions are revalidated with a conditional request."""
+    versions = OcsfServerClient(ocsf_server.url, tmp_path).get_versions()
+    ocsf_server.statuses.clear()
+
+    assert OcsfServerClient(ocsf_server.url, tmp_path, ttl=0).get_versions() == versions
+    assert ocsf_server.statuses == [304]
+
+
+def test_offline(ocsf_server: Any, tmp_path: Path):
+    """Test that cached versions and schemas are used when the server can't be reached."""
+    online = OcsfServerClient(ocsf_server.url, tmp_path)
+    online.get_schema("1.x")
+    online.get_schema()
+
+    offline = OcsfServerClient(OFFLINE, tmp_path, ttl=0)
+    assert offline.get_versions() == online.get_versions()
+    assert offline.get_schema("1.x").version == "1.2.0"
+    assert offline.get_schema("latest").version == "1.2.0"
+    assert offline.get_schema().version == "1.2.0"
+
+    with pytest.raises(URLError):
+        offline.get_schema("1.0.0")
+
+
+def test_offline_without_stale(ocsf_server: Any, tmp_path: Path):
+    """Test that stale cached versions aren't used if stale_if_error is False."""
+    OcsfServerClient(ocsf_server.url, tmp_path).get_versions()
+
+    with pytest.raises(URLError):
+        OcsfServerClient(OFFLINE, tmp_path, ttl=0, stale_if_error=False).get_versions()
+
+
+def test_invalid_spec_without_request(ocsf_server: Any):
+    """Test that an invalid version is rejected before fetching the versions."""
+    with pytest.raises(ValueError, match="Invalid version"):
+        OcsfServerClient(ocsf_server.url).get_schema("newest")
+    assert ocsf_server.requests == []